@@ -64,8 +64,10 @@ const StructuredArticleViewer: React.FC<StructuredArticleViewerProps> = ({
     setError(null);
 
     try {
+      // Sections are rendered as they stream in; the analyses fill in once
+      // the whole article is available.
       const [articleData, citationsData, referencesData] = await Promise.all([
-        structuredWikiService.getStructuredArticle({ query, lang }),
+        structuredWikiService.streamStructuredArticle({ query, lang }, setArticle),
         structuredWikiService.getCitationAnalysis({ query, lang }),
         structuredWikiService.getReferenceAnalysis({ query, lang })
       ]);
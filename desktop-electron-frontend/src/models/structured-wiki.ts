@@ -30,6 +30,19 @@ export interface StructuredArticleResponse {
   total_references: number;
 }
 
+// One line of the NDJSON /structured-article/stream response
+export type StructuredArticleStreamEvent =
+  | { event: 'article'; title: string; lang: string; source: string }
+  | { event: 'section'; index: number; section: Section }
+  | { event: 'references'; references: Reference[] }
+  | {
+      event: 'done';
+      total_sections: number;
+      total_citations: number;
+      total_references: number;
+    }
+  | { event: 'error'; detail: string };
+
 export interface StructuredSectionResponse {
   title: string;
   raw_content: string;
@@ -113,6 +126,8 @@ export interface SectionCompareResponse {
   section_diffs: SectionDiff[];
 }
 
+export type AlignmentStrategy = 'greedy' | 'optimal' | 'monotonic';
+
 export interface SectionCompareRequest {
   source_query: string;
   target_query: string;
@@ -120,6 +135,7 @@ export interface SectionCompareRequest {
   target_lang?: string;
   similarity_threshold?: number;
   model_name?: string;
+  alignment?: AlignmentStrategy;
 }
 
 export interface Revision {
@@ -216,4 +232,5 @@ export interface ParagraphDiffRequest {
   target_lang?: string;
   similarity_threshold?: number;
   model_name?: string;
+  alignment?: AlignmentStrategy;
 }
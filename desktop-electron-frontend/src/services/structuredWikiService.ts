@@ -1,5 +1,6 @@
 import {
   StructuredArticleResponse,
+  StructuredArticleStreamEvent,
   StructuredSectionResponse,
   StructuredCitationResponse,
   StructuredReferenceResponse,
@@ -56,6 +57,111 @@ class StructuredWikiService {
     return this.fetchWithErrorHandling<StructuredArticleResponse>(url);
   }
 
+  /**
+   * Stream a structured Wikipedia article. `onUpdate` receives the article
+   * built so far each time the backend finishes parsing a section, so the
+   * lead section can be shown before a long article is fully parsed.
+   * Resolves with the complete article.
+   */
+  async streamStructuredArticle(
+    request: StructuredArticleRequest,
+    onUpdate: (partial: StructuredArticleResponse) => void
+  ): Promise<StructuredArticleResponse> {
+    const params = new URLSearchParams();
+    params.append('query', request.query);
+    if (request.lang) {
+      params.append('lang', request.lang);
+    }
+
+    const url = `${API_BASE_URL}/symmetry/v1/wiki/structured-article/stream?${params.toString()}`;
+    const response = await fetch(url);
+    if (!response.ok || !response.body) {
+      throw new Error(`HTTP error! status: ${response.status}`);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let article: StructuredArticleResponse | null = null;
+    let finished = false;
+
+    const handleLine = (line: string) => {
+      if (!line.trim()) return;
+      const event = JSON.parse(line) as StructuredArticleStreamEvent;
+      article = this.applyStreamEvent(article, event);
+      if (event.event === 'section' && article) {
+        onUpdate(article);
+      }
+      finished = event.event === 'done';
+    };
+
+    for (;;) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+      const lines = buffer.split('\n');
+      buffer = lines.pop() ?? '';
+      lines.forEach(handleLine);
+    }
+    handleLine(buffer + decoder.decode());
+
+    const result = article as StructuredArticleResponse | null;
+    if (!finished || !result) {
+      throw new Error('Article stream ended before the article was complete');
+    }
+    return result;
+  }
+
+  /**
+   * Fold one stream event into the article built so far
+   */
+  private applyStreamEvent(
+    article: StructuredArticleResponse | null,
+    event: StructuredArticleStreamEvent
+  ): StructuredArticleResponse {
+    if (event.event === 'error') {
+      throw new Error(event.detail);
+    }
+    if (event.event === 'article') {
+      return {
+        title: event.title,
+        lang: event.lang,
+        source: event.source,
+        sections: [],
+        references: [],
+        total_sections: 0,
+        total_citations: 0,
+        total_references: 0,
+      };
+    }
+    if (!article) {
+      throw new Error(`Unexpected '${event.event}' event before article metadata`);
+    }
+
+    switch (event.event) {
+      case 'section':
+        return {
+          ...article,
+          sections: [...article.sections, event.section],
+          total_sections: article.total_sections + 1,
+          total_citations: article.total_citations + (event.section.citations?.length ?? 0),
+        };
+      case 'references':
+        return {
+          ...article,
+          references: event.references,
+          total_references: event.references.length,
+        };
+      default:
+        return {
+          ...article,
+          total_sections: event.total_sections,
+          total_citations: event.total_citations,
+          total_references: event.total_references,
+        };
+    }
+  }
+
   /**
    * Get a translated version of a structured article
    */
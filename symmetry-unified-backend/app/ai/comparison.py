@@ -1,54 +1,52 @@
 """Semantic comparison engine using sentence-transformers."""
 
+import functools
 import logging
 import os
 import sys
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
-import spacy
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
+import numpy as np
 
+from app.ai.embeddings import cosine_similarity, encode
+from app.ai.model_backends import get_sentence_transformer
 from app.models.comparison.registry import DEFAULT_MODEL
 from app.core.settings import SIMILARITY_THRESHOLD as _DEFAULT_SIMILARITY_THRESHOLD
 from app.services.chunking import chunk_text
+from app.services.spacy_pipelines import split_sentences
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
 
 logger = logging.getLogger(__name__)
 
-# Module-level model cache
-_model_cache: dict = {}
 
-# Optional similarity_prototype pipeline
-try:
-    _sp_path = os.path.abspath(
-        os.path.join(
-            os.path.dirname(__file__), "..", "services", "similarity_prototype"
-        )
-    )
-    if os.path.isdir(_sp_path) and _sp_path not in sys.path:
-        sys.path.insert(0, _sp_path)
-    from app.services.similarity_prototype.article_comparator import (
-        ArticleComparator as _ArticleComparator,
-    )
-except Exception:
-    _ArticleComparator = None  # type: ignore[assignment,misc]
+# Optional similarity_prototype pipeline.  Its modules import each other as
+# top-level packages (``Phase_1``...), so its directory goes on sys.path.
+_sp_path = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "services", "similarity_prototype")
+)
+if os.path.isdir(_sp_path) and _sp_path not in sys.path:
+    sys.path.insert(0, _sp_path)
 
-_SPACY_MODEL_MAP = {
-    "en": "en_core_web_sm",
-    "de": "de_core_news_sm",
-    "fr": "fr_core_news_sm",
-    "es": "es_core_news_sm",
-    "it": "it_core_news_sm",
-    "pt": "pt_core_news_sm",
-    "nl": "nl_core_news_sm",
-}
 
+@functools.lru_cache(maxsize=None)
+def prototype_comparator_class() -> Optional[type]:
+    """The prototype's ``ArticleComparator``, or None if it cannot be imported.
+
+    Imported on first use: the prototype pulls in NLTK and spaCy.
+    """
+    try:
+        from app.services.similarity_prototype.article_comparator import (
+            ArticleComparator,
+        )
+    except Exception:
+        return None
+    return ArticleComparator
 
-def _get_model(model_name: str) -> SentenceTransformer:
-    if model_name not in _model_cache:
-        logger.info("Loading sentence-transformer model: %s", model_name)
-        _model_cache[model_name] = SentenceTransformer(model_name)
-    return _model_cache[model_name]
+
+def _get_model(model_name: str) -> "SentenceTransformer":
+    return get_sentence_transformer(model_name)
 
 
 def universal_sentences_split(text: str) -> List[str]:
@@ -69,17 +67,14 @@ def preprocess_input(article: str, language: str) -> List[str]:
         out = chunk_text(cleaned, chunk_size=450, overlap=60)
         return [x for x in out if isinstance(x, str) and x.strip()]
 
-    if language in _SPACY_MODEL_MAP:
-        try:
-            nlp = spacy.load(_SPACY_MODEL_MAP[language])
-            doc = nlp(cleaned)
-            sentences = [s.text.strip() for s in doc.sents if s.text.strip()]
-            if sentences:
-                return sentences
-        except Exception as exc:
-            logger.warning(
-                "spaCy model unavailable for %s: %s — falling back", language, exc
-            )
+    try:
+        sentences = split_sentences(cleaned, language)
+        if sentences:
+            return sentences
+    except Exception as exc:
+        logger.warning(
+            "spaCy sentence splitting failed for %s: %s — falling back", language, exc
+        )
 
     return [s for s in universal_sentences_split(cleaned) if s]
 
@@ -148,8 +143,8 @@ def semantic_compare(
         sim_threshold = _DEFAULT_SIMILARITY_THRESHOLD
 
     try:
-        original_embeddings = model.encode(original_sentences)
-        translated_embeddings = model.encode(translated_sentences)
+        original_embeddings = encode(model, original_sentences)
+        translated_embeddings = encode(model, translated_sentences)
         missing_info, missing_info_indices = sentences_diff(
             original_sentences,
             original_embeddings,
@@ -180,6 +175,49 @@ def semantic_compare(
     }
 
 
+def _top_matches(
+    scores: np.ndarray, left: List[str], right: List[str], k: int
+) -> List[dict]:
+    """
+    The *k* highest-scoring sentence pairs, best first.
+
+    ``argpartition`` finds the k-th best score without sorting the whole
+    matrix; only the candidates at or above it are sorted.  Ties keep
+    row-major order, as a stable sort over every pair would.
+    """
+    flat = scores.ravel()
+    if k <= 0 or flat.size == 0:
+        return []
+    if k < flat.size:
+        kth = flat[np.argpartition(-flat, k - 1)[k - 1]]
+        candidates = np.flatnonzero(flat >= kth)
+    else:
+        candidates = np.arange(flat.size)
+    best = candidates[np.argsort(-flat[candidates], kind="stable")[:k]]
+
+    n_right = scores.shape[1]
+    return [
+        {
+            "score": float(flat[idx]),
+            "sentence_a": left[idx // n_right],
+            "sentence_b": right[idx % n_right],
+        }
+        for idx in best.tolist()
+    ]
+
+
+def _best_matches(
+    sim: np.ndarray, sentences: List[str], candidates: List[str]
+) -> List[dict]:
+    """Best candidate for each row of *sim* (first one on ties), score to 4 places."""
+    best_idx = sim.argmax(axis=1).tolist()
+    best_score = np.round(sim.max(axis=1), 4).tolist()
+    return [
+        {"sentence": s, "best_match": candidates[j], "score": score}
+        for s, j, score in zip(sentences, best_idx, best_score)
+    ]
+
+
 def perform_semantic_comparison(request_data: dict) -> dict:
     source_article = request_data["original_article_content"]
     target_article = request_data["translated_article_content"]
@@ -190,7 +228,10 @@ def perform_semantic_comparison(request_data: dict) -> dict:
     )
     model_name = request_data.get("model_name", DEFAULT_MODEL)
 
-    if model_name == "similarity_prototype" and _ArticleComparator is not None:
+    if (
+        model_name == "similarity_prototype"
+        and prototype_comparator_class() is not None
+    ):
         return _run_prototype_comparison(
             source_article,
             target_article,
@@ -207,42 +248,17 @@ def perform_semantic_comparison(request_data: dict) -> dict:
 
     try:
         model = _get_model(model_name)
-        left_emb = model.encode(left)
-        right_emb = model.encode(right)
-        sim_matrix = cosine_similarity(left_emb, right_emb)
+        left_emb = encode(model, left)
+        right_emb = encode(model, right)
+        sim_matrix = cosine_similarity(left_emb, right_emb).astype(np.float64)
 
-        _, missing_idx = sentences_diff(left, left_emb, right_emb, sim_threshold)
-        _, extra_idx = sentences_diff(right, right_emb, left_emb, sim_threshold)
+        missing_idx = np.flatnonzero(sim_matrix.max(axis=1) < sim_threshold).tolist()
+        extra_idx = np.flatnonzero(sim_matrix.max(axis=0) < sim_threshold).tolist()
 
-        pairs = sorted(
-            [
-                {
-                    "score": float(round(float(sim_matrix[i][j]), 4)),
-                    "sentence_a": left[i],
-                    "sentence_b": right[j],
-                }
-                for i in range(len(left))
-                for j in range(len(right))
-            ],
-            key=lambda x: x["score"],
-            reverse=True,
-        )
-        best_ab = [
-            {
-                "sentence": s,
-                "best_match": right[int(sim_matrix[i].argmax())],
-                "score": float(round(float(sim_matrix[i].max()), 4)),
-            }
-            for i, s in enumerate(left)
-        ]
-        best_ba = [
-            {
-                "sentence": s,
-                "best_match": left[int(sim_matrix[:, j].argmax())],
-                "score": float(round(float(sim_matrix[:, j].max()), 4)),
-            }
-            for j, s in enumerate(right)
-        ]
+        # Top pairs are reported to 4 decimals and ranked on the rounded value.
+        pairs = _top_matches(np.round(sim_matrix, 4), left, right, 50)
+        best_ab = _best_matches(sim_matrix, left, right)
+        best_ba = _best_matches(sim_matrix.T, right, left)
         avg_ab = sum(b["score"] for b in best_ab) / len(best_ab) if best_ab else 0.0
         avg_ba = sum(b["score"] for b in best_ba) / len(best_ba) if best_ba else 0.0
 
@@ -256,7 +272,7 @@ def perform_semantic_comparison(request_data: dict) -> dict:
                     "success": True,
                     "score": round((avg_ab + avg_ba) / 2, 4),
                     "details": {
-                        "top_matches": pairs[:50],
+                        "top_matches": pairs,
                         "best_matches_ab": best_ab,
                         "best_matches_ba": best_ba,
                     },
@@ -283,7 +299,7 @@ def _run_prototype_comparison(
         if target_language != "en":
             target_article = translate(target_article, target_language, "en")
 
-        comparator = _ArticleComparator()
+        comparator = prototype_comparator_class()()
         left_raw = preprocess_input(source_article, "en") or []
         right_raw = preprocess_input(target_article, "en") or []
         left = [
@@ -306,31 +322,10 @@ def _run_prototype_comparison(
         avg_ab = sum(ab_scores) / len(ab_scores) if ab_scores else 0.0
         avg_ba = sum(ba_scores) / len(ba_scores) if ba_scores else 0.0
 
-        pairs = sorted(
-            [
-                {"score": matrix[i][j], "sentence_a": left[i], "sentence_b": right[j]}
-                for i in range(len(left))
-                for j in range(len(right))
-            ],
-            key=lambda x: x["score"],
-            reverse=True,
-        )
-        best_ab = []
-        for i, s in enumerate(left):
-            best_j = max(range(len(right)), key=lambda j: matrix[i][j])
-            best_ab.append({
-                "sentence": s,
-                "best_match": right[best_j],
-                "score": matrix[i][best_j],
-            })
-        best_ba = [
-            {
-                "sentence": s,
-                "best_match": left[max(range(len(left)), key=lambda i: matrix[i][j])],
-                "score": matrix[max(range(len(left)), key=lambda i: matrix[i][j])][j],
-            }
-            for j, s in enumerate(right)
-        ]
+        scores = np.asarray(matrix, dtype=np.float64)
+        pairs = _top_matches(scores, left, right, 20)
+        best_ab = _best_matches(scores, left, right)
+        best_ba = _best_matches(scores.T, right, left)
 
         return {
             "comparisons": [
@@ -346,7 +341,7 @@ def _run_prototype_comparison(
                     "success": True,
                     "score": round((avg_ab + avg_ba) / 2, 4),
                     "details": {
-                        "top_matches": pairs[:20],
+                        "top_matches": pairs,
                         "best_matches_ab": best_ab,
                         "best_matches_ba": best_ba,
                     },
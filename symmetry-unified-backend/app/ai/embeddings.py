@@ -0,0 +1,138 @@
+"""Shared entry point for sentence-embedding inference.
+
+Every comparison path encodes through ``encode`` instead of calling
+``model.encode`` directly, so identical concurrent jobs (two requests
+comparing the same article) run the model once and share the result,
+sentences embedded before are read from the persistent embedding cache, and
+the sentences that remain are micro-batched with those of other concurrent
+requests into one ``model.encode`` call.
+"""
+
+import logging
+import sqlite3
+import threading
+import weakref
+from typing import Dict, Hashable, List, Sequence
+
+import numpy as np
+
+from app.core.settings import (
+    EMBEDDING_BATCH_MAX_SENTENCES,
+    EMBEDDING_BATCH_MAX_WAIT_MS,
+    EMBEDDING_BATCHING_ENABLED,
+    EMBEDDING_CACHE_ENABLED,
+)
+from app.services.embedding_store import get_embedding_store, text_key
+from app.services.micro_batching import MicroBatcher
+from app.services.single_flight import ThreadSingleFlight, content_key
+
+logger = logging.getLogger(__name__)
+
+_encode_flights = ThreadSingleFlight("embeddings")
+
+# Loaded model -> name its vectors are cached under.  Models that were never
+# registered (ad-hoc instances, test doubles) bypass the persistent cache and
+# the micro-batcher.
+_model_names: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+# encode() options that do not change the returned vectors.
+_CACHE_SAFE_KWARGS = frozenset({"show_progress_bar", "batch_size"})
+
+# Loaded model -> {encode options -> batcher}.  Jobs are only merged when
+# they pass the same options to the same model.
+_batchers: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_batchers_lock = threading.Lock()
+
+
+def register_model(model, name: str) -> None:
+    """Cache *model*'s embeddings under *name* (its hub id or local path)."""
+    _model_names[model] = name
+
+
+def encode(model, texts: Sequence[str], **kwargs):
+    """``model.encode(texts, **kwargs)``, coalesced by model and content hash."""
+    key = (id(model), content_key(list(texts), sorted(kwargs.items())))
+    return _encode_flights.do(key, lambda: _encode_cached(model, texts, kwargs))
+
+
+def cosine_similarity(left, right) -> np.ndarray:
+    """Pairwise cosine similarity of two embedding matrices.
+
+    scikit-learn is imported on first use to keep it out of application
+    start-up.
+    """
+    from sklearn.metrics.pairwise import cosine_similarity as _cosine_similarity
+
+    return _cosine_similarity(left, right)
+
+
+def _batcher(model, kwargs: dict) -> MicroBatcher:
+    options: Hashable = tuple(sorted(kwargs.items()))
+    with _batchers_lock:
+        per_model = _batchers.setdefault(model, {})
+        batcher = per_model.get(options)
+        if batcher is None:
+            # Hold the model weakly so the batcher does not keep it alive.
+            model_ref = weakref.ref(model)
+            batcher = MicroBatcher(
+                f"embeddings-{_model_names[model]}",
+                lambda texts: np.asarray(model_ref().encode(texts, **kwargs)),
+                max_items=EMBEDDING_BATCH_MAX_SENTENCES,
+                max_wait=EMBEDDING_BATCH_MAX_WAIT_MS / 1000,
+            )
+            per_model[options] = batcher
+    return batcher
+
+
+def _run_model(model, texts: Sequence[str], kwargs: dict):
+    """``model.encode``, merged with concurrent calls when batching is on."""
+    if (
+        not EMBEDDING_BATCHING_ENABLED
+        or model not in _model_names
+        or not texts
+        or not _CACHE_SAFE_KWARGS.issuperset(kwargs)
+    ):
+        return model.encode(texts, **kwargs)
+    return _batcher(model, kwargs)(list(texts))
+
+
+def _encode_cached(model, texts: Sequence[str], kwargs: dict):
+    name = _model_names.get(model)
+    if (
+        not EMBEDDING_CACHE_ENABLED
+        or name is None
+        or not texts
+        or not _CACHE_SAFE_KWARGS.issuperset(kwargs)
+    ):
+        return _run_model(model, texts, kwargs)
+
+    keys = [text_key(t) for t in texts]
+    store = get_embedding_store()
+    try:
+        vectors: Dict[str, np.ndarray] = store.get_many(name, keys)
+    except sqlite3.Error as e:
+        logger.warning("Embedding cache unavailable (%s); bypassing", e)
+        return _run_model(model, texts, kwargs)
+
+    missing: Dict[str, str] = {}
+    for key, text in zip(keys, texts):
+        if key not in vectors and key not in missing:
+            missing[key] = text
+
+    if missing:
+        missing_texts: List[str] = list(missing.values())
+        encoded = np.asarray(_run_model(model, missing_texts, kwargs), dtype=np.float32)
+        fresh = list(zip(missing, encoded))
+        vectors.update(fresh)
+        try:
+            store.put_many(name, fresh)
+        except sqlite3.Error as e:
+            logger.warning("Could not write embedding cache: %s", e)
+
+    logger.debug(
+        "Embedding cache for %s: %d hits, %d encoded",
+        name,
+        len(keys) - len(missing),
+        len(missing),
+    )
+    return np.stack([vectors[key] for key in keys])
@@ -0,0 +1,160 @@
+"""Inference backends for the sentence-transformer comparison models.
+
+``torch`` runs the model as published.  On CPU-only nodes the ONNX backends
+are considerably faster: ``onnx`` serves an ONNX export of the model through
+ONNX Runtime, ``onnx-int8`` an export whose weights were dynamically
+quantized to int8 for the instruction set in ``ONNX_QUANTIZATION_CONFIG``.
+
+Exports are written once per node under ``ONNX_MODEL_CACHE_DIR``, one
+directory per model and variant, and loaded from there afterwards.  A model
+is exported into a staging directory that is renamed into place when
+complete, so concurrent workers never load a half-written export.
+
+Quantized vectors differ slightly from the fp32 ones, so every backend
+caches its embeddings under its own name.
+
+``get_sentence_transformer`` is the cached entry point: every comparison path
+shares one instance per model through the process-wide model manager.
+"""
+
+import functools
+import logging
+import shutil
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from app.ai.embeddings import register_model
+from app.core.settings import (
+    COMPARISON_MODEL_BACKEND,
+    COMPARISON_MODEL_BACKENDS,
+    ONNX_INTRA_OP_THREADS,
+    ONNX_MODEL_CACHE_DIR,
+    ONNX_QUANTIZATION_CONFIG,
+)
+from app.services.model_manager import configure_torch_threads, model_family
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+logger = logging.getLogger(__name__)
+
+_ONNX_FILE = "onnx/model.onnx"
+
+_models = model_family("sentence-transformers")
+
+
+def _sentence_transformers():
+    """The ``sentence_transformers`` package, imported on first use.
+
+    It imports torch and transformers, which take seconds; nothing outside a
+    model load needs them.
+    """
+    import sentence_transformers
+
+    return sentence_transformers
+
+
+@functools.lru_cache(maxsize=None)
+def _onnx_available() -> bool:
+    try:
+        import onnxruntime  # noqa: F401
+        import optimum.onnxruntime  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_sentence_transformer(model_name: str) -> "SentenceTransformer":
+    """The shared instance of *model_name*, loaded on first use."""
+    return _models.get(model_name, lambda: load_sentence_transformer(model_name))
+
+
+def load_sentence_transformer(
+    model_name: str, backend: Optional[str] = None
+) -> "SentenceTransformer":
+    """Load *model_name* on *backend* and register it with the embedding cache.
+
+    ``backend`` defaults to ``COMPARISON_MODEL_BACKEND``.  The ONNX backends
+    fall back to ``torch`` when onnxruntime or optimum is not installed.
+    """
+    backend = backend or COMPARISON_MODEL_BACKEND
+    if backend not in COMPARISON_MODEL_BACKENDS:
+        raise ValueError(
+            f"Unknown model backend {backend!r}; "
+            f"expected one of {', '.join(COMPARISON_MODEL_BACKENDS)}"
+        )
+    if backend != "torch" and not _onnx_available():
+        logger.warning(
+            "onnxruntime/optimum not installed; %s runs on torch instead of %s",
+            model_name,
+            backend,
+        )
+        backend = "torch"
+
+    st = _sentence_transformers()
+    if backend == "torch":
+        configure_torch_threads()
+        model = st.SentenceTransformer(model_name)
+        register_model(model, model_name)
+        return model
+
+    variant = _variant(backend)
+    path, file_name = _exported_model(model_name, variant)
+    logger.info("Loading %s from %s (%s)", model_name, path, variant)
+    model = st.SentenceTransformer(
+        str(path),
+        backend="onnx",
+        model_kwargs={**_session_kwargs(), "file_name": file_name},
+    )
+    register_model(model, f"{model_name}@{variant}")
+    return model
+
+
+def _variant(backend: str) -> str:
+    if backend == "onnx-int8":
+        return f"onnx-int8_{ONNX_QUANTIZATION_CONFIG}"
+    return "onnx"
+
+
+def _session_kwargs() -> dict:
+    import onnxruntime
+
+    options = onnxruntime.SessionOptions()
+    options.intra_op_num_threads = ONNX_INTRA_OP_THREADS
+    return {"provider": "CPUExecutionProvider", "session_options": options}
+
+
+def _exported_model(model_name: str, variant: str) -> Tuple[Path, str]:
+    """Directory and ONNX file name of *model_name*'s export, creating it once."""
+    quantized = variant != "onnx"
+    suffix = f"int8_{ONNX_QUANTIZATION_CONFIG}"
+    file_name = f"onnx/model_{suffix}.onnx" if quantized else _ONNX_FILE
+    target = Path(ONNX_MODEL_CACHE_DIR) / f"{model_name.replace('/', '--')}--{variant}"
+    if (target / file_name).is_file():
+        return target, file_name
+
+    logger.info("Exporting %s to ONNX (%s) in %s", model_name, variant, target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f"{target.name}.", dir=target.parent))
+    st = _sentence_transformers()
+    try:
+        model = st.SentenceTransformer(
+            model_name, backend="onnx", model_kwargs=_session_kwargs()
+        )
+        model.save(str(staging))
+        if quantized:
+            st.export_dynamic_quantized_onnx_model(
+                model, ONNX_QUANTIZATION_CONFIG, str(staging), file_suffix=suffix
+            )
+            # Only the quantized graph is served; drop the fp32 copy.
+            (staging / _ONNX_FILE).unlink(missing_ok=True)
+        try:
+            staging.rename(target)
+        except OSError:
+            # Another worker finished the same export first.
+            if not (target / file_name).is_file():
+                raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return target, file_name
@@ -1,18 +1,69 @@
-"""MarianMT translation engine with chunking and LRU model cache."""
+"""MarianMT translation with chunking and a shared model cache.
 
-import logging
-from functools import lru_cache
+``translate`` translates one text.  ``translate_many`` plans the translation
+of many texts at once (every field of an article): identical texts and
+sentences are translated once, and the sentences of all texts are batched by
+token length so a batch pads little.
+
+Texts are split into paragraphs and sentences, and each sentence is
+translated on its own.  A sentence longer than ``TRANSLATION_MAX_SEGMENT_TOKENS``
+is cut into word runs up to that budget, so no input is truncated by the
+model.  Batches are formed from segments of similar length, up to
+``TRANSLATION_BATCH_MAX_TOKENS`` padded tokens each.
+
+Models run on the backend chosen in ai/translation_backends.py, decoded
+with their language pair's settings.  Translated sentences are kept in the
+persistent translation memory (services/translation_memory.py), per model,
+backend and decoding, and looked up before any generation: a sentence that
+recurs in any text, such as a section title or a boilerplate sentence inside
+an otherwise new paragraph, is generated once.
 
-from transformers import MarianMTModel, MarianTokenizer
+Models only run on the translation workers: one ``MicroBatcher`` thread per
+language pair merges the texts of concurrent callers into one plan, and at
+most ``TRANSLATION_MAX_CONCURRENT_BATCHES`` plans generate at a time across
+all pairs, so concurrent requests queue instead of oversubscribing the cores
+with competing ``generate`` calls.
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+from typing import Callable, Dict, List, Sequence, Tuple
 
+from app.ai.translation_backends import (
+    Decoding,
+    TranslationEngine,
+    load_translation_engine,
+    translation_decoding,
+    translation_variant,
+)
+from app.core.settings import (
+    TRANSLATION_BATCH_MAX_TOKENS,
+    TRANSLATION_BATCH_MAX_WAIT_MS,
+    TRANSLATION_MAX_CONCURRENT_BATCHES,
+    TRANSLATION_MAX_SEGMENT_TOKENS,
+    TRANSLATION_MEMORY_ENABLED,
+)
 from app.models.translation.registry import get_translation_model_name, ROMANCE_LANGS
-from app.services.chunking import chunk_text
+from app.services.chunking import length_buckets, pack_sentences
+from app.services.micro_batching import MicroBatcher
+from app.services.model_manager import model_family
+from app.services.single_flight import ThreadSingleFlight, content_key
+from app.services.spacy_pipelines import split_sentences
+from app.services.translation_memory import get_translation_memory, segment_key
 
 logger = logging.getLogger(__name__)
 
-TRANSLATION_CHUNK_CHAR_THRESHOLD = 1500
-TRANSLATION_CHUNK_WORD_SIZE = 300
-TRANSLATION_BATCH_SIZE = 4
+TRANSLATION_MODEL_CACHE_SIZE = 4
+
+_translate_flights = ThreadSingleFlight("translation")
+_models = model_family("translation", max_entries=TRANSLATION_MODEL_CACHE_SIZE)
+
+# (source, target) -> the pair's translation worker.
+_workers: Dict[Tuple[str, str], MicroBatcher] = {}
+_workers_lock = threading.Lock()
+_generate_slots = threading.BoundedSemaphore(max(1, TRANSLATION_MAX_CONCURRENT_BATCHES))
 
 _LANG_ALIASES = {
     "english": "en",
@@ -40,21 +91,9 @@ def _normalize_lang_code(lang: str) -> str:
     return normalized
 
 
-@lru_cache(maxsize=4)
-def load_translation_components(model_name: str):
-    tokenizer = MarianTokenizer.from_pretrained(model_name)
-    model = MarianMTModel.from_pretrained(model_name)
-    return tokenizer, model
-
-
-def _translate_batch_with_model(batch: list, tokenizer, model) -> list:
-    inputs = tokenizer(batch, return_tensors="pt", padding=True, truncation=True)
-    translated = model.generate(**inputs)
-    return [tokenizer.decode(t, skip_special_tokens=True) for t in translated]
-
-
-def _translate_with_model(text: str, tokenizer, model) -> str:
-    return _translate_batch_with_model([text], tokenizer, model)[0]
+def get_translation_engine(model_name: str) -> TranslationEngine:
+    """The shared engine of *model_name*, loaded on first use."""
+    return _models.get(model_name, lambda: load_translation_engine(model_name))
 
 
 def _should_fallback_to_source_text(exc: Exception) -> bool:
@@ -69,47 +108,267 @@ def translate(text: str, source_lang: str, target_lang: str) -> str:
     if not text.strip() or source_lang == target_lang:
         return text
 
+    # Identical concurrent jobs (e.g. two comparisons of the same article)
+    # share one model run.
+    return _translate_flights.do(
+        content_key(source_lang, target_lang, text),
+        lambda: _run_on_worker([text], source_lang, target_lang)[0],
+    )
+
+
+def resolve_translation_model(source_lang: str, target_lang: str) -> str:
+    """MarianMT model for the pair; ValueError if no model covers it."""
+    source_lang = _normalize_lang_code(source_lang)
+    target_lang = _normalize_lang_code(target_lang)
     model_name = get_translation_model_name(source_lang, target_lang)
-    if model_name is None:
-        if source_lang in ROMANCE_LANGS and target_lang == "en":
-            model_name = "Helsinki-NLP/opus-mt-ROMANCE-en"
-        elif source_lang == "en" and target_lang in ROMANCE_LANGS:
-            model_name = "Helsinki-NLP/opus-mt-en-ROMANCE"
-        else:
-            raise ValueError(
-                f"Unsupported translation pair: {source_lang} -> {target_lang}"
+    if model_name is not None:
+        return model_name
+    if source_lang in ROMANCE_LANGS and target_lang == "en":
+        return "Helsinki-NLP/opus-mt-ROMANCE-en"
+    if source_lang == "en" and target_lang in ROMANCE_LANGS:
+        return "Helsinki-NLP/opus-mt-en-ROMANCE"
+    raise ValueError(f"Unsupported translation pair: {source_lang} -> {target_lang}")
+
+
+def warm_up_translation(source_lang: str, target_lang: str) -> str:
+    """Load the pair's model and translate one sentence; returns the model name.
+
+    Unlike ``translate`` this raises instead of falling back to the source
+    text, so a startup warm-up reports models that cannot be loaded.  It
+    bypasses the translation memory (a remembered sentence would skip the
+    load) but generates in one of the ``TRANSLATION_MAX_CONCURRENT_BATCHES``
+    slots like any plan.
+    """
+    model_name = resolve_translation_model(source_lang, target_lang)
+    engine = get_translation_engine(model_name)
+    with _generate_slots:
+        engine.translate_batch(
+            ["Warm-up sentence."], translation_decoding(source_lang, target_lang)
+        )
+    return model_name
+
+
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+# Sentence ends for languages without a spaCy tokenizer.
+_SENTENCE_END = re.compile(r"(?<=[.!?\u3002\uff01\uff1f])\s+")
+_OPENING_BRACKETS = "([{"
+
+# Sentences of a text, grouped by paragraph.
+_Plan = List[List[str]]
+
+
+def _token_counter(tokenizer) -> Callable[[List[str]], List[int]]:
+    """Source token counts of texts, each text tokenized once."""
+    counts: Dict[str, int] = {}
+
+    def count(texts: List[str]) -> List[int]:
+        missing = [text for text in dict.fromkeys(texts) if text not in counts]
+        if missing:
+            ids = tokenizer(missing, add_special_tokens=False)["input_ids"]
+            counts.update(zip(missing, map(len, ids)))
+        return [counts[text] for text in texts]
+
+    return count
+
+
+def _plan(text: str, language: str) -> _Plan:
+    """Sentences of *text*, per paragraph."""
+    plan: _Plan = []
+    for paragraph in _PARAGRAPH_BREAK.split(text):
+        paragraph = paragraph.strip()
+        if paragraph:
+            plan.append(_sentences(paragraph, language))
+    return plan
+
+
+def _sentences(paragraph: str, language: str) -> List[str]:
+    sentences = split_sentences(paragraph, language) or _SENTENCE_END.split(paragraph)
+    # The sentencizer keeps punctuation after a full stop in the sentence,
+    # including the opening bracket of a reference label ("early. [1]");
+    # give the bracket back to the sentence it opens.
+    result: List[str] = []
+    for sentence in sentences:
+        previous = result[-1] if result else ""
+        kept = previous.rstrip(_OPENING_BRACKETS)
+        if kept != previous and kept.strip():
+            result[-1] = kept.rstrip()
+            sentence = previous[len(kept) :] + sentence
+        result.append(sentence)
+    return result
+
+
+def _assemble(translated_plan: _Plan) -> str:
+    return "\n\n".join(" ".join(paragraph) for paragraph in translated_plan)
+
+
+def _handle_failure(exc: Exception, source_lang: str, target_lang: str) -> None:
+    """Log a failed translation; raise unless the source text is returned."""
+    logger.exception("Translation failed %s -> %s", source_lang, target_lang)
+    if _should_fallback_to_source_text(exc):
+        logger.warning(
+            "Falling back to source text for %s -> %s due to model availability issues",
+            source_lang,
+            target_lang,
+        )
+        return
+    raise RuntimeError(
+        f"Translation failed for language pair {source_lang} -> {target_lang}"
+    ) from exc
+
+
+def translate_many(
+    texts: Sequence[str], source_lang: str, target_lang: str
+) -> List[str]:
+    """Translate *texts* with one plan; returns the translations in order.
+
+    Blank texts are returned unchanged and identical texts are translated
+    once.  Same result per text as ``translate``, with fewer, fuller
+    ``generate`` calls.
+    """
+    source_lang = _normalize_lang_code(source_lang)
+    target_lang = _normalize_lang_code(target_lang)
+
+    unique = list(dict.fromkeys(text for text in texts if text.strip()))
+    if not unique or source_lang == target_lang:
+        return list(texts)
+
+    translated = _translate_flights.do(
+        content_key(source_lang, target_lang, unique),
+        lambda: _run_on_worker(unique, source_lang, target_lang),
+    )
+    by_text = dict(zip(unique, translated))
+    return [by_text.get(text, text) for text in texts]
+
+
+def _run_on_worker(texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+    """``_translate_texts`` on the pair's worker, merged with concurrent calls."""
+    # Unsupported pairs fail here rather than on a worker of their own.
+    resolve_translation_model(source_lang, target_lang)
+    return list(_worker(source_lang, target_lang)(texts))
+
+
+def _worker(source_lang: str, target_lang: str) -> MicroBatcher:
+    pair = (source_lang, target_lang)
+    with _workers_lock:
+        worker = _workers.get(pair)
+        if worker is None:
+            worker = MicroBatcher(
+                f"translation-{source_lang}-{target_lang}",
+                lambda texts: _run_plan(texts, source_lang, target_lang),
+                max_wait=TRANSLATION_BATCH_MAX_WAIT_MS / 1000,
             )
+            _workers[pair] = worker
+    return worker
+
+
+def _run_plan(texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+    # Merged jobs of different callers may share texts.
+    unique = list(dict.fromkeys(texts))
+    with _generate_slots:
+        translated = dict(
+            zip(unique, _translate_texts(unique, source_lang, target_lang))
+        )
+    return [translated[text] for text in texts]
+
+
+def _translate_texts(texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+    model_name = resolve_translation_model(source_lang, target_lang)
+    decoding = translation_decoding(source_lang, target_lang)
+    memory_name = _memory_name(model_name, decoding)
+
+    plans = [_plan(text, source_lang) for text in texts]
+    sentences = list(
+        dict.fromkeys(sent for plan in plans for para in plan for sent in para)
+    )
+    # Sentences are the unit of the translation memory; when all sentences
+    # of the plan are remembered the model is not even loaded.
+    translated = _recall(memory_name, sentences)
+    missing = [sent for sent in sentences if sent not in translated]
 
     try:
-        tokenizer, model = load_translation_components(model_name)
-
-        if len(text) > TRANSLATION_CHUNK_CHAR_THRESHOLD:
-            chunks = [
-                c
-                for c in chunk_text(
-                    text, chunk_size=TRANSLATION_CHUNK_WORD_SIZE, overlap=0
-                )
-                if c.strip()
-            ]
-            translated_chunks = []
-            for i in range(0, len(chunks), TRANSLATION_BATCH_SIZE):
-                translated_chunks.extend(
-                    _translate_batch_with_model(
-                        chunks[i : i + TRANSLATION_BATCH_SIZE], tokenizer, model
-                    )
-                )
-            return "\n\n".join(translated_chunks).strip()
-
-        return _translate_with_model(text, tokenizer, model)
+        if missing:
+            engine = get_translation_engine(model_name)
+            fresh = _generate(missing, engine, decoding)
+            _remember(memory_name, fresh)
+            translated.update(fresh)
+        logger.debug(
+            "Translation plan %s -> %s: %d texts, %d distinct sentences "
+            "(%d generated)",
+            source_lang,
+            target_lang,
+            len(texts),
+            len(sentences),
+            len(missing),
+        )
     except Exception as exc:
-        logger.exception("Translation failed %s -> %s", source_lang, target_lang)
-        if _should_fallback_to_source_text(exc):
-            logger.warning(
-                "Falling back to source text for %s -> %s due to model availability issues",
-                source_lang,
-                target_lang,
-            )
-            return text
-        raise RuntimeError(
-            f"Translation failed for language pair {source_lang} -> {target_lang}"
-        ) from exc
+        _handle_failure(exc, source_lang, target_lang)
+
+    # After a fallback, texts with a sentence left untranslated stay as they are.
+    return [
+        (
+            _assemble([[translated[sent] for sent in para] for para in plan])
+            if all(sent in translated for para in plan for sent in para)
+            else text
+        )
+        for text, plan in zip(texts, plans)
+    ]
+
+
+def _generate(
+    sentences: List[str], engine: TranslationEngine, decoding: Decoding
+) -> Dict[str, str]:
+    """Translations of *sentences* by the model."""
+    count = _token_counter(engine.tokenizer)
+    # A sentence over the segment budget is translated as word runs, rejoined.
+    pieces = {
+        sent: pack_sentences([sent], count, TRANSLATION_MAX_SEGMENT_TOKENS)
+        for sent in sentences
+    }
+    segments = list(dict.fromkeys(seg for runs in pieces.values() for seg in runs))
+    out = dict(zip(segments, _translate_segments(segments, count, engine, decoding)))
+    return {sent: " ".join(out[seg] for seg in runs) for sent, runs in pieces.items()}
+
+
+def _memory_name(model_name: str, decoding: Decoding) -> str:
+    """Translation memory namespace: output differs per backend and decoding."""
+    return f"{model_name}@{translation_variant()}/{decoding.tag}"
+
+
+def _recall(model_name: str, segments: List[str]) -> Dict[str, str]:
+    """Translations of *segments* found in the translation memory."""
+    if not TRANSLATION_MEMORY_ENABLED or not segments:
+        return {}
+    keys = {segment: segment_key(segment) for segment in segments}
+    try:
+        found = get_translation_memory().get_many(model_name, keys.values())
+    except sqlite3.Error as e:
+        logger.warning("Could not read translation memory: %s", e)
+        return {}
+    return {segment: found[key] for segment, key in keys.items() if key in found}
+
+
+def _remember(model_name: str, translated: Dict[str, str]) -> None:
+    if not TRANSLATION_MEMORY_ENABLED or not translated:
+        return
+    try:
+        get_translation_memory().put_many(
+            model_name,
+            [(segment_key(segment), text) for segment, text in translated.items()],
+        )
+    except sqlite3.Error as e:
+        logger.warning("Could not write translation memory: %s", e)
+
+
+def _translate_segments(
+    segments: List[str],
+    count: Callable[[List[str]], List[int]],
+    engine: TranslationEngine,
+    decoding: Decoding,
+) -> List[str]:
+    """Translate *segments* in batches of similar token length."""
+    translated: List[str] = [""] * len(segments)
+    for batch in length_buckets(count(segments), TRANSLATION_BATCH_MAX_TOKENS):
+        outputs = engine.translate_batch([segments[i] for i in batch], decoding)
+        for i, output in zip(batch, outputs):
+            translated[i] = output
+    return translated
@@ -0,0 +1,257 @@
+"""Inference backends and decoding settings for the MarianMT translation models.
+
+``torch`` runs the model as published through ``transformers``.  On CPU-only
+nodes ``ctranslate2`` is considerably faster: the model is converted once to a
+CTranslate2 model with ``CTRANSLATE2_COMPUTE_TYPE`` weights (int8 by default)
+and served by CTranslate2's translator.  Without the optional ``ctranslate2``
+package the backend falls back to ``torch``.
+
+Conversions are written once per node under ``CTRANSLATE2_MODEL_CACHE_DIR``,
+one directory per model and compute type, through a staging directory that
+is renamed into place when complete, like the ONNX exports of the comparison
+models (ai/model_backends.py).
+
+Decoding (beam size, output length, repeated n-grams) is set per language
+pair on its ``[[translation_models]]`` entry in config.toml, falling back to
+the ``TRANSLATION_*`` settings.  Output depends on the backend and the
+decoding, so translations are remembered under ``translation_variant()``
+and ``Decoding.tag`` as well as the model name.
+"""
+
+import functools
+import logging
+import os
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List
+
+from app.core.settings import (
+    CTRANSLATE2_COMPUTE_TYPE,
+    CTRANSLATE2_INTRA_THREADS,
+    CTRANSLATE2_MODEL_CACHE_DIR,
+    TRANSLATION_BACKEND,
+    TRANSLATION_BACKENDS,
+    TRANSLATION_BEAM_SIZE,
+    TRANSLATION_MAX_LENGTH_OFFSET,
+    TRANSLATION_MAX_LENGTH_RATIO,
+    TRANSLATION_NO_REPEAT_NGRAM_SIZE,
+)
+from app.models.translation.registry import get_translation_model
+from app.services.model_manager import configure_torch_threads
+
+logger = logging.getLogger(__name__)
+
+# Marian models are trained on sequences of at most 512 tokens.
+_MAX_OUTPUT_TOKENS = 512
+
+_CTRANSLATE2_MODEL_FILE = "model.bin"
+
+
+@dataclass(frozen=True)
+class Decoding:
+    """How a language pair's translations are decoded.
+
+    ``beam_size`` 1 is greedy search.  A batch may generate at most
+    ``max_length_ratio`` times its longest input plus ``max_length_offset``
+    tokens, which stops runaway repetitions early.  ``no_repeat_ngram_size``
+    0 allows repeated n-grams.
+    """
+
+    beam_size: int = TRANSLATION_BEAM_SIZE
+    max_length_ratio: float = TRANSLATION_MAX_LENGTH_RATIO
+    max_length_offset: int = TRANSLATION_MAX_LENGTH_OFFSET
+    no_repeat_ngram_size: int = TRANSLATION_NO_REPEAT_NGRAM_SIZE
+
+    def max_new_tokens(self, input_tokens: int) -> int:
+        limit = int(input_tokens * self.max_length_ratio) + self.max_length_offset
+        return max(1, min(_MAX_OUTPUT_TOKENS, limit))
+
+    @property
+    def tag(self) -> str:
+        return (
+            f"beam{self.beam_size}-len{self.max_length_ratio:g}"
+            f"+{self.max_length_offset}-norepeat{self.no_repeat_ngram_size}"
+        )
+
+
+def translation_decoding(source_lang: str, target_lang: str) -> Decoding:
+    """Decoding of the pair's config.toml entry; settings fill unset keys."""
+    entry = get_translation_model(source_lang, target_lang) or {}
+    defaults = Decoding()
+    return Decoding(
+        beam_size=int(entry.get("beam_size", defaults.beam_size)),
+        max_length_ratio=float(
+            entry.get("max_length_ratio", defaults.max_length_ratio)
+        ),
+        max_length_offset=int(
+            entry.get("max_length_offset", defaults.max_length_offset)
+        ),
+        no_repeat_ngram_size=int(
+            entry.get("no_repeat_ngram_size", defaults.no_repeat_ngram_size)
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _ctranslate2_available() -> bool:
+    try:
+        import ctranslate2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def translation_backend() -> str:
+    """``TRANSLATION_BACKEND``, or ``torch`` when ctranslate2 is missing."""
+    backend = TRANSLATION_BACKEND
+    if backend not in TRANSLATION_BACKENDS:
+        raise ValueError(
+            f"Unknown translation backend {backend!r}; "
+            f"expected one of {', '.join(TRANSLATION_BACKENDS)}"
+        )
+    if backend == "ctranslate2" and not _ctranslate2_available():
+        return "torch"
+    return backend
+
+
+def translation_variant() -> str:
+    """Name of the weights translations are generated with."""
+    if translation_backend() == "ctranslate2":
+        return f"ctranslate2-{CTRANSLATE2_COMPUTE_TYPE}"
+    return "torch"
+
+
+class TranslationEngine(ABC):
+    """A loaded MarianMT model with its tokenizer.
+
+    ``tokenizer`` counts source tokens for planning; ``translate_batch``
+    translates one batch of segments.
+    """
+
+    def __init__(self, tokenizer):
+        self.tokenizer = tokenizer
+
+    @abstractmethod
+    def translate_batch(self, texts: List[str], decoding: Decoding) -> List[str]:
+        """Translations of *texts*, in order."""
+
+
+class TorchTranslationEngine(TranslationEngine):
+    def __init__(self, tokenizer, model):
+        super().__init__(tokenizer)
+        self.model = model
+
+    def translate_batch(self, texts: List[str], decoding: Decoding) -> List[str]:
+        inputs = self.tokenizer(
+            texts, return_tensors="pt", padding=True, truncation=True
+        )
+        outputs = self.model.generate(
+            **inputs,
+            num_beams=decoding.beam_size,
+            max_new_tokens=decoding.max_new_tokens(inputs["input_ids"].shape[1]),
+            no_repeat_ngram_size=decoding.no_repeat_ngram_size,
+        )
+        return [self.tokenizer.decode(t, skip_special_tokens=True) for t in outputs]
+
+
+class CTranslate2TranslationEngine(TranslationEngine):
+    def __init__(self, tokenizer, translator, model_dir: Path):
+        super().__init__(tokenizer)
+        self.translator = translator
+        self._weights_bytes = _file_bytes(model_dir / _CTRANSLATE2_MODEL_FILE)
+
+    def __sizeof__(self) -> int:
+        # The translator keeps its weights in native memory.
+        return object.__sizeof__(self) + self._weights_bytes
+
+    def translate_batch(self, texts: List[str], decoding: Decoding) -> List[str]:
+        ids = self.tokenizer(texts, truncation=True)["input_ids"]
+        tokens = [self.tokenizer.convert_ids_to_tokens(item) for item in ids]
+        results = self.translator.translate_batch(
+            tokens,
+            beam_size=decoding.beam_size,
+            max_decoding_length=decoding.max_new_tokens(max(map(len, tokens))),
+            no_repeat_ngram_size=decoding.no_repeat_ngram_size,
+        )
+        return [
+            self.tokenizer.decode(
+                self.tokenizer.convert_tokens_to_ids(result.hypotheses[0]),
+                skip_special_tokens=True,
+            )
+            for result in results
+        ]
+
+
+def _file_bytes(path: Path) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def load_translation_engine(model_name: str) -> TranslationEngine:
+    """Load *model_name* on the configured translation backend."""
+    from transformers import MarianTokenizer
+
+    tokenizer = MarianTokenizer.from_pretrained(model_name)
+    if TRANSLATION_BACKEND == "ctranslate2" and translation_backend() == "torch":
+        logger.warning(
+            "ctranslate2 not installed; %s runs on torch instead", model_name
+        )
+
+    if translation_backend() == "torch":
+        from transformers import MarianMTModel
+
+        configure_torch_threads()
+        return TorchTranslationEngine(
+            tokenizer, MarianMTModel.from_pretrained(model_name)
+        )
+
+    import ctranslate2
+
+    model_dir = _converted_model(model_name)
+    logger.info("Loading %s from %s (%s)", model_name, model_dir, translation_variant())
+    translator = ctranslate2.Translator(
+        str(model_dir),
+        device="cpu",
+        compute_type=CTRANSLATE2_COMPUTE_TYPE,
+        intra_threads=CTRANSLATE2_INTRA_THREADS,
+    )
+    return CTranslate2TranslationEngine(tokenizer, translator, model_dir)
+
+
+def _converted_model(model_name: str) -> Path:
+    """Directory of *model_name*'s CTranslate2 conversion, creating it once."""
+    target = (
+        Path(CTRANSLATE2_MODEL_CACHE_DIR)
+        / f"{model_name.replace('/', '--')}--{CTRANSLATE2_COMPUTE_TYPE}"
+    )
+    if (target / _CTRANSLATE2_MODEL_FILE).is_file():
+        return target
+
+    from ctranslate2.converters import TransformersConverter
+
+    logger.info(
+        "Converting %s to CTranslate2 (%s) in %s",
+        model_name,
+        CTRANSLATE2_COMPUTE_TYPE,
+        target,
+    )
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f"{target.name}.", dir=target.parent))
+    try:
+        TransformersConverter(model_name).convert(
+            str(staging), quantization=CTRANSLATE2_COMPUTE_TYPE, force=True
+        )
+        try:
+            staging.rename(target)
+        except OSError:
+            # Another worker finished the same conversion first.
+            if not (target / _CTRANSLATE2_MODEL_FILE).is_file():
+                raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return target
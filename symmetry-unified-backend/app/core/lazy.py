@@ -0,0 +1,31 @@
+"""
+Deferred imports of the heavy ML stack.
+
+Importing torch, transformers, sentence-transformers, spaCy, scikit-learn
+and NLTK takes seconds.  Modules that only need them inside a function
+import them there; packages that re-export functions of such modules
+resolve those names on first access instead of at import time::
+
+    __getattr__ = lazy_exports(__name__, {"translate": "app.ai.translation"})
+
+``from package import translate`` and ``package.translate`` keep working;
+the providing module is imported when the name is first used.
+"""
+
+import importlib
+from typing import Any, Callable, Dict
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Callable[[str], Any]:
+    """Module ``__getattr__`` that imports ``exports[name]`` on first access."""
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        # Cache on the package so later lookups skip this hook.
+        setattr(importlib.import_module(package), name, value)
+        return value
+
+    return __getattr__
@@ -17,6 +17,28 @@ _config = Config(".env")
 # supplied.  Applies to both semantic_comparison.py and section_comparison.py.
 SIMILARITY_THRESHOLD: float = _config("SIMILARITY_THRESHOLD", cast=float, default=0.65)
 
+# ---------------------------------------------------------------------------
+# Section / sentence alignment (services/alignment.py)
+# ---------------------------------------------------------------------------
+
+ALIGNMENT_STRATEGIES: tuple = ("greedy", "optimal", "monotonic")
+
+# How sections (and, for the paragraph diff, sentences) of two articles are
+# paired when a request does not choose: "greedy" takes the best remaining
+# pair, "optimal" maximizes the total similarity (Hungarian algorithm) and
+# "monotonic" keeps pairs in article order.
+ALIGNMENT_STRATEGY: str = _config("ALIGNMENT_STRATEGY", cast=str, default="greedy")
+if ALIGNMENT_STRATEGY not in ALIGNMENT_STRATEGIES:
+    # Fail at startup rather than in every comparison request.
+    raise ValueError(
+        f"Unknown ALIGNMENT_STRATEGY {ALIGNMENT_STRATEGY!r}; "
+        f"expected one of {', '.join(ALIGNMENT_STRATEGIES)}"
+    )
+
+# For "monotonic": only pair items at most this many positions away from the
+# diagonal.  0 disables the band.
+ALIGNMENT_BAND: int = _config("ALIGNMENT_BAND", cast=int, default=0)
+
 # ---------------------------------------------------------------------------
 # Levenshtein disambiguation
 # ---------------------------------------------------------------------------
@@ -84,3 +106,311 @@ BAND_UNKNOWN: tuple = (
     _config("BAND_UNK_DISTANT", cast=float, default=0.25),
     _config("BAND_UNK_UNRELATED", cast=float, default=0.10),
 )
+
+# ---------------------------------------------------------------------------
+# MediaWiki HTTP client (services/wiki_http.py)
+# ---------------------------------------------------------------------------
+
+# Total open connections allowed per language host (e.g. en.wikipedia.org).
+WIKI_HTTP_MAX_CONNECTIONS: int = _config(
+    "WIKI_HTTP_MAX_CONNECTIONS", cast=int, default=20
+)
+
+# Idle keep-alive connections retained per host between requests.
+WIKI_HTTP_MAX_KEEPALIVE: int = _config("WIKI_HTTP_MAX_KEEPALIVE", cast=int, default=10)
+
+# Seconds an idle keep-alive connection is held open before being closed.
+WIKI_HTTP_KEEPALIVE_EXPIRY: float = _config(
+    "WIKI_HTTP_KEEPALIVE_EXPIRY", cast=float, default=30.0
+)
+
+# Maximum number of in-flight requests to a single language host.  Keeps a
+# burst of fan-out work (structural analysis, lag reports) polite towards the
+# Wikimedia API.
+WIKI_HTTP_PER_HOST_CONCURRENCY: int = _config(
+    "WIKI_HTTP_PER_HOST_CONCURRENCY", cast=int, default=8
+)
+
+# Request timeout in seconds for MediaWiki API calls.
+WIKI_HTTP_TIMEOUT: float = _config("WIKI_HTTP_TIMEOUT", cast=float, default=10.0)
+
+# Negotiate HTTP/2 when the optional ``h2`` package is installed.
+WIKI_HTTP2: bool = _config("WIKI_HTTP2", cast=bool, default=True)
+
+# ---------------------------------------------------------------------------
+# Structural analysis (routers/structural_analysis.py)
+# ---------------------------------------------------------------------------
+
+# Number of language editions resolved and analyzed concurrently by
+# /operations/{source_language}/{title}.
+STRUCTURAL_ANALYSIS_CONCURRENCY: int = _config(
+    "STRUCTURAL_ANALYSIS_CONCURRENCY", cast=int, default=6
+)
+
+# ---------------------------------------------------------------------------
+# Persistent article store (services/article_store.py)
+# ---------------------------------------------------------------------------
+
+# SQLite file shared by every worker process.  Relative paths resolve against
+# the backend working directory.
+ARTICLE_STORE_PATH: str = _config(
+    "ARTICLE_STORE_PATH", cast=str, default=".cache/article_store.sqlite3"
+)
+
+# Upper bound on compressed payload bytes kept on disk; least recently read
+# revisions are evicted first.
+ARTICLE_STORE_MAX_BYTES: int = _config(
+    "ARTICLE_STORE_MAX_BYTES", cast=int, default=512 * 1024 * 1024
+)
+
+# Seconds a title -> latest-revision mapping is trusted without asking the
+# wiki.  After that a cheap lastrevid probe decides whether the stored copy is
+# still current; a full parse only happens when the article was edited.
+# Stored revisions themselves never expire.
+ARTICLE_STORE_TITLE_TTL: float = _config(
+    "ARTICLE_STORE_TITLE_TTL", cast=float, default=300.0
+)
+
+# ---------------------------------------------------------------------------
+# In-memory response caches (services/cache.py)
+# ---------------------------------------------------------------------------
+
+# Plain-text articles served by /articles.
+ARTICLE_CACHE_MAX_ENTRIES: int = _config(
+    "ARTICLE_CACHE_MAX_ENTRIES", cast=int, default=128
+)
+ARTICLE_CACHE_MAX_BYTES: int = _config(
+    "ARTICLE_CACHE_MAX_BYTES", cast=int, default=64 * 1024 * 1024
+)
+ARTICLE_CACHE_TTL: float = _config("ARTICLE_CACHE_TTL", cast=float, default=4000.0)
+
+# Parsed responses served by /structured-article.  The TTL matches the article
+# store's revalidation interval so an edited article is not served stale for
+# longer than the store itself would.
+STRUCTURED_CACHE_MAX_ENTRIES: int = _config(
+    "STRUCTURED_CACHE_MAX_ENTRIES", cast=int, default=256
+)
+STRUCTURED_CACHE_MAX_BYTES: int = _config(
+    "STRUCTURED_CACHE_MAX_BYTES", cast=int, default=128 * 1024 * 1024
+)
+STRUCTURED_CACHE_TTL: float = _config(
+    "STRUCTURED_CACHE_TTL", cast=float, default=ARTICLE_STORE_TITLE_TTL
+)
+
+# ---------------------------------------------------------------------------
+# Article HTML parsing (services/article_parser.py)
+# ---------------------------------------------------------------------------
+
+HTML_PARSER_ENGINES: tuple = ("lxml", "html.parser")
+
+# Backend used to turn rendered article HTML into sections and references.
+# "lxml" is several times faster on long articles; "html.parser" is the
+# pure-Python BeautifulSoup path (used automatically when lxml is missing).
+ARTICLE_HTML_PARSER: str = _config("ARTICLE_HTML_PARSER", cast=str, default="lxml")
+
+# ---------------------------------------------------------------------------
+# Persistent embedding cache (services/embedding_store.py)
+# ---------------------------------------------------------------------------
+
+# Reuse sentence embeddings across requests and restarts.
+EMBEDDING_CACHE_ENABLED: bool = _config(
+    "EMBEDDING_CACHE_ENABLED", cast=bool, default=True
+)
+
+# SQLite file shared by every worker process.
+EMBEDDING_CACHE_PATH: str = _config(
+    "EMBEDDING_CACHE_PATH", cast=str, default=".cache/embeddings.sqlite3"
+)
+
+# Upper bound on stored vector bytes; least recently read vectors go first.
+# A LaBSE vector is 3 KB as float32, so the default holds ~85k sentences.
+EMBEDDING_CACHE_MAX_BYTES: int = _config(
+    "EMBEDDING_CACHE_MAX_BYTES", cast=int, default=256 * 1024 * 1024
+)
+
+# "float32" returns vectors exactly as computed; "float16" halves the disk
+# footprint at the cost of ~1e-3 drift in cosine similarities.
+EMBEDDING_CACHE_DTYPE: str = _config(
+    "EMBEDDING_CACHE_DTYPE", cast=str, default="float32"
+)
+
+# ---------------------------------------------------------------------------
+# Embedding micro-batching (services/micro_batching.py)
+# ---------------------------------------------------------------------------
+
+# Merge the sentences of concurrent requests into shared model.encode calls.
+EMBEDDING_BATCHING_ENABLED: bool = _config(
+    "EMBEDDING_BATCHING_ENABLED", cast=bool, default=True
+)
+
+# A batch is run once it holds this many sentences ...
+EMBEDDING_BATCH_MAX_SENTENCES: int = _config(
+    "EMBEDDING_BATCH_MAX_SENTENCES", cast=int, default=256
+)
+
+# ... or this many milliseconds after its first request arrived.
+EMBEDDING_BATCH_MAX_WAIT_MS: float = _config(
+    "EMBEDDING_BATCH_MAX_WAIT_MS", cast=float, default=5.0
+)
+
+# ---------------------------------------------------------------------------
+# Comparison model inference backend (ai/model_backends.py)
+# ---------------------------------------------------------------------------
+
+COMPARISON_MODEL_BACKENDS: tuple = ("torch", "onnx", "onnx-int8")
+
+# How sentence-transformer comparison models run.  "onnx" serves the exported
+# model through ONNX Runtime; "onnx-int8" additionally applies dynamic int8
+# weight quantization, the fastest option on CPU-only nodes.  Both need the
+# optional onnxruntime and optimum packages and fall back to "torch" without
+# them.
+COMPARISON_MODEL_BACKEND: str = _config(
+    "COMPARISON_MODEL_BACKEND", cast=str, default="torch"
+)
+
+# Directory holding exported ONNX models, one subdirectory per model, so
+# export and quantization run once per node instead of at every start.
+ONNX_MODEL_CACHE_DIR: str = _config(
+    "ONNX_MODEL_CACHE_DIR", cast=str, default=".cache/onnx_models"
+)
+
+# Instruction set the int8 kernels target: "avx2", "avx512", "avx512_vnni"
+# or "arm64".
+ONNX_QUANTIZATION_CONFIG: str = _config(
+    "ONNX_QUANTIZATION_CONFIG", cast=str, default="avx2"
+)
+
+# Intra-op threads per ONNX Runtime session (0 = one per physical core).
+# Lower it when several worker processes share a node.
+ONNX_INTRA_OP_THREADS: int = _config("ONNX_INTRA_OP_THREADS", cast=int, default=0)
+
+# ---------------------------------------------------------------------------
+# MarianMT translation (ai/translation.py)
+# ---------------------------------------------------------------------------
+
+# Texts are translated sentence by sentence; a sentence longer than this many
+# source tokens is cut into word runs.  Marian models truncate inputs at 512
+# tokens.
+TRANSLATION_MAX_SEGMENT_TOKENS: int = _config(
+    "TRANSLATION_MAX_SEGMENT_TOKENS", cast=int, default=400
+)
+
+# Padded source tokens per generate call (batch size x longest input).
+# Segments are batched with others of similar length, so short ones share
+# large batches and long ones run a few at a time.
+TRANSLATION_BATCH_MAX_TOKENS: int = _config(
+    "TRANSLATION_BATCH_MAX_TOKENS", cast=int, default=4096
+)
+
+# Translation plans generating at the same time across all language pairs.
+# Each one already uses every core through torch's intra-op threads, so more
+# than one mostly adds contention; further requests queue for a slot.
+TRANSLATION_MAX_CONCURRENT_BATCHES: int = _config(
+    "TRANSLATION_MAX_CONCURRENT_BATCHES", cast=int, default=1
+)
+
+# Milliseconds a language pair's worker waits for concurrent requests to
+# merge into the same plan.
+TRANSLATION_BATCH_MAX_WAIT_MS: float = _config(
+    "TRANSLATION_BATCH_MAX_WAIT_MS", cast=float, default=5.0
+)
+
+# Decoding defaults; a pair's [[translation_models]] entry in config.toml may
+# override each of them (beam_size, max_length_ratio, max_length_offset,
+# no_repeat_ngram_size).  Beam size 1 is greedy search, several times faster
+# than the published models' default of 4 beams.
+TRANSLATION_BEAM_SIZE: int = _config("TRANSLATION_BEAM_SIZE", cast=int, default=4)
+
+# A batch generates at most ratio x its longest input + offset tokens.
+TRANSLATION_MAX_LENGTH_RATIO: float = _config(
+    "TRANSLATION_MAX_LENGTH_RATIO", cast=float, default=2.0
+)
+TRANSLATION_MAX_LENGTH_OFFSET: int = _config(
+    "TRANSLATION_MAX_LENGTH_OFFSET", cast=int, default=10
+)
+
+# Forbid repeating n-grams of this size in an output (0 = off).
+TRANSLATION_NO_REPEAT_NGRAM_SIZE: int = _config(
+    "TRANSLATION_NO_REPEAT_NGRAM_SIZE", cast=int, default=0
+)
+
+# ---------------------------------------------------------------------------
+# Translation model inference backend (ai/translation_backends.py)
+# ---------------------------------------------------------------------------
+
+TRANSLATION_BACKENDS: tuple = ("torch", "ctranslate2")
+
+# How MarianMT models run.  "ctranslate2" converts each model once to a
+# CTranslate2 model, the fastest option on CPU-only nodes; it needs the
+# optional ctranslate2 package and falls back to "torch" without it.
+TRANSLATION_BACKEND: str = _config("TRANSLATION_BACKEND", cast=str, default="torch")
+
+# Directory holding converted models, one subdirectory per model and compute
+# type, so conversion runs once per node instead of at every start.
+CTRANSLATE2_MODEL_CACHE_DIR: str = _config(
+    "CTRANSLATE2_MODEL_CACHE_DIR", cast=str, default=".cache/ctranslate2_models"
+)
+
+# Weight type of converted models: "int8", "int8_float32", "float32", ...
+CTRANSLATE2_COMPUTE_TYPE: str = _config(
+    "CTRANSLATE2_COMPUTE_TYPE", cast=str, default="int8"
+)
+
+# Intra-op threads per CTranslate2 translator (0 = CTranslate2's default).
+CTRANSLATE2_INTRA_THREADS: int = _config(
+    "CTRANSLATE2_INTRA_THREADS", cast=int, default=0
+)
+
+# ---------------------------------------------------------------------------
+# Persistent translation memory (services/translation_memory.py)
+# ---------------------------------------------------------------------------
+
+# Reuse translated segments (section titles, recurring sentences) across
+# requests and restarts.
+TRANSLATION_MEMORY_ENABLED: bool = _config(
+    "TRANSLATION_MEMORY_ENABLED", cast=bool, default=True
+)
+
+# SQLite file shared by every worker process.
+TRANSLATION_MEMORY_PATH: str = _config(
+    "TRANSLATION_MEMORY_PATH", cast=str, default=".cache/translation_memory.sqlite3"
+)
+
+# Upper bound on stored translation bytes; least recently read rows go first.
+TRANSLATION_MEMORY_MAX_BYTES: int = _config(
+    "TRANSLATION_MEMORY_MAX_BYTES", cast=int, default=64 * 1024 * 1024
+)
+
+# ---------------------------------------------------------------------------
+# Loaded model registry (services/model_manager.py)
+# ---------------------------------------------------------------------------
+
+# torch intra-op threads for every torch model in the process (0 = torch's
+# default of one per core).  Lower it when several worker processes share a
+# node.
+TORCH_NUM_THREADS: int = _config("TORCH_NUM_THREADS", cast=int, default=0)
+
+# Approximate memory all loaded models together may use (sentence
+# transformers, MarianMT, fact extraction, spaCy); least recently used models
+# are unloaded beyond it.  LaBSE takes ~1.9 GB, a MarianMT pair ~0.3 GB.
+# 0 disables the budget.
+MODEL_MEMORY_BUDGET_BYTES: int = _config(
+    "MODEL_MEMORY_BUDGET_BYTES", cast=int, default=6 * 1024 * 1024 * 1024
+)
+
+# ---------------------------------------------------------------------------
+# Startup warm-up (services/warmup.py)
+# ---------------------------------------------------------------------------
+
+# Load models in the background at startup and run one inference on each, so
+# the first request does not pay for it.  /health/ready answers 503 until the
+# warm-up has finished; /health stays a plain liveness check.
+WARMUP_ENABLED: bool = _config("WARMUP_ENABLED", cast=bool, default=False)
+
+# Translation pairs to preload, e.g. "en-fr,fr-en".
+WARMUP_TRANSLATION_PAIRS: str = _config(
+    "WARMUP_TRANSLATION_PAIRS", cast=str, default=""
+)
+
+# Languages whose spaCy sentence and keyword pipelines are preloaded.
+WARMUP_SPACY_LANGUAGES: str = _config("WARMUP_SPACY_LANGUAGES", cast=str, default="en")
@@ -1,4 +1,6 @@
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 from traceback import format_exc
 
 from fastapi import FastAPI, HTTPException
@@ -16,6 +18,9 @@ from app.routers import (
     models,
     config as config_router,
 )
+from app.core.settings import WARMUP_ENABLED
+from app.services.warmup import Warmup, configured_warmup
+from app.services.wiki_http import close_wiki_http_pool, open_wiki_http_pool
 
 config = Config(".env")
 
@@ -25,7 +30,28 @@ SIMILARITY_THRESHOLD = config.get("SIMILARITY_THRESHOLD", cast=float, default=0.
 
 logging.basicConfig(level=LOG_LEVEL, format="%(asctime)s - %(levelname)s - %(message)s")
 
-app = FastAPI(debug=FASTAPI_DEBUG, title="Symmetry Unified API", version="1.1.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled MediaWiki client per language host for the whole process
+    # lifetime, so cache misses reuse warm TCP/TLS connections.
+    app.state.wiki_http = await open_wiki_http_pool()
+    # Models load in the background; /health/ready reports when they are done.
+    app.state.warmup = configured_warmup() if WARMUP_ENABLED else Warmup([])
+    warmup_task = asyncio.create_task(app.state.warmup.run())
+    try:
+        yield
+    finally:
+        warmup_task.cancel()
+        await close_wiki_http_pool()
+
+
+app = FastAPI(
+    debug=FASTAPI_DEBUG,
+    title="Symmetry Unified API",
+    version="1.1.0",
+    lifespan=lifespan,
+)
 
 
 async def http_exception_handler(request: Request, exc: HTTPException):
@@ -88,5 +114,16 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get(
+    "/health/ready",
+    summary="Readiness Check",
+    description="Returns 200 once the startup model warm-up has finished and 503 while models are still loading. Failed warm-up steps are listed but do not block readiness.",
+)
+async def readiness_check(request: Request):
+    report = request.app.state.warmup.report()
+    status_code = 200 if request.app.state.warmup.ready else 503
+    return JSONResponse(report, status_code=status_code)
+
+
 if __name__ == "__main__":
     uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=FASTAPI_DEBUG)
@@ -49,6 +49,8 @@ from app.models.revision import (
     Flag,
     DiffResponse,
     LagReport,
+    LagBatchRequest,
+    TitleLagReport,
     SectionChange,
     RevisionDiffResponse,
 )
@@ -100,6 +102,8 @@ __all__ = [
     "Flag",
     "DiffResponse",
     "LagReport",
+    "LagBatchRequest",
+    "TitleLagReport",
     "SectionChange",
     "RevisionDiffResponse",
 ]
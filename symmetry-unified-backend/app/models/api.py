@@ -12,3 +12,23 @@ class ListResponse(BaseModel):
     """Generic list response used by model listing endpoints."""
 
     response: List[str]
+
+
+class LoadedModel(BaseModel):
+    """One model held by the process-wide model manager."""
+
+    family: str
+    name: str
+    bytes: int
+    load_seconds: float
+    hits: int
+    idle_seconds: float
+
+
+class LoadedModelsResponse(BaseModel):
+    """Loaded models, least recently used first, and the shared memory budget."""
+
+    budget_bytes: int
+    used_bytes: int
+    evictions: int
+    models: List[LoadedModel]
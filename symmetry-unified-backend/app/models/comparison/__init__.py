@@ -13,13 +13,22 @@ from app.models.comparison.models import (
     SemanticCompareRequest,
     SentenceDiff,
 )
+from app.core.lazy import lazy_exports
 from app.models.comparison.registry import COMPARISON_MODELS, DEFAULT_MODEL
-from app.ai.comparison import (
-    perform_semantic_comparison,
-    preprocess_input,
-    semantic_compare,
-    sentences_diff,
-    universal_sentences_split,
+
+# The comparison engine imports sentence-transformers; load it on first use.
+__getattr__ = lazy_exports(
+    __name__,
+    dict.fromkeys(
+        [
+            "perform_semantic_comparison",
+            "preprocess_input",
+            "semantic_compare",
+            "sentences_diff",
+            "universal_sentences_split",
+        ],
+        "app.ai.comparison",
+    ),
 )
 
 __all__ = [
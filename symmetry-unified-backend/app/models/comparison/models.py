@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 
 # ---------------------------------------------------------------------------
@@ -148,6 +148,13 @@ class SectionCompareRequest(BaseModel):
         default="sentence-transformers/LaBSE",
         description="Sentence-transformer model for embedding comparison",
     )
+    alignment: Optional[Literal["greedy", "optimal", "monotonic"]] = Field(
+        default=None,
+        description=(
+            "Section alignment strategy: best-pair-first, maximum total "
+            "similarity, or order-preserving (server default when omitted)"
+        ),
+    )
 
 
 class ParagraphDiff(BaseModel):
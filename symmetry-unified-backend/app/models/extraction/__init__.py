@@ -1,10 +1,19 @@
+from app.core.lazy import lazy_exports
 from app.models.extraction.models import FactExtractionRequest, FactExtractionResponse
-from app.models.extraction.engine import (
-    extract_facts,
-    get_available_models,
-    get_model_config,
-    model_exists_on_hf,
-    validate_model,
+
+# The engine imports torch and transformers; load it on first use.
+__getattr__ = lazy_exports(
+    __name__,
+    dict.fromkeys(
+        [
+            "extract_facts",
+            "get_available_models",
+            "get_model_config",
+            "model_exists_on_hf",
+            "validate_model",
+        ],
+        "app.models.extraction.engine",
+    ),
 )
 
 __all__ = [
@@ -1,7 +1,6 @@
 import logging
 import re
 import json
-from collections import OrderedDict
 from typing import List, Dict, Any, Tuple
 import asyncio
 import os
@@ -10,7 +9,6 @@ import httpx
 
 from starlette.config import Config
 
-import spacy
 from spacy.language import Language
 import torch
 from transformers import (
@@ -22,6 +20,8 @@ from transformers import (
 from huggingface_hub import model_info
 
 from app.core.config import load_config
+from app.services.model_manager import model_family
+from app.services.spacy_pipelines import get_pipeline
 
 # Load environment variables from .env file (same as main.py)
 _env_config = Config(".env")
@@ -45,34 +45,25 @@ def _load_fact_extraction_config() -> Dict[str, Any]:
 
 MODEL_CONFIG = _load_fact_extraction_config()
 
-# Cache: model_name -> (model, tokenizer)
+# Cache: model_name -> (model, tokenizer), part of the shared model budget
 MODEL_CACHE_MAX_SIZE = int(os.getenv("FACT_EXTRACTION_MODEL_CACHE_SIZE", "3"))
-_model_cache: "OrderedDict[str, Tuple[Any, Any]]" = OrderedDict()
-
-_spacy_sentence_segmenter: Language | None = None
 
 
 def _get_spacy_sentence_segmenter() -> Language:
-    global _spacy_sentence_segmenter
-    if _spacy_sentence_segmenter is None:
-        nlp = spacy.blank("en")
-        if "sentencizer" not in nlp.pipe_names:
-            nlp.add_pipe("sentencizer")
-        _spacy_sentence_segmenter = nlp
-    return _spacy_sentence_segmenter
-
+    nlp = get_pipeline("en", "sentences")
+    if nlp is None:
+        raise RuntimeError("spaCy sentencizer unavailable")
+    return nlp
 
-def _evict_lru_model() -> None:
-    """Evict the least recently used model from the cache."""
-    if not _model_cache:
-        return
 
-    evicted_name, (evicted_model, _) = _model_cache.popitem(last=False)
+def _release_model(model_name: str, entry: Tuple[Any, Any]) -> None:
+    """Free the device memory of a model the model manager unloaded."""
+    evicted_model, _ = entry
 
     try:
         evicted_model.to("cpu")
     except Exception as e:
-        logging.warning(f"Could not move evicted model {evicted_name} to CPU: {e}")
+        logging.warning(f"Could not move evicted model {model_name} to CPU: {e}")
 
     if torch.cuda.is_available():
         try:
@@ -80,7 +71,12 @@ def _evict_lru_model() -> None:
         except Exception:
             pass
 
-    logging.info(f"Evicted least recently used model from cache: {evicted_name}")
+    logging.info(f"Evicted least recently used model from cache: {model_name}")
+
+
+_model_cache = model_family(
+    "fact-extraction", max_entries=MODEL_CACHE_MAX_SIZE, on_evict=_release_model
+)
 
 
 def model_exists_on_hf(model_name: str) -> bool:
@@ -344,6 +340,25 @@ async def _call_openrouter_api(
 # ---------------------------------------------------------------------
 
 
+def _load_hf_model(model_name: str, device: str) -> Tuple[Any, Any]:
+    hf_tokenizer = AutoTokenizer.from_pretrained(model_name)
+
+    hf_config = AutoConfig.from_pretrained(model_name)
+    if hf_config.is_encoder_decoder:
+        hf_model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
+    else:
+        hf_model = AutoModelForCausalLM.from_pretrained(model_name)
+
+    hf_model.eval()
+    hf_model.to(device)
+
+    if hf_tokenizer.pad_token_id is None:
+        hf_tokenizer.pad_token = hf_tokenizer.eos_token
+        hf_model.config.pad_token_id = hf_tokenizer.pad_token_id
+
+    return hf_model, hf_tokenizer
+
+
 def _hf_inference(
     model: Any,
     tokenizer: Any,
@@ -423,29 +438,9 @@ async def extract_facts(
         device = "cuda" if torch.cuda.is_available() else "cpu"
         rep_penalty = config.get("repetition_penalty", 1.0)
 
-        if model_name not in _model_cache:
-            hf_tokenizer = AutoTokenizer.from_pretrained(model_name)
-
-            hf_config = AutoConfig.from_pretrained(model_name)
-            if hf_config.is_encoder_decoder:
-                hf_model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
-            else:
-                hf_model = AutoModelForCausalLM.from_pretrained(model_name)
-
-            hf_model.eval()
-            hf_model.to(device)
-
-            if hf_tokenizer.pad_token_id is None:
-                hf_tokenizer.pad_token = hf_tokenizer.eos_token
-                hf_model.config.pad_token_id = hf_tokenizer.pad_token_id
-
-            if len(_model_cache) >= MODEL_CACHE_MAX_SIZE:
-                _evict_lru_model()
-
-            _model_cache[model_name] = (hf_model, hf_tokenizer)
-        else:
-            _model_cache.move_to_end(model_name)
-            hf_model, hf_tokenizer = _model_cache[model_name]
+        hf_model, hf_tokenizer = _model_cache.get(
+            model_name, lambda: _load_hf_model(model_name, device)
+        )
 
     all_facts: List[str] = []
     processed_chunks: List[str] = []
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional
 
 
@@ -66,3 +66,14 @@ class LagReport(BaseModel):
     target_last_updated: Optional[datetime] = None
     days_behind: Optional[float] = None  # negative means target is ahead of source
     is_lagging: bool
+
+
+class LagBatchRequest(BaseModel):
+    titles: List[str] = Field(..., min_length=1)  # source-language titles
+    source_lang: str = "en"
+    target_langs: List[str] = Field(..., min_length=1)
+
+
+class TitleLagReport(BaseModel):
+    title: str  # source-language title as supplied in the request
+    reports: List[LagReport]
@@ -4,13 +4,12 @@ from typing import List, Optional
 import logging
 import wikipediaapi
 import re
-from app.ai.comparison import semantic_compare
-from app.ai.translation import translate as _translate_fn
-from huggingface_hub import model_info
 from app.core.config import load_config, save_config
 
 
 def model_exists(model_name: str) -> bool:
+    from huggingface_hub import model_info
+
     try:
         model_info(model_name)
         return True
@@ -221,6 +220,7 @@ class ServerModel:
         target_language,
         sim_threshold,
     ):
+        from app.ai.comparison import semantic_compare
 
         return semantic_compare(
             original_blob,
@@ -234,4 +234,6 @@ class ServerModel:
     def text_translate(
         self, source_text: str, source_language: str, target_language: str
     ) -> str:
-        return _translate_fn(source_text, source_language, target_language)
+        from app.ai.translation import translate
+
+        return translate(source_text, source_language, target_language)
@@ -1,5 +1,5 @@
+from app.core.lazy import lazy_exports
 from app.models.translation.models import ChunkedTranslateRequest
-from app.ai.translation import translate, load_translation_components
 from app.models.translation.registry import (
     ROMANCE_LANGS,
     get_supported_target_langs,
@@ -8,10 +8,16 @@ from app.models.translation.registry import (
     get_translation_similarity_threshold,
 )
 
+# The translation engine imports transformers; load it on first use.
+__getattr__ = lazy_exports(
+    __name__,
+    dict.fromkeys(["translate", "get_translation_engine"], "app.ai.translation"),
+)
+
 __all__ = [
     "ChunkedTranslateRequest",
     "translate",
-    "load_translation_components",
+    "get_translation_engine",
     "ROMANCE_LANGS",
     "get_supported_target_langs",
     "get_translation_model",
@@ -1,8 +1,7 @@
-from functools import lru_cache
 import logging
 
-from transformers import MarianMTModel, MarianTokenizer
-
+from app.ai.translation import get_translation_engine
+from app.ai.translation_backends import translation_decoding
 from app.models.translation.registry import get_translation_model_name, ROMANCE_LANGS
 from app.services.chunking import chunk_text
 
@@ -41,7 +40,8 @@ def translate(text: str, source_lang: str, target_lang: str) -> str:
             return text
 
     try:
-        tokenizer, model = load_translation_components(model_name)
+        engine = get_translation_engine(model_name)
+        decoding = translation_decoding(source_lang, target_lang)
 
         if len(text) > TRANSLATION_CHUNK_CHAR_THRESHOLD:
             chunks = chunk_text(text, chunk_size=TRANSLATION_CHUNK_WORD_SIZE, overlap=0)
@@ -55,12 +55,10 @@ def translate(text: str, source_lang: str, target_lang: str) -> str:
             translated_chunks = []
             for i in range(0, len(chunks), TRANSLATION_BATCH_SIZE):
                 batch = chunks[i : i + TRANSLATION_BATCH_SIZE]
-                translated_chunks.extend(
-                    _translate_batch_with_model(batch, tokenizer, model)
-                )
+                translated_chunks.extend(engine.translate_batch(batch, decoding))
             return "\n\n".join(translated_chunks).strip()
 
-        return _translate_with_model(text, tokenizer, model)
+        return engine.translate_batch([text], decoding)[0]
     except Exception as exc:
         logging.warning(
             "Translation failed for %s -> %s: %s. Returning original text.",
@@ -71,27 +69,6 @@ def translate(text: str, source_lang: str, target_lang: str) -> str:
         return text
 
 
-@lru_cache(maxsize=4)
-def load_translation_components(model_name: str):
-    tokenizer = MarianTokenizer.from_pretrained(model_name)
-    model = MarianMTModel.from_pretrained(model_name)
-    return tokenizer, model
-
-
-def _translate_with_model(text: str, tokenizer, model) -> str:
-    inputs = tokenizer(text, return_tensors="pt", padding=True, truncation=True)
-    outputs = model.generate(**inputs)
-    return tokenizer.decode(outputs[0], skip_special_tokens=True)
-
-
-def _translate_batch_with_model(texts, tokenizer, model):
-    if not texts:
-        return []
-    inputs = tokenizer(texts, return_tensors="pt", padding=True, truncation=True)
-    outputs = model.generate(**inputs)
-    return [tokenizer.decode(output, skip_special_tokens=True) for output in outputs]
-
-
 def _normalize_lang_code(language: str) -> str:
     normalized = (language or "").strip().lower()
     if not normalized:
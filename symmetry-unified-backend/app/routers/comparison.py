@@ -341,4 +341,5 @@ async def compare_article_sections_endpoint(payload: SectionCompareRequest):
         target_article=target_article,
         similarity_threshold=payload.similarity_threshold,
         model_name=payload.model_name,
+        alignment=payload.alignment,
     )
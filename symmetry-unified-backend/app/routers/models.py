@@ -1,10 +1,14 @@
+from dataclasses import asdict
+
 from fastapi import APIRouter, Query
 
 from app.models.api import (
+    LoadedModelsResponse,
     ModelSelectionResponse,
     ListResponse,
 )
 from app.models.server import ServerModel
+from app.services.model_manager import get_model_manager
 
 router = APIRouter(prefix="/models", tags=["models"])
 
@@ -137,3 +141,23 @@ def get_selected_comparison_model():
 )
 def get_selected_translation_model():
     return {"response": [server.selected_translation_model]}
+
+
+@router.get(
+    "/loaded",
+    response_model=LoadedModelsResponse,
+    summary="List Loaded Models",
+    description=(
+        "Models currently held in memory by this worker (sentence transformers, "
+        "translation, fact extraction and spaCy), least recently used first, "
+        "with their approximate size and the shared memory budget."
+    ),
+)
+def list_loaded_models():
+    manager = get_model_manager()
+    return {
+        "budget_bytes": manager.max_bytes,
+        "used_bytes": manager.current_bytes,
+        "evictions": manager.evictions,
+        "models": [asdict(stats) for stats in manager.stats()],
+    }
@@ -1,3 +1,7 @@
+import asyncio
+import logging
+
+import httpx
 from fastapi import APIRouter, HTTPException, Path
 from starlette import status
 from app.models.wiki.analysis import (
@@ -10,8 +14,12 @@ from app.services import (
     infobox_analysis,
     citation_analysis,
     image_analysis,
+    structural_pipeline,
     wiki_utils,
 )
+from app.core.settings import STRUCTURAL_ANALYSIS_CONCURRENCY
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/operations",
@@ -45,24 +53,25 @@ def calculate_single_score(article_response: FinalAnalysisResponse) -> float:
     return score
 
 
-def analyze_single_article(title: str, language: str) -> FinalAnalysisResponse:
+def _run_analyzers(
+    sources: structural_pipeline.ArticleSources,
+) -> FinalAnalysisResponse:
+    """Run every analyzer over the shared sources (CPU-bound, no I/O)."""
+    return FinalAnalysisResponse(
+        title=sources.title,
+        table_analysis=table_analysis.analyze_tables(sources),
+        header_analysis=header_analysis.count_html_headers(sources),
+        info_box=infobox_analysis.analyze_infobox(sources),
+        citations=citation_analysis.extract_citation_from_wikitext(sources),
+        total_images=image_analysis.get_image_count(sources),
+    )
+
+
+async def analyze_single_article(title: str, language: str) -> FinalAnalysisResponse:
     try:
-        table_analysis_data = table_analysis.analyze_tables(title, language)
-        header_counter = header_analysis.count_html_headers(title, language)
-        infobox_analysis_data = infobox_analysis.analyze_infobox(title, language)
-        citation_analysis_data = citation_analysis.extract_citation_from_wikitext(
-            title, language
-        )
-        image_count = image_analysis.get_image_count(title, language)
-
-        return FinalAnalysisResponse(
-            title=title,
-            table_analysis=table_analysis_data,
-            header_analysis=header_counter,
-            info_box=infobox_analysis_data,
-            citations=citation_analysis_data,
-            total_images=image_count,
-        )
+        sources = await structural_pipeline.fetch_article_sources(title, language)
+        # HTML parsing dominates for large articles; keep it off the event loop.
+        return await asyncio.to_thread(_run_analyzers, sources)
 
     except HTTPException as e:
         raise e
@@ -73,6 +82,59 @@ def analyze_single_article(title: str, language: str) -> FinalAnalysisResponse:
         )
 
 
+async def _score_language(
+    lang_code: str,
+    normalized_title: str,
+    source_language: str,
+    semaphore: asyncio.Semaphore,
+) -> dict:
+    """Resolve, analyze and score one language edition of the article."""
+    entry = {
+        "lang_code": lang_code,
+        "lang_name": LANGUAGES[lang_code],
+        "title": None,
+        "score": -1,
+        "is_user_language": lang_code == source_language,
+        "is_authority_article": False,
+    }
+
+    async with semaphore:
+        try:
+            if lang_code == source_language:
+                current_title = normalized_title
+            else:
+                current_title = await wiki_utils.get_translation(
+                    normalized_title, source_language, lang_code
+                )
+        except (httpx.HTTPError, ValueError) as e:
+            # Network failures, 4xx/5xx and malformed JSON from the langlinks
+            # lookup; unlike a missing link, these are worth seeing.
+            logger.warning(
+                "Language link lookup %s -> %s failed for %r",
+                source_language,
+                lang_code,
+                normalized_title,
+                exc_info=True,
+            )
+            entry["error"] = f"Language link lookup failed: {e}"
+            return entry
+
+        if not current_title:
+            entry["error"] = "Translation or article not available."
+            return entry
+
+        entry["title"] = current_title
+        try:
+            article_response = await analyze_single_article(current_title, lang_code)
+            entry["score"] = round(calculate_single_score(article_response), 3)
+        except HTTPException as e:
+            entry["error"] = e.detail
+        except Exception as e:
+            entry["error"] = f"Internal Error during analysis: {str(e)}"
+
+    return entry
+
+
 @router.get(
     "/{source_language}/{title}",
     status_code=status.HTTP_200_OK,
@@ -90,73 +152,21 @@ async def get_results(
         description="Source language code (e.g., 'en', 'fr', 'es') - one of the 6 supported languages",
     ),
 ):
-    all_scores = []
     normalized_title = title.replace(" ", "_")
-    target_languages = list(LANGUAGES.keys())
-
-    for lang_code in target_languages:
-        current_title = ""
-
-        if lang_code == source_language:
-            current_title = normalized_title
-        else:
-            current_title = await wiki_utils.get_translation(
-                normalized_title, source_language, lang_code
-            )
-
-        if not current_title:
-            all_scores.append(
-                {
-                    "lang_code": lang_code,
-                    "lang_name": LANGUAGES[lang_code],
-                    "title": None,
-                    "score": -1,
-                    "is_user_language": lang_code == source_language,
-                    "is_authority_article": False,
-                    "error": "Translation or article not available.",
-                }
-            )
-            continue
-
-        try:
-            article_response = analyze_single_article(current_title, lang_code)
-            score = calculate_single_score(article_response)
-
-            all_scores.append(
-                {
-                    "lang_code": lang_code,
-                    "lang_name": LANGUAGES[lang_code],
-                    "title": current_title,
-                    "score": round(score, 3),
-                    "is_user_language": lang_code == source_language,
-                    "is_authority_article": False,
-                }
+    semaphore = asyncio.Semaphore(max(1, STRUCTURAL_ANALYSIS_CONCURRENCY))
+
+    # Each language resolves its title and runs its analysis independently;
+    # errors are folded into that language's entry so one slow or failing
+    # wiki never cancels the others.  gather() preserves LANGUAGES order.
+    all_scores = list(
+        await asyncio.gather(
+            *(
+                _score_language(lang_code, normalized_title, source_language, semaphore)
+                for lang_code in LANGUAGES
             )
+        )
+    )
 
-        except HTTPException as e:
-            all_scores.append(
-                {
-                    "lang_code": lang_code,
-                    "lang_name": LANGUAGES[lang_code],
-                    "title": current_title,
-                    "score": -1,
-                    "is_user_language": lang_code == source_language,
-                    "is_authority_article": False,
-                    "error": e.detail,
-                }
-            )
-        except Exception as e:
-            all_scores.append(
-                {
-                    "lang_code": lang_code,
-                    "lang_name": LANGUAGES[lang_code],
-                    "title": current_title,
-                    "score": -1,
-                    "is_user_language": lang_code == source_language,
-                    "is_authority_article": False,
-                    "error": f"Internal Error during analysis: {str(e)}",
-                }
-            )
     valid_scores = [d["score"] for d in all_scores if d.get("score", -1) >= 0]
     max_score = max(valid_scores) if valid_scores else -float("inf")
 
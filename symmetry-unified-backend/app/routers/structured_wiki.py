@@ -1,18 +1,17 @@
 import asyncio
 import difflib
+import json
 import logging
-from typing import Any, Dict, List, Optional
+from dataclasses import asdict
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional
 
-import httpx
 from fastapi import APIRouter, Query, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
-from app.models.extraction.engine import (
-    extract_facts,
-    get_available_models,
-    get_model_config,
-    validate_model,
-)
+# The extraction engine loads torch and transformers; the package resolves
+# these names on first use.
+from app.models import extraction
 from app.ai.similarity_scoring import score_article_pair
 from app.ai.comparison import _get_model as _get_st_model
 
@@ -31,17 +30,40 @@ from app.models.extraction.models import FactExtractionRequest, FactExtractionRe
 from app.models import (
     Revision,
     LagReport,
+    LagBatchRequest,
+    TitleLagReport,
+    Section,
     SectionChange,
     RevisionDiffResponse,
     RevisionSectionDiff,
     DiffResponse,
 )
-from app.services.article_parser import article_fetcher, revision_fetcher
-from app.services.wiki_utils import detect_language_lag, parse_wikipedia_url
+from app.services.article_parser import (
+    ArticleItem,
+    article_fetcher,
+    article_stream,
+    revision_fetcher,
+)
+from app.services.article_store import get_article_store, store_call
+from app.services.cache import LRUCache, cache_stats
+from app.services.wiki_utils import (
+    detect_language_lag,
+    detect_language_lag_batch,
+    parse_wikipedia_url,
+)
+from app.services.wiki_http import wiki_api_url, wiki_get_json
 from app.services.structured_translation import translate_article
+from app.services.translation_memory import get_translation_memory
 from app.services.revision_flagging import flag_revision
 from app.services.paragraph_diff import diff_sections as _diff_para_sections
 from app.models.comparison.registry import DEFAULT_MODEL
+from app.core.settings import (
+    ALIGNMENT_STRATEGY,
+    STRUCTURED_CACHE_MAX_BYTES,
+    STRUCTURED_CACHE_MAX_ENTRIES,
+    STRUCTURED_CACHE_TTL,
+    TRANSLATION_MEMORY_ENABLED,
+)
 
 
 class ParagraphDiffRequest(BaseModel):
@@ -58,11 +80,20 @@ class ParagraphDiffRequest(BaseModel):
     model_name: Optional[str] = Field(
         None, description="Sentence-transformer model name (defaults to LaBSE)"
     )
+    alignment: Optional[Literal["greedy", "optimal", "monotonic"]] = Field(
+        None,
+        description="Section and sentence alignment strategy (server default when omitted)",
+    )
 
 
 router = APIRouter(prefix="/symmetry/v1/wiki", tags=["structured-wiki"])
 
-structured_cache: Dict[str, StructuredArticleResponse] = {}
+structured_cache: LRUCache[StructuredArticleResponse] = LRUCache(
+    "structured_articles",
+    max_entries=STRUCTURED_CACHE_MAX_ENTRIES,
+    max_bytes=STRUCTURED_CACHE_MAX_BYTES,
+    ttl=STRUCTURED_CACHE_TTL,
+)
 
 
 def _resolve_article_query(
@@ -119,9 +150,10 @@ async def get_structured_article(
             lang = "en"
 
     cache_key = f"{lang}.{title}"
-    if cache_key in structured_cache:
+    cached = structured_cache.get(cache_key)
+    if cached is not None:
         logging.info("Returning cached structured article: %s", cache_key)
-        return structured_cache[cache_key]
+        return cached
 
     try:
         article = await article_fetcher(title, lang)
@@ -142,7 +174,7 @@ async def get_structured_article(
             total_references=total_references,
         )
 
-        structured_cache[cache_key] = response
+        structured_cache.set(cache_key, response)
 
         logging.info(
             "Successfully parsed structured article: %s (%d sections, %d citations)",
@@ -160,6 +192,134 @@ async def get_structured_article(
         )
 
 
+def _ndjson(event: Dict[str, Any]) -> str:
+    return json.dumps(event, ensure_ascii=False) + "\n"
+
+
+async def _replay_response(
+    response: StructuredArticleResponse,
+) -> AsyncIterator[ArticleItem]:
+    for section in response.sections:
+        yield section
+    for reference in response.references:
+        yield reference
+
+
+async def _structured_article_events(
+    title: str,
+    lang: str,
+    source: str,
+    first: Optional[ArticleItem],
+    items: AsyncIterator[ArticleItem],
+    cache_key: str,
+) -> AsyncIterator[str]:
+    yield _ndjson({"event": "article", "title": title, "lang": lang, "source": source})
+
+    sections = []
+    references = []
+    item = first
+    try:
+        while item is not None:
+            if isinstance(item, Section):
+                yield _ndjson(
+                    {
+                        "event": "section",
+                        "index": len(sections),
+                        "section": item.model_dump(mode="json"),
+                    }
+                )
+                sections.append(item)
+            else:
+                references.append(item)
+            item = await anext(items, None)
+    except Exception as e:
+        logging.error("Error streaming structured article '%s': %s", title, str(e))
+        yield _ndjson({"event": "error", "detail": f"Failed to parse article: {e}"})
+        return
+
+    total_citations = sum(len(section.citations or []) for section in sections)
+    structured_cache.set(
+        cache_key,
+        StructuredArticleResponse(
+            title=title,
+            lang=lang,
+            source=source,
+            sections=sections,
+            references=references,
+            total_sections=len(sections),
+            total_citations=total_citations,
+            total_references=len(references),
+        ),
+    )
+
+    yield _ndjson(
+        {
+            "event": "references",
+            "references": [r.model_dump(mode="json") for r in references],
+        }
+    )
+    yield _ndjson(
+        {
+            "event": "done",
+            "total_sections": len(sections),
+            "total_citations": total_citations,
+            "total_references": len(references),
+        }
+    )
+
+
+@router.get(
+    "/structured-article/stream",
+    response_class=StreamingResponse,
+    summary="Stream Structured Wikipedia Article",
+    description="Streams the /structured-article payload as newline-delimited JSON while the article is parsed: an `article` event, one `section` event per section in document order, a `references` event and a closing `done` event with the totals. A failure after streaming has started is reported as an `error` event.",
+)
+async def stream_structured_article(
+    query: Optional[str] = Query(
+        None,
+        description="Either a full Wikipedia URL (e.g., https://en.wikipedia.org/wiki/Python) or a keyword/title (e.g., 'Python')",
+    ),
+    lang: Optional[str] = Query(
+        None,
+        description="Article language code (e.g., 'en', 'fr', 'es'). Defaults to 'en' if not provided",
+    ),
+):
+    logging.info(
+        "Calling structured article stream endpoint (query='%s', lang='%s')",
+        query,
+        lang,
+    )
+
+    if not query:
+        raise HTTPException(status_code=400, detail="Query parameter is required.")
+
+    lang, title = _resolve_article_query(query, lang)
+
+    cache_key = f"{lang}.{title}"
+    cached = structured_cache.get(cache_key)
+    if cached is not None:
+        source = cached.source
+        items = _replay_response(cached)
+    else:
+        source = "action_api"
+        items = article_stream(title, lang)
+
+    # Fetch the page and parse up to the first section before the response
+    # starts, so an unreachable wiki is still reported as an HTTP error.
+    try:
+        first = await anext(items, None)
+    except Exception as e:
+        logging.error("Error parsing structured article '%s': %s", title, str(e))
+        raise HTTPException(
+            status_code=500, detail=f"Failed to parse article: {str(e)}"
+        )
+
+    return StreamingResponse(
+        _structured_article_events(title, lang, source, first, items, cache_key),
+        media_type="application/x-ndjson",
+    )
+
+
 @router.get(
     "/structured-section",
     response_model=StructuredSectionResponse,
@@ -429,7 +589,7 @@ async def get_fact_extraction_models():
     """
     logging.info("Calling fact extraction models endpoint")
     try:
-        models = get_available_models()
+        models = extraction.get_available_models()
         return models
     except Exception as e:
         logging.error("Error fetching fact extraction models: %s", str(e))
@@ -527,6 +687,60 @@ async def get_language_lag(
     return reports
 
 
+@router.post(
+    "/lag/batch",
+    response_model=List[TitleLagReport],
+    summary="Detect Language Lag (Batch)",
+    description=(
+        "Lag reports for many source-language titles at once (e.g. a watchlist). "
+        "Interlanguage links and timestamps are fetched in batched MediaWiki queries "
+        "of up to 50 titles, with each target wiki queried concurrently."
+    ),
+)
+async def get_language_lag_batch(request: LagBatchRequest):
+    logging.info(
+        "Calling lag batch endpoint (%d titles, source='%s', targets=%s)",
+        len(request.titles),
+        request.source_lang,
+        request.target_langs,
+    )
+    try:
+        reports = await detect_language_lag_batch(
+            request.titles, request.source_lang, request.target_langs
+        )
+    except Exception as e:
+        logging.error("Error detecting language lag for batch: %s", str(e))
+        raise HTTPException(
+            status_code=500, detail=f"Failed to detect language lag: {str(e)}"
+        )
+    return [
+        TitleLagReport(title=title, reports=title_reports)
+        for title, title_reports in reports.items()
+    ]
+
+
+@router.get(
+    "/cache-stats",
+    summary="Cache Statistics",
+    description=(
+        "Entry counts, byte usage and hit / miss / eviction counters for every "
+        "in-memory cache in this worker, plus the size of the shared article store "
+        "and the size and hit rate of the translation memory."
+    ),
+)
+async def get_cache_stats():
+    store = get_article_store()
+    # A disabled memory is not opened (that would create its SQLite file).
+    memory_stats = None
+    if TRANSLATION_MEMORY_ENABLED:
+        memory_stats = asdict(await store_call(get_translation_memory().stats))
+    return {
+        "caches": [asdict(stats) for stats in cache_stats()],
+        "article_store": await store_call(store.stats),
+        "translation_memory": memory_stats,
+    }
+
+
 @router.get("/fact-extraction-validate")
 async def validate_fact_extraction_model(
     model_id: str = Query(
@@ -544,7 +758,7 @@ async def validate_fact_extraction_model(
         Dictionary with validation result and model info if valid
     """
     try:
-        config = validate_model(model_id)
+        config = extraction.validate_model(model_id)
         return {"valid": True, "model": config}
     except ValueError as e:
         logging.warning("Model validation failed for %s: %s", model_id, str(e))
@@ -573,11 +787,11 @@ async def extract_facts_endpoint(request: FactExtractionRequest):
     )
 
     try:
-        facts, chunks = await extract_facts(
+        facts, chunks = await extraction.extract_facts(
             request.section_content, request.model_id, num_facts=request.num_facts
         )
 
-        config = get_model_config(request.model_id)
+        config = extraction.get_model_config(request.model_id)
         model_name = config["name"]
 
         response = FactExtractionResponse(
@@ -768,7 +982,6 @@ async def get_revision_diff(
 
 async def _fetch_revisions(title: str, lang: str, limit: int = 20) -> List[Revision]:
     """Call the MediaWiki API to retrieve recent revisions for *title*."""
-    url = f"https://{lang}.wikipedia.org/w/api.php"
     params = {
         "action": "query",
         "titles": title,
@@ -778,12 +991,7 @@ async def _fetch_revisions(title: str, lang: str, limit: int = 20) -> List[Revis
         "rvdir": "older",
         "format": "json",
     }
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        r = await client.get(
-            url, params=params, headers={"User-Agent": "SymmetryUnified/1.0"}
-        )
-        r.raise_for_status()
-        data = r.json()
+    data = await wiki_get_json(wiki_api_url(lang), params)
 
     pages = data.get("query", {}).get("pages", {})
     if not pages:
@@ -954,6 +1162,7 @@ async def paragraph_diff(request: ParagraphDiffRequest):
             tgt_sections,
             model,
             threshold=request.similarity_threshold,
+            alignment=request.alignment or ALIGNMENT_STRATEGY,
         )
     except Exception:
         logging.exception("Error computing paragraph diff")
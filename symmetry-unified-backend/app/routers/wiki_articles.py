@@ -11,6 +11,8 @@ from app.models.wiki.responses import (
     ArticleLanguagesResponse,
     AvailableTargetLanguage,
 )
+from app.services.article_parser import get_current_stored
+from app.services.article_store import get_article_store, store_call
 from app.services.cache import get_cached_article, set_cached_article
 from app.services.wiki_utils import validate_language_code
 
@@ -102,6 +104,11 @@ async def get_article(
     if cached_content:
         return {"sourceArticle": cached_content, "articleLanguages": cached_languages}
 
+    stored = await get_current_stored(title, lang, payload="extract")
+    if stored is not None:
+        set_cached_article(lang + "." + title, stored.extract, stored.languages)
+        return {"sourceArticle": stored.extract, "articleLanguages": stored.languages}
+
     wiki_wiki = wikipediaapi.Wikipedia(
         user_agent="SymmetryUnified/1.0 (contact@grey-box.ca)", language=lang
     )
@@ -116,6 +123,21 @@ async def get_article(
 
     set_cached_article(lang + "." + title, article_content, languages)
 
+    revid = page.lastrevid
+    if isinstance(revid, int) and revid > 0:
+        store = get_article_store()
+        await store_call(
+            store.put_revision,
+            lang,
+            revid,
+            page.title,
+            None,
+            None,
+            article_content,
+            languages,
+        )
+        await store_call(store.set_latest, lang, title, revid)
+
     return {"sourceArticle": article_content, "articleLanguages": languages}
 
 
@@ -0,0 +1,135 @@
+"""
+One-to-one alignment of two sequences from their similarity matrix.
+
+Used to pair sections (and sentences) of two articles.  Every strategy only
+pairs items whose similarity reaches ``threshold`` and uses each row and
+column at most once:
+
+``greedy``
+    Repeatedly take the best remaining pair.  Candidates below the threshold
+    are dropped up front and the rest matched in vectorized rounds.
+``optimal``
+    Maximum-weight matching (Hungarian algorithm via
+    ``scipy.optimize.linear_sum_assignment``): as many pairs as possible
+    above the threshold, then the highest total similarity.
+``monotonic``
+    Order-preserving alignment by dynamic programming, so pairs never cross.
+    Translations mostly keep the section order of the original; this keeps
+    one moved or rewritten section from pulling a distant match.  With
+    ``band`` set, only pairs within that many positions of the (scaled)
+    diagonal are considered.
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from app.core.settings import ALIGNMENT_STRATEGIES
+
+Pair = Tuple[int, int, float]
+
+
+def align(
+    sim: np.ndarray,
+    threshold: float,
+    strategy: str = "greedy",
+    band: Optional[int] = None,
+) -> List[Pair]:
+    """
+    Pair rows with columns of *sim* as ``(row, col, score)`` tuples.
+
+    ``greedy`` returns pairs best first; the other strategies in row order.
+    """
+    if strategy not in ALIGNMENT_STRATEGIES:
+        raise ValueError(
+            f"Unknown alignment strategy {strategy!r}; "
+            f"expected one of {', '.join(ALIGNMENT_STRATEGIES)}"
+        )
+    sim = np.asarray(sim, dtype=np.float64)
+    if sim.ndim != 2 or 0 in sim.shape:
+        return []
+
+    if strategy == "greedy":
+        return _greedy(sim, threshold)
+    if strategy == "optimal":
+        return _optimal(sim, threshold)
+    return _monotonic(sim, threshold, band)
+
+
+def _greedy(sim: np.ndarray, threshold: float) -> List[Pair]:
+    cand_rows, cand_cols = np.nonzero(sim >= threshold)
+    order = np.argsort(-sim[cand_rows, cand_cols], kind="stable")
+    cand_rows, cand_cols = cand_rows[order], cand_cols[order]
+
+    # A candidate ranked above every other remaining candidate in its row and
+    # its column is exactly what the sequential best-first walk would take.
+    # Accept all such pairs at once, drop the candidates they block, repeat.
+    rows, cols, rank = cand_rows, cand_cols, np.arange(cand_rows.size)
+    used_rows = np.zeros(sim.shape[0], dtype=bool)
+    used_cols = np.zeros(sim.shape[1], dtype=bool)
+    accepted = [rank[:0]]
+    while rows.size:
+        take = np.zeros(rows.size, dtype=bool)
+        take[np.unique(rows, return_index=True)[1]] = True
+        first_in_col = np.zeros(rows.size, dtype=bool)
+        first_in_col[np.unique(cols, return_index=True)[1]] = True
+        take &= first_in_col
+
+        accepted.append(rank[take])
+        used_rows[rows[take]] = True
+        used_cols[cols[take]] = True
+        keep = ~(used_rows[rows] | used_cols[cols])
+        rows, cols, rank = rows[keep], cols[keep], rank[keep]
+
+    best_first = np.sort(np.concatenate(accepted))
+    return [
+        (r, c, float(sim[r, c]))
+        for r, c in zip(cand_rows[best_first].tolist(), cand_cols[best_first].tolist())
+    ]
+
+
+def _optimal(sim: np.ndarray, threshold: float) -> List[Pair]:
+    from scipy.optimize import linear_sum_assignment
+
+    allowed = sim >= threshold
+    if not allowed.any():
+        return []
+    # Any allowed pair outweighs every possible total of similarities, so
+    # the assignment first maximizes the number of allowed pairs.
+    penalty = 2.0 * min(sim.shape) + 1.0
+    weights = np.where(allowed, sim, -penalty)
+    rows, cols = linear_sum_assignment(weights, maximize=True)
+    return [
+        (int(r), int(c), float(sim[r, c]))
+        for r, c in zip(rows.tolist(), cols.tolist())
+        if allowed[r, c]
+    ]
+
+
+def _monotonic(sim: np.ndarray, threshold: float, band: Optional[int]) -> List[Pair]:
+    n, m = sim.shape
+    gain = np.where(sim >= threshold, sim, -np.inf)
+    if band is not None:
+        diagonal = np.arange(n)[:, None] * (m / n)
+        gain[np.abs(np.arange(m)[None, :] - diagonal) > band] = -np.inf
+
+    # best[i, j]: best total over the first i rows and j columns.  Skipping a
+    # column carries the value to the right, hence the running maximum.
+    best = np.zeros((n + 1, m + 1))
+    for i in range(1, n + 1):
+        take = best[i - 1, :-1] + gain[i - 1]
+        best[i, 1:] = np.maximum.accumulate(np.maximum(best[i - 1, 1:], take))
+
+    pairs: List[Pair] = []
+    i, j = n, m
+    while i > 0 and j > 0:
+        if best[i, j] == best[i, j - 1]:
+            j -= 1
+        elif best[i, j] == best[i - 1, j]:
+            i -= 1
+        else:
+            pairs.append((i - 1, j - 1, float(sim[i - 1, j - 1])))
+            i -= 1
+            j -= 1
+    pairs.reverse()
+    return pairs
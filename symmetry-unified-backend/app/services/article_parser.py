@@ -1,155 +1,477 @@
+import logging
+import math
+from time import time
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Union
+
 import httpx
 from bs4 import BeautifulSoup
+from app.core.settings import ARTICLE_HTML_PARSER, HTML_PARSER_ENGINES
 from app.models.wiki.structure import Citation, Reference, Section, Article
+from app.services.article_store import StoredArticle, get_article_store, store_call
+from app.services.single_flight import SingleFlight
+from app.services.wiki_http import wiki_api_url, wiki_get_json
+from app.services.wiki_utils import get_latest_revids
+
+try:
+    import lxml.html
+    from lxml import etree
+
+    _LXML_AVAILABLE = True
+except ImportError:
+    _LXML_AVAILABLE = False
+
+if ARTICLE_HTML_PARSER == "lxml" and not _LXML_AVAILABLE:
+    logging.info("lxml not installed; article parsing falls back to html.parser")
+
+_article_flights = SingleFlight("article")
+_revision_flights = SingleFlight("revision")
+_page_flights = SingleFlight("page")
 
 
 async def _fetch_wikipedia_json(url: str, params: dict) -> dict:
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(
-            url, params=params, headers={"User-Agent": "SymmetryUnified/1.0"}
+    return await wiki_get_json(url, params)
+
+
+# Tags whose strings BeautifulSoup stores as special string types (CSS, JS,
+# ruby annotations, template contents) and leaves out of get_text() of the
+# surrounding element.  The lxml engine mirrors this so both engines extract
+# the same text.
+_STRING_CONTAINERS = frozenset({"style", "script", "template", "rt", "rp"})
+
+# Characters of HTML handed to the incremental lxml parser per step.
+_PARSE_CHUNK_CHARS = 64 * 1024
+
+ArticleItem = Union[Section, Reference]
+
+
+def _resolve_engine(engine: Optional[str]) -> str:
+    engine = engine or ARTICLE_HTML_PARSER
+    if engine not in HTML_PARSER_ENGINES:
+        raise ValueError(
+            f"Unknown HTML parser engine {engine!r}; "
+            f"expected one of {', '.join(HTML_PARSER_ENGINES)}"
         )
-        response.raise_for_status()
-        return response.json()
+    if engine == "lxml" and not _LXML_AVAILABLE:
+        return "html.parser"
+    return engine
 
 
-def _parse_article_html(html: str, title: str, lang: str, source: str) -> Article:
-    """Parse rendered Wikipedia HTML into an Article object."""
-    soup = BeautifulSoup(html, "html.parser")
+class _SectionBuilder:
+    """Accumulates one section's text as string pieces joined once on close.
 
-    sections = []
-    current_title = "Lead section"
-    rich_current = ""
-    clean_current = ""
-    current_citations = []
-    current_citation_positions = []
+    Pieces are separated by one space once the clean text is non-empty, empty
+    link labels still contribute that space, and reference labels only go to
+    the rich text.
+    """
+
+    def __init__(self, title: str):
+        self.title = title
+        self.rich: List[str] = []
+        self.clean: List[str] = []
+        self.clean_len = 0
+        self.trailing_spaces = 0
+        self.has_text = False
+        self.citations: List[Citation] = []
+        self.positions: List[str] = []
+
+    def _append(self, text: str) -> None:
+        piece = " " + text if self.has_text else text
+        self.rich.append(piece)
+        self.clean.append(piece)
+        self.clean_len += len(piece)
+        if text:
+            self.has_text = True
+            self.trailing_spaces = 0
+        elif self.has_text:
+            self.trailing_spaces += 1
+
+    def add_text(self, text: str) -> None:
+        if text:
+            self._append(text)
+
+    def add_reference(self, label: str) -> None:
+        self.rich.append(f" {label}")
+
+    def add_link(self, text: str, url: str) -> None:
+        # Offset of the link in the stripped clean text so far.
+        position = self.clean_len - self.trailing_spaces
+        self.citations.append(Citation(label=text, url=url))
+        self.positions.append(f"{text}:{position}")
+        self._append(text)
 
-    content_tags = soup.find_all(["h2", "h3", "p"])
+    def close(self) -> Optional[Section]:
+        if not self.has_text:
+            return None
+        return Section(
+            title=self.title,
+            raw_content="".join(self.rich).strip(),
+            clean_content="".join(self.clean).strip(),
+            citations=self.citations,
+            citation_position=self.positions,
+        )
+
+
+def _wiki_link_url(lang: str, href: str) -> str:
+    return f"https://{lang}.wikipedia.org{href}"
+
+
+def _iter_with_bs4(html: str, lang: str) -> Iterator[ArticleItem]:
+    soup = BeautifulSoup(html, "html.parser")
 
-    for tag in content_tags:
+    builder = _SectionBuilder("Lead section")
+
+    for tag in soup.find_all(["h2", "h3", "p"]):
         if tag.name in ["h2", "h3"]:
-            if clean_current.strip():
-                section = Section(
-                    title=current_title,
-                    raw_content=rich_current.strip(),
-                    clean_content=clean_current.strip(),
-                    citations=current_citations,
-                    citation_position=current_citation_positions,
+            section = builder.close()
+            if section is not None:
+                yield section
+            builder = _SectionBuilder(tag.get_text(strip=True))
+            continue
+
+        for element in tag.contents:
+            if (
+                element.name == "sup"
+                and element.has_attr("class")
+                and "reference" in element["class"]
+            ):
+                builder.add_reference(element.get_text(strip=True))
+            elif element.name == "a" and element.get("href", "").startswith("/wiki/"):
+                builder.add_link(
+                    element.get_text(strip=True),
+                    _wiki_link_url(lang, element.get("href", "")),
                 )
-                sections.append(section)
-
-            current_title = tag.get_text(strip=True)
-            rich_current = ""
-            clean_current = ""
-            current_citations = []
-            current_citation_positions = []
-
-        elif tag.name == "p":
-            for element in tag.contents:
-                if hasattr(element, "name"):
-                    if (
-                        element.name == "sup"
-                        and element.has_attr("class")
-                        and "reference" in element["class"]
-                    ):
-                        label = element.get_text(strip=True)
-                        rich_current += f" {label}"
-                        continue
-
-                    elif element.name == "a" and element.get("href", "").startswith(
-                        "/wiki/"
-                    ):
-                        text = element.get_text(strip=True)
-                        position = len(clean_current.strip())
-
-                        hyperlink = (
-                            f"https://{lang}.wikipedia.org{element.get('href', '')}"
-                        )
-                        current_citations.append(Citation(label=text, url=hyperlink))
-                        current_citation_positions.append(f"{text}:{position}")
-
-                        if clean_current.strip():
-                            clean_current += " " + text
-                            rich_current += " " + text
-                        else:
-                            clean_current += text
-                            rich_current += text
-                        continue
-
-                    else:
-                        text = element.get_text(strip=True)
-                        if text:
-                            if clean_current.strip():
-                                clean_current += " " + text
-                                rich_current += " " + text
-                            else:
-                                clean_current += text
-                                rich_current += text
-
-                else:
-                    text = str(element).strip()
-                    if text:
-                        if clean_current.strip():
-                            clean_current += " " + text
-                            rich_current += " " + text
-                        else:
-                            clean_current += text
-                            rich_current += text
-
-    if clean_current.strip():
-        section = Section(
-            title=current_title,
-            raw_content=rich_current.strip(),
-            clean_content=clean_current.strip(),
-            citations=current_citations,
-            citation_position=current_citation_positions,
+            else:
+                builder.add_text(element.get_text(strip=True))
+
+    section = builder.close()
+    if section is not None:
+        yield section
+
+    for ref in soup.select("ol.references > li"):
+        for bl in ref.select("span.mw-cite-backlink"):
+            bl.decompose()
+
+        link_tag = ref.find("a", href=lambda href: href and href.startswith("http"))
+        yield Reference(
+            label=ref.get_text(" ", strip=True),
+            id=ref.get("id", None),
+            url=link_tag["href"] if link_tag else None,
         )
-        sections.append(section)
 
-    full_references_data = []
-    references_list = soup.select("ol.references > li")
 
-    for ref in references_list:
-        ref_id = ref.get("id", None)
+def _has_class(el, name: str) -> bool:
+    return name in (el.get("class") or "").split()
 
-        backlinks = ref.select("span.mw-cite-backlink")
-        for bl in backlinks:
-            bl.decompose()
 
-        ref_text = ref.get_text(" ", strip=True)
+def _enclosing_container(el) -> Optional[str]:
+    for ancestor in el.iterancestors():
+        if ancestor.tag in _STRING_CONTAINERS:
+            return ancestor.tag
+    return None
 
-        link_tag = ref.find("a", href=lambda href: href and href.startswith("http"))
-        link = link_tag["href"] if link_tag else None
 
-        reference = Reference(label=ref_text, id=ref_id, url=link)
-        full_references_data.append(reference)
+def _collect_strings(el, target, container, out: List[str]) -> None:
+    if el.tag in _STRING_CONTAINERS:
+        container = el.tag
+    keep = container == target
+    if keep and el.text:
+        text = el.text.strip()
+        if text:
+            out.append(text)
+    for child in el:
+        # Comments and processing instructions contribute only their tail.
+        if isinstance(child.tag, str):
+            _collect_strings(child, target, container, out)
+        if keep and child.tail:
+            text = child.tail.strip()
+            if text:
+                out.append(text)
+
+
+def _lxml_text(el, container: Optional[str], separator: str = "") -> str:
+    """``get_text(separator, strip=True)`` of *el* with BeautifulSoup semantics.
+
+    *container* is the innermost string-container tag enclosing *el*.
+    """
+    target = el.tag if el.tag in _STRING_CONTAINERS else None
+    out: List[str] = []
+    _collect_strings(el, target, container, out)
+    return separator.join(out)
+
+
+def _add_lxml_paragraph(builder: _SectionBuilder, tag, lang: str) -> None:
+    container = _enclosing_container(tag)
+    # Bare strings directly inside the <p> only count outside containers.
+    own_strings = container is None
+    if own_strings and tag.text:
+        builder.add_text(tag.text.strip())
+    for element in tag:
+        if not isinstance(element.tag, str):
+            pass
+        elif element.tag == "sup" and _has_class(element, "reference"):
+            builder.add_reference(_lxml_text(element, container))
+        elif element.tag == "a" and (element.get("href") or "").startswith("/wiki/"):
+            builder.add_link(
+                _lxml_text(element, container),
+                _wiki_link_url(lang, element.get("href")),
+            )
+        else:
+            builder.add_text(_lxml_text(element, container))
+        if own_strings and element.tail:
+            builder.add_text(element.tail.strip())
+
+
+def _iter_with_lxml(html: str, lang: str) -> Iterator[ArticleItem]:
+    # A pull parser fed in chunks hands over each <p>/<h2>/<h3> once its end
+    # tag is seen, so a section is yielded as soon as the next heading closes
+    # it rather than after the whole document is parsed.
+    parser = etree.HTMLPullParser(events=("end",), tag=("h2", "h3", "p"))
+    parser.set_element_class_lookup(lxml.html.HtmlElementClassLookup())
+
+    builder = _SectionBuilder("Lead section")
+
+    def closed_sections(events):
+        nonlocal builder
+        for _, tag in events:
+            if tag.tag == "p":
+                _add_lxml_paragraph(builder, tag, lang)
+                continue
+            section = builder.close()
+            if section is not None:
+                yield section
+            builder = _SectionBuilder(_lxml_text(tag, _enclosing_container(tag)))
+
+    for start in range(0, len(html), _PARSE_CHUNK_CHARS):
+        parser.feed(html[start : start + _PARSE_CHUNK_CHARS])
+        yield from closed_sections(parser.read_events())
+
+    try:
+        root = parser.close()
+    except etree.XMLSyntaxError:
+        # Nothing was fed.
+        root = None
+    yield from closed_sections(parser.read_events())
+
+    section = builder.close()
+    if section is not None:
+        yield section
+
+    if root is None:
+        return
+
+    for ref in list(root.iter("li")):
+        parent = ref.getparent()
+        if parent is None or parent.tag != "ol" or not _has_class(parent, "references"):
+            continue
+
+        for bl in list(ref.iter("span")):
+            if _has_class(bl, "mw-cite-backlink"):
+                bl.drop_tree()
+
+        link = next(
+            (
+                a.get("href")
+                for a in ref.iter("a")
+                if (a.get("href") or "").startswith("http")
+            ),
+            None,
+        )
+        yield Reference(
+            label=_lxml_text(ref, _enclosing_container(ref), " "),
+            id=ref.get("id"),
+            url=link,
+        )
+
+
+def iter_article_html(
+    html: str, lang: str, engine: Optional[str] = None
+) -> Iterator[ArticleItem]:
+    """Parse rendered Wikipedia HTML lazily.
+
+    Yields each ``Section`` as soon as its ``h2``/``h3`` boundary is closed,
+    then every ``Reference``.  *engine* picks the HTML backend
+    (``ARTICLE_HTML_PARSER`` by default): ``"lxml"`` parses incrementally and
+    is several times faster on long articles; ``"html.parser"`` is the
+    pure-Python BeautifulSoup path and the fallback when lxml is not
+    installed.  Both yield identical items for MediaWiki parser output.
+    """
+    if _resolve_engine(engine) == "lxml":
+        return _iter_with_lxml(html, lang)
+    return _iter_with_bs4(html, lang)
+
+
+def _parse_article_html(
+    html: str, title: str, lang: str, source: str, engine: Optional[str] = None
+) -> Article:
+    """Parse rendered Wikipedia HTML into an Article object."""
+    sections = []
+    references = []
+    for item in iter_article_html(html, lang, engine):
+        if isinstance(item, Section):
+            sections.append(item)
+        else:
+            references.append(item)
 
     return Article(
         title=title,
         lang=lang,
         source=source,
         sections=sections,
-        references=full_references_data,
+        references=references,
     )
 
 
+async def revalidate_titles(titles: List[str], lang: str) -> Dict[str, bool]:
+    """Check stored titles against the wiki's current ``lastrevid``.
+
+    All titles are probed in batched ``prop=info`` queries.  Titles whose
+    stored revision is still current get their check time refreshed; the
+    result maps each title to whether its stored copy may be served.
+    """
+    store = get_article_store()
+    pointers = await store_call(store.latest_revids, lang, titles) or {}
+    if not pointers:
+        return {title: False for title in titles}
+
+    try:
+        current = await get_latest_revids(list(pointers), lang)
+    except httpx.HTTPError as e:
+        logging.warning("lastrevid probe failed for %s: %s", lang, e)
+        return {title: False for title in titles}
+
+    unchanged = [
+        title for title, (revid, _) in pointers.items() if current.get(title) == revid
+    ]
+    await store_call(store.touch_titles, lang, unchanged)
+    return {title: title in unchanged for title in titles}
+
+
+async def get_current_stored(
+    title: str, lang: str, payload: str = "article"
+) -> Optional[StoredArticle]:
+    """Stored latest revision of *title* holding *payload*, if still current.
+
+    Within ``ARTICLE_STORE_TITLE_TTL`` of the last check the stored copy is
+    served as is; after that it is revalidated with a ``lastrevid`` probe.
+    """
+    store = get_article_store()
+    stored = await store_call(store.get_latest, lang, title, math.inf)
+    if stored is None or getattr(stored, payload) is None:
+        return None
+    if time() - stored.checked_at <= store.title_ttl:
+        return stored
+    if (await revalidate_titles([title], lang)).get(title):
+        return stored
+    return None
+
+
 async def article_fetcher(title: str, lang: str) -> Article:
-    url = f"https://{lang}.wikipedia.org/w/api.php"
+    # Concurrent requests for the same page (e.g. the frontend loading
+    # structured-article, citation- and reference-analysis at once) share one
+    # fetch + parse.
+    return await _article_flights.do((lang, title), lambda: _fetch_article(title, lang))
+
+
+async def _fetch_article(title: str, lang: str) -> Article:
+    stored = await get_current_stored(title, lang)
+    if stored is not None:
+        return stored.article.model_copy(
+            update={"title": title, "source": "action_api"}
+        )
+
+    parse = await _fetch_page(title, lang)
+    html = parse.get("text", {}).get("*", "")
+    article = _parse_article_html(html, title, lang, source="action_api")
+    await _store_page(title, lang, parse, article)
+    return article
+
+
+async def _fetch_page(title: str, lang: str) -> dict:
+    """``action=parse`` payload for the current revision of *title*.
+
+    Shared between ``article_fetcher`` and ``article_stream`` so a page that
+    is streamed and fetched at the same time is downloaded once.
+    """
+    url = wiki_api_url(lang)
     params = {
         "action": "parse",
         "page": title,
-        "prop": "text",
+        "prop": "text|revid",
         "format": "json",
         "disableeditsection": True,
         "disabletoc": True,
     }
-    data = await _fetch_wikipedia_json(url, params)
-    html = data.get("parse", {}).get("text", {}).get("*", "")
-    return _parse_article_html(html, title, lang, source="action_api")
+
+    async def fetch() -> dict:
+        data = await _fetch_wikipedia_json(url, params)
+        return data.get("parse", {})
+
+    return await _page_flights.do((lang, title), fetch)
+
+
+async def _store_page(title: str, lang: str, parse: dict, article: Article) -> None:
+    revid = parse.get("revid")
+    if revid:
+        store = get_article_store()
+        html = parse.get("text", {}).get("*", "")
+        await store_call(
+            store.put_revision, lang, revid, parse.get("title", title), html, article
+        )
+        await store_call(store.set_latest, lang, title, revid)
+
+
+async def article_stream(title: str, lang: str) -> AsyncIterator[ArticleItem]:
+    """Yield the sections of *title* as they are parsed, then its references.
+
+    A current stored copy is replayed as is.  Otherwise the page is parsed
+    incrementally and the finished article is stored, so follow-up requests
+    for the same page are served from the store.
+    """
+    stored = await get_current_stored(title, lang)
+    if stored is not None:
+        for section in stored.article.sections:
+            yield section
+        for reference in stored.article.references:
+            yield reference
+        return
+
+    parse = await _fetch_page(title, lang)
+    sections = []
+    references = []
+    for item in iter_article_html(parse.get("text", {}).get("*", ""), lang):
+        if isinstance(item, Section):
+            sections.append(item)
+        else:
+            references.append(item)
+        yield item
+
+    article = Article(
+        title=title,
+        lang=lang,
+        source="action_api",
+        sections=sections,
+        references=references,
+    )
+    await _store_page(title, lang, parse, article)
 
 
 async def revision_fetcher(revid: int, lang: str) -> Article:
     """Fetch a specific Wikipedia revision by ID and return a parsed Article."""
-    url = f"https://{lang}.wikipedia.org/w/api.php"
+    return await _revision_flights.do(
+        (lang, revid), lambda: _fetch_revision(revid, lang)
+    )
+
+
+async def _fetch_revision(revid: int, lang: str) -> Article:
+    source = f"revision:{revid}"
+    store = get_article_store()
+    stored = await store_call(store.get_revision, lang, revid)
+    if stored is not None and stored.article is not None:
+        return stored.article.model_copy(
+            update={"title": stored.title, "source": source}
+        )
+
+    url = wiki_api_url(lang)
     params = {
         "action": "parse",
         "oldid": revid,
@@ -161,4 +483,8 @@ async def revision_fetcher(revid: int, lang: str) -> Article:
     data = await _fetch_wikipedia_json(url, params)
     html = data.get("parse", {}).get("text", {}).get("*", "")
     title = data.get("parse", {}).get("title", f"revid:{revid}")
-    return _parse_article_html(html, title, lang, source=f"revision:{revid}")
+    article = _parse_article_html(html, title, lang, source=source)
+
+    if "parse" in data:
+        await store_call(store.put_revision, lang, revid, title, html, article)
+    return article
@@ -0,0 +1,352 @@
+"""
+Persistent, process-shared store for fetched Wikipedia articles.
+
+Rows are keyed by ``(lang, revid)`` and hold the raw ``action=parse`` HTML,
+the parsed ``Article`` and — for ``/articles`` — the plain-text extract plus
+interlanguage codes.  A second table maps ``(lang, title)`` to the revision
+that was current when the title was last fetched:
+
+- A revision never changes, so a revision row is valid forever and is only
+  removed by size-bounded LRU eviction.
+- A title is "latest revision" state.  Re-fetching a title that has been
+  edited stores the new revision and moves the pointer; readers following
+  the title never see the superseded revision again.
+
+SQLite in WAL mode lets every uvicorn worker read and write the same file,
+and the store survives restarts.  Payloads are zlib-compressed; eviction is
+driven by the compressed on-disk size.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import zlib
+from dataclasses import dataclass
+from time import time
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from app.core.settings import (
+    ARTICLE_STORE_MAX_BYTES,
+    ARTICLE_STORE_PATH,
+    ARTICLE_STORE_TITLE_TTL,
+)
+from app.models.wiki.structure import Article
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS revisions (
+    lang        TEXT    NOT NULL,
+    revid       INTEGER NOT NULL,
+    title       TEXT    NOT NULL,
+    html        BLOB,
+    article     BLOB,
+    extract     BLOB,
+    size_bytes  INTEGER NOT NULL,
+    fetched_at  REAL    NOT NULL,
+    accessed_at REAL    NOT NULL,
+    PRIMARY KEY (lang, revid)
+);
+CREATE INDEX IF NOT EXISTS revisions_accessed ON revisions (accessed_at);
+CREATE TABLE IF NOT EXISTS titles (
+    lang       TEXT    NOT NULL,
+    title      TEXT    NOT NULL,
+    revid      INTEGER NOT NULL,
+    checked_at REAL    NOT NULL,
+    PRIMARY KEY (lang, title)
+);
+"""
+
+# After an eviction pass the store is trimmed to this fraction of max_bytes so
+# that a full store does not evict on every single write.
+_EVICTION_LOW_WATERMARK = 0.9
+
+
+def normalize_title(title: str) -> str:
+    """MediaWiki treats underscores and spaces in titles as equivalent."""
+    return title.replace("_", " ").strip()
+
+
+def _pack(value: Optional[str]) -> Optional[bytes]:
+    return zlib.compress(value.encode("utf-8")) if value is not None else None
+
+
+def _unpack(blob: Optional[bytes]) -> Optional[str]:
+    return zlib.decompress(blob).decode("utf-8") if blob is not None else None
+
+
+@dataclass
+class StoredArticle:
+    lang: str
+    title: str  # canonical title reported by the API for this revision
+    revid: int
+    html: Optional[str] = None
+    article: Optional[Article] = None
+    extract: Optional[str] = None
+    languages: Optional[List[str]] = None
+    checked_at: Optional[float] = None  # set when reached through a title
+
+
+class ArticleStore:
+    """SQLite-backed article store with revision-aware title lookups."""
+
+    def __init__(
+        self,
+        path: str = ARTICLE_STORE_PATH,
+        max_bytes: int = ARTICLE_STORE_MAX_BYTES,
+        title_ttl: float = ARTICLE_STORE_TITLE_TTL,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.title_ttl = title_ttl
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+            logger.info("Opened article store at %s", self.path)
+        return self._conn
+
+    # -- reads --------------------------------------------------------------
+
+    def get_revision(self, lang: str, revid: int) -> Optional[StoredArticle]:
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT title, html, article, extract FROM revisions "
+                "WHERE lang = ? AND revid = ?",
+                (lang, revid),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE revisions SET accessed_at = ? WHERE lang = ? AND revid = ?",
+                (time(), lang, revid),
+            )
+            conn.commit()
+
+        title, html, article, extract = row
+        stored = StoredArticle(lang=lang, title=title, revid=revid, html=_unpack(html))
+        if article is not None:
+            stored.article = Article.model_validate_json(_unpack(article))
+        if extract is not None:
+            payload = json.loads(_unpack(extract))
+            stored.extract = payload["text"]
+            stored.languages = payload["languages"]
+        return stored
+
+    def latest_revid(self, lang: str, title: str) -> Optional[tuple[int, float]]:
+        """Return ``(revid, checked_at)`` for the last known revision of a title."""
+        return self.latest_revids(lang, [title]).get(title)
+
+    def latest_revids(
+        self, lang: str, titles: List[str]
+    ) -> Dict[str, tuple[int, float]]:
+        """``latest_revid`` for many titles; unknown titles are omitted."""
+        keys = {normalize_title(t): t for t in titles}
+        if not keys:
+            return {}
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            rows = (
+                self._connection()
+                .execute(
+                    "SELECT title, revid, checked_at FROM titles "
+                    f"WHERE lang = ? AND title IN ({placeholders})",
+                    (lang, *keys),
+                )
+                .fetchall()
+            )
+        found = {key: (revid, checked_at) for key, revid, checked_at in rows}
+        return {
+            t: found[normalize_title(t)] for t in titles if normalize_title(t) in found
+        }
+
+    def get_latest(
+        self, lang: str, title: str, max_age: Optional[float] = None
+    ) -> Optional[StoredArticle]:
+        """Return the stored latest revision of *title* if it was checked recently.
+
+        Pass ``max_age=math.inf`` to get the stored copy regardless of age and
+        decide on revalidation from ``StoredArticle.checked_at``.
+        """
+        pointer = self.latest_revid(lang, title)
+        if pointer is None:
+            return None
+        revid, checked_at = pointer
+        max_age = self.title_ttl if max_age is None else max_age
+        if time() - checked_at > max_age:
+            return None
+        stored = self.get_revision(lang, revid)
+        if stored is not None:
+            stored.checked_at = checked_at
+        return stored
+
+    # -- writes -------------------------------------------------------------
+
+    def put_revision(
+        self,
+        lang: str,
+        revid: int,
+        title: str,
+        html: Optional[str] = None,
+        article: Optional[Article] = None,
+        extract: Optional[str] = None,
+        languages: Optional[List[str]] = None,
+    ) -> None:
+        """Insert or extend a revision row; fields left as None keep stored values."""
+        html_blob = _pack(html)
+        article_blob = _pack(article.model_dump_json()) if article else None
+        extract_blob = (
+            _pack(json.dumps({"text": extract, "languages": languages or []}))
+            if extract is not None
+            else None
+        )
+        now = time()
+
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                """
+                INSERT INTO revisions
+                    (lang, revid, title, html, article, extract,
+                     size_bytes, fetched_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, 0, ?, ?)
+                ON CONFLICT (lang, revid) DO UPDATE SET
+                    html        = COALESCE(excluded.html, html),
+                    article     = COALESCE(excluded.article, article),
+                    extract     = COALESCE(excluded.extract, extract),
+                    accessed_at = excluded.accessed_at
+                """,
+                (lang, revid, title, html_blob, article_blob, extract_blob, now, now),
+            )
+            conn.execute(
+                "UPDATE revisions SET size_bytes = "
+                "IFNULL(LENGTH(html), 0) + IFNULL(LENGTH(article), 0) "
+                "+ IFNULL(LENGTH(extract), 0) WHERE lang = ? AND revid = ?",
+                (lang, revid),
+            )
+            self._evict_locked(conn)
+            conn.commit()
+
+    def set_latest(self, lang: str, title: str, revid: int) -> None:
+        """Point *title* at *revid* and mark it as checked now."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO titles (lang, title, revid, checked_at) "
+                "VALUES (?, ?, ?, ?)",
+                (lang, normalize_title(title), revid, time()),
+            )
+            conn.commit()
+
+    def touch_titles(self, lang: str, titles: List[str]) -> None:
+        """Mark titles as verified current without changing their revision."""
+        if not titles:
+            return
+        now = time()
+        with self._lock:
+            conn = self._connection()
+            conn.executemany(
+                "UPDATE titles SET checked_at = ? WHERE lang = ? AND title = ?",
+                [(now, lang, normalize_title(t)) for t in titles],
+            )
+            conn.commit()
+
+    def _evict_locked(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute(
+            "SELECT IFNULL(SUM(size_bytes), 0) FROM revisions"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        target = int(self.max_bytes * _EVICTION_LOW_WATERMARK)
+        evicted = 0
+        for lang, revid, size in conn.execute(
+            "SELECT lang, revid, size_bytes FROM revisions ORDER BY accessed_at"
+        ).fetchall():
+            if total <= target:
+                break
+            conn.execute(
+                "DELETE FROM revisions WHERE lang = ? AND revid = ?", (lang, revid)
+            )
+            total -= size
+            evicted += 1
+
+        # Title pointers to evicted revisions would only produce misses.
+        conn.execute(
+            "DELETE FROM titles WHERE NOT EXISTS (SELECT 1 FROM revisions r "
+            "WHERE r.lang = titles.lang AND r.revid = titles.revid)"
+        )
+        logger.info(
+            "Article store evicted %d revisions (%d bytes kept)", evicted, total
+        )
+
+    # -- maintenance --------------------------------------------------------
+
+    def stats(self) -> dict:
+        with self._lock:
+            count, size = (
+                self._connection()
+                .execute("SELECT COUNT(*), IFNULL(SUM(size_bytes), 0) FROM revisions")
+                .fetchone()
+            )
+        return {"revisions": count, "bytes": size, "max_bytes": self.max_bytes}
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM revisions")
+            conn.execute("DELETE FROM titles")
+            conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_store: Optional[ArticleStore] = None
+
+
+def get_article_store() -> ArticleStore:
+    """Return the process-wide article store, opening it on first use."""
+    global _store
+    if _store is None:
+        _store = ArticleStore()
+    return _store
+
+
+def set_article_store(store: Optional[ArticleStore]) -> None:
+    """Replace the process-wide store (tests, alternative paths)."""
+    global _store
+    if _store is not None and _store is not store:
+        _store.close()
+    _store = store
+
+
+async def store_call(fn: Callable[..., T], *args: Any) -> Optional[T]:
+    """Run a blocking store method off the event loop.
+
+    The store is an optimisation: if SQLite is unavailable (read-only volume,
+    locked file) callers fall through to the network instead of failing.
+    """
+    try:
+        return await asyncio.to_thread(fn, *args)
+    except sqlite3.Error as e:
+        logger.warning("Article store unavailable (%s); bypassing", e)
+        return None
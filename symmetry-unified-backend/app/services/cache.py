@@ -1,76 +1,228 @@
-import hashlib
-import logging
-from time import time
-from typing import Dict, List, Optional, Tuple
-from collections import OrderedDict
-from sys import getsizeof
+"""
+Bounded in-memory LRU caches with byte accounting.
 
-CACHE_LIMIT = 10
-TTL_SECONDS = 4000
+``LRUCache`` limits both the number of entries and the bytes they hold, expires
+entries after a TTL and counts hits, misses, evictions and expirations.  Sizes
+come from ``deep_sizeof``, which walks containers and model attributes instead
+of measuring only the outer object like ``sys.getsizeof``, and counts the
+storage of tensors such as model weights.
 
+Every cache registers itself by name so ``cache_stats()`` can report on all of
+them.
+"""
 
-class ArticleCache:
-    def __init__(self, max_size: int = CACHE_LIMIT, ttl: int = TTL_SECONDS):
-        self.cache: "OrderedDict[str, Dict]" = OrderedDict()
-        self.max_size = max_size
+import logging
+import threading
+import types
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from sys import getsizeof
+from time import monotonic
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from app.core.settings import (
+    ARTICLE_CACHE_MAX_BYTES,
+    ARTICLE_CACHE_MAX_ENTRIES,
+    ARTICLE_CACHE_TTL,
+)
+
+V = TypeVar("V")
+
+_ATOMIC = (str, bytes, bytearray, int, float, bool, complex, type(None))
+# Shared, process-lifetime objects that are never owned by a cached value.
+_SHARED = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType)
+
+
+def _is_tensor(obj: Any) -> bool:
+    # torch.Tensor and subclasses (nn.Parameter), without importing torch.
+    return hasattr(obj, "element_size") and hasattr(obj, "nbytes")
+
+
+def deep_sizeof(obj: Any, native: Optional[Callable[[Any], int]] = None) -> int:
+    """Approximate memory held by *obj*, following containers and attributes.
+
+    ``native(item)`` may add bytes an object holds outside Python objects and
+    tensors (e.g. an inference session); it is called for every object.
+    """
+    seen = set()
+    stack = [obj]
+    total = 0
+
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, _SHARED):
+            continue
+        seen.add(id(item))
+        if _is_tensor(item):
+            total += int(item.nbytes)
+            continue
+        total += getsizeof(item)
+        if native is not None:
+            total += native(item)
+
+        if isinstance(item, _ATOMIC):
+            continue
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        else:
+            attrs = getattr(item, "__dict__", None)
+            if attrs is not None:
+                stack.append(attrs)
+            for slot in getattr(type(item), "__slots__", ()):
+                if hasattr(item, slot):
+                    stack.append(getattr(item, slot))
+
+    return total
+
+
+@dataclass
+class CacheStats:
+    name: str
+    entries: int
+    bytes: int
+    max_entries: int
+    max_bytes: int
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+class LRUCache(Generic[V]):
+    """Thread-safe LRU cache bounded by entry count, bytes and TTL."""
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int,
+        max_bytes: int,
+        ttl: Optional[float] = None,
+        sizeof: Callable[[Any], int] = deep_sizeof,
+    ):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
         self.ttl = ttl
-        self.current_size = 0
-
-    def _get_cache_key(self, key: str) -> str:
-        return hashlib.md5(key.encode()).hexdigest()
-
-    def get(self, key: str) -> Tuple[Optional[str], Optional[List[str]]]:
-        cache_key = self._get_cache_key(key)
-        cached_data = self.cache.get(cache_key)
-
-        if not cached_data:
-            logging.info(f"[CACHE MISS] No cache entry for key: {cache_key}")
-            return None, None
-
-        if time() - cached_data["timestamp"] > self.ttl:
-            self._evict(cache_key, reason="expired")
-            return None, None
-
-        self.cache.move_to_end(cache_key)
-        logging.info(f"[CACHE HIT] Returning cached data for key: {cache_key}")
-        return cached_data["content"], cached_data["languages"]
-
-    def set(self, key: str, content: str, languages: List[str]) -> None:
-        cache_key = self._get_cache_key(key)
-        item = {
-            "content": content,
-            "languages": languages,
-            "timestamp": time(),
-        }
-        item_size = getsizeof(item)
-
-        if cache_key in self.cache:
-            self.current_size -= getsizeof(self.cache[cache_key])
-            self.cache.move_to_end(cache_key)
-        elif len(self.cache) >= self.max_size:
-            evicted_key, evicted_val = self.cache.popitem(last=False)
-            self.current_size -= getsizeof(evicted_val)
-            logging.info(f"[CACHE EVICTED] LRU item: {evicted_key}")
-
-        self.cache[cache_key] = item
-        self.current_size += item_size
-        logging.info(
-            f"[CACHE SET] Key: {cache_key} | Size: {len(self.cache)}/{self.max_size}"
+        self._sizeof = sizeof
+        # key -> (value, size_bytes, stored_at)
+        self._data: "OrderedDict[Hashable, Tuple[V, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = CacheStats(
+            name=name, entries=0, bytes=0, max_entries=max_entries, max_bytes=max_bytes
         )
-
-    def _evict(self, key: str, reason: str = "manual") -> None:
-        if key in self.cache:
-            self.current_size -= getsizeof(self.cache[key])
-            del self.cache[key]
-            logging.info(f"[CACHE {reason.upper()}] Evicted key: {key}")
-
-
-_article_cache = ArticleCache()
-
-
-def get_cached_article(title: str) -> Tuple[Optional[str], Optional[List[str]]]:
-    return _article_cache.get(title)
+        _registry[name] = self
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+
+            value, size, stored_at = entry
+            if self.ttl is not None and monotonic() - stored_at > self.ttl:
+                self._remove(key)
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self._stats.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        size = self._sizeof(value)
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            if size > self.max_bytes:
+                logging.info(
+                    "[CACHE %s] Not caching %s: %d bytes exceeds limit",
+                    self.name,
+                    key,
+                    size,
+                )
+                return
+
+            self._data[key] = (value, size, monotonic())
+            self._bytes += size
+            while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+                evicted_key = next(iter(self._data))
+                self._remove(evicted_key)
+                self._stats.evictions += 1
+                logging.info("[CACHE %s] Evicted LRU item: %s", self.name, evicted_key)
+
+    def pop(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            self._remove(key)
+            return entry[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, _ = self._data.pop(key)
+        self._bytes -= size
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    @property
+    def current_bytes(self) -> int:
+        return self._bytes
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            self._stats.entries = len(self._data)
+            self._stats.bytes = self._bytes
+            return CacheStats(**asdict(self._stats))
+
+
+_registry: Dict[str, LRUCache] = {}
+
+
+def cache_stats() -> List[CacheStats]:
+    """Stats for every LRUCache created in this process."""
+    return [cache.stats() for cache in _registry.values()]
+
+
+# Plain-text articles served by /symmetry/v1/wiki/articles.
+_article_cache: LRUCache[Tuple[str, List[str]]] = LRUCache(
+    "articles",
+    max_entries=ARTICLE_CACHE_MAX_ENTRIES,
+    max_bytes=ARTICLE_CACHE_MAX_BYTES,
+    ttl=ARTICLE_CACHE_TTL,
+)
+
+
+def get_cached_article(key: str) -> Tuple[Optional[str], Optional[List[str]]]:
+    cached = _article_cache.get(key)
+    if cached is None:
+        return None, None
+    return cached
 
 
 def set_cached_article(key: str, content: str, languages: List[str]) -> None:
-    _article_cache.set(key, content, languages)
+    _article_cache.set(key, (content, languages))
@@ -1,4 +1,6 @@
-from typing import List
+import math
+from typing import Callable, List
+
 
 def chunk_text(text: str, chunk_size: int = 450, overlap: int = 60) -> List[str]:
     if not text:
@@ -20,3 +22,56 @@ def chunk_text(text: str, chunk_size: int = 450, overlap: int = 60) -> List[str]
         i += step
 
     return chunks
+
+
+def pack_sentences(
+    sentences: List[str],
+    count_tokens: Callable[[List[str]], List[int]],
+    max_tokens: int,
+) -> List[str]:
+    """Join consecutive whole sentences into chunks of at most *max_tokens*.
+
+    *count_tokens* returns the token count of each text it is given.  A
+    sentence longer than *max_tokens* on its own is cut into word runs of
+    about equal token counts.
+    """
+    chunks: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    for sentence, tokens in zip(sentences, count_tokens(sentences)):
+        if current and current_tokens + tokens > max_tokens:
+            chunks.append(" ".join(current))
+            current, current_tokens = [], 0
+        if tokens > max_tokens:
+            words = sentence.split()
+            parts = min(len(words), math.ceil(tokens / max_tokens))
+            size = math.ceil(len(words) / parts)
+            chunks.extend(
+                " ".join(words[i : i + size]) for i in range(0, len(words), size)
+            )
+            continue
+        current.append(sentence)
+        current_tokens += tokens
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+
+def length_buckets(lengths: List[int], max_tokens: int) -> List[List[int]]:
+    """Indices of *lengths* grouped into batches of similar length.
+
+    A batch is padded to its longest item, so it is closed once its size
+    times that length would exceed *max_tokens*.  Every batch holds at least
+    one item.
+    """
+    batches: List[List[int]] = []
+    batch: List[int] = []
+    for i in sorted(range(len(lengths)), key=lengths.__getitem__):
+        # Sorted ascending: item i is the longest of the batch it joins.
+        if batch and (len(batch) + 1) * lengths[i] > max_tokens:
+            batches.append(batch)
+            batch = []
+        batch.append(i)
+    if batch:
+        batches.append(batch)
+    return batches
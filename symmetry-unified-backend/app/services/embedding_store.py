@@ -0,0 +1,215 @@
+"""
+Persistent, content-addressed cache of sentence embeddings.
+
+Rows are keyed by ``(model, text_key)`` where ``text_key`` is the SHA-256 of
+the whitespace-normalized sentence, so re-running a comparison with another
+threshold — or comparing an article that shares sentences with an earlier
+one — reuses the vectors instead of re-embedding every sentence.
+
+Like the article store this is one SQLite file in WAL mode shared by every
+worker process.  Vectors are stored as raw float32 (or float16, see
+``EMBEDDING_CACHE_DTYPE``) blobs; the least recently read rows are evicted
+once the payload exceeds ``max_bytes``.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import unicodedata
+from time import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.settings import (
+    EMBEDDING_CACHE_DTYPE,
+    EMBEDDING_CACHE_MAX_BYTES,
+    EMBEDDING_CACHE_PATH,
+)
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model       TEXT    NOT NULL,
+    text_key    TEXT    NOT NULL,
+    dtype       TEXT    NOT NULL,
+    vector      BLOB    NOT NULL,
+    size_bytes  INTEGER NOT NULL,
+    accessed_at REAL    NOT NULL,
+    PRIMARY KEY (model, text_key)
+);
+CREATE INDEX IF NOT EXISTS embeddings_accessed ON embeddings (accessed_at);
+"""
+
+# Keys per SELECT; stays well below SQLite's bound-parameter limit.
+_LOOKUP_BATCH = 500
+
+# After an eviction pass the cache is trimmed to this fraction of max_bytes.
+_EVICTION_LOW_WATERMARK = 0.9
+
+_DTYPES = {"float32": np.float32, "float16": np.float16}
+
+
+def text_key(text: str) -> str:
+    """Content address of *text*.
+
+    Unicode-normalized and with whitespace runs collapsed: the tokenizers of
+    the supported models split on whitespace, so such variants embed alike.
+    """
+    normalized = " ".join(unicodedata.normalize("NFC", text).split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class EmbeddingStore:
+    """SQLite-backed ``(model, text) -> vector`` cache with LRU eviction."""
+
+    def __init__(
+        self,
+        path: str = EMBEDDING_CACHE_PATH,
+        max_bytes: int = EMBEDDING_CACHE_MAX_BYTES,
+        dtype: str = EMBEDDING_CACHE_DTYPE,
+    ):
+        if dtype not in _DTYPES:
+            raise ValueError(
+                f"Unsupported embedding cache dtype {dtype!r}; "
+                f"expected one of {', '.join(_DTYPES)}"
+            )
+        self.path = path
+        self.max_bytes = max_bytes
+        self.dtype = dtype
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+            logger.info("Opened embedding cache at %s", self.path)
+        return self._conn
+
+    def get_many(self, model: str, keys: Iterable[str]) -> Dict[str, np.ndarray]:
+        """Cached float32 vectors for *keys*; missing keys are omitted."""
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, np.ndarray] = {}
+        if not keys:
+            return found
+
+        with self._lock:
+            conn = self._connection()
+            for start in range(0, len(keys), _LOOKUP_BATCH):
+                batch = keys[start : start + _LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = conn.execute(
+                    "SELECT text_key, dtype, vector FROM embeddings "
+                    f"WHERE model = ? AND text_key IN ({placeholders})",
+                    (model, *batch),
+                ).fetchall()
+                for key, dtype, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=_DTYPES[dtype]).astype(
+                        np.float32
+                    )
+            if found:
+                now = time()
+                conn.executemany(
+                    "UPDATE embeddings SET accessed_at = ? "
+                    "WHERE model = ? AND text_key = ?",
+                    [(now, model, key) for key in found],
+                )
+                conn.commit()
+        return found
+
+    def put_many(self, model: str, items: List[Tuple[str, np.ndarray]]) -> None:
+        """Store ``(key, vector)`` pairs for *model*."""
+        if not items:
+            return
+        np_dtype = _DTYPES[self.dtype]
+        now = time()
+        rows = []
+        for key, vector in items:
+            blob = np.ascontiguousarray(vector, dtype=np_dtype).tobytes()
+            rows.append((model, key, self.dtype, blob, len(blob), now))
+
+        with self._lock:
+            conn = self._connection()
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings "
+                "(model, text_key, dtype, vector, size_bytes, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._evict_locked(conn)
+            conn.commit()
+
+    def _evict_locked(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute(
+            "SELECT IFNULL(SUM(size_bytes), 0) FROM embeddings"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        target = int(self.max_bytes * _EVICTION_LOW_WATERMARK)
+        evicted = 0
+        for model, key, size in conn.execute(
+            "SELECT model, text_key, size_bytes FROM embeddings ORDER BY accessed_at"
+        ).fetchall():
+            if total <= target:
+                break
+            conn.execute(
+                "DELETE FROM embeddings WHERE model = ? AND text_key = ?",
+                (model, key),
+            )
+            total -= size
+            evicted += 1
+
+        logger.info(
+            "Embedding cache evicted %d vectors (%d bytes kept)", evicted, total
+        )
+
+    def stats(self) -> dict:
+        with self._lock:
+            count, size = (
+                self._connection()
+                .execute("SELECT COUNT(*), IFNULL(SUM(size_bytes), 0) FROM embeddings")
+                .fetchone()
+            )
+        return {"vectors": count, "bytes": size, "max_bytes": self.max_bytes}
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM embeddings")
+            conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_store: Optional[EmbeddingStore] = None
+
+
+def get_embedding_store() -> EmbeddingStore:
+    """Return the process-wide embedding cache, opening it on first use."""
+    global _store
+    if _store is None:
+        _store = EmbeddingStore()
+    return _store
+
+
+def set_embedding_store(store: Optional[EmbeddingStore]) -> None:
+    """Replace the process-wide cache (tests, alternative paths)."""
+    global _store
+    if _store is not None and _store is not store:
+        _store.close()
+    _store = store
@@ -20,41 +20,11 @@ than distinct.  This makes the extraction meaningful even when source_lang
 
 import logging
 import re
-from typing import List, Set
+from typing import List, Sequence, Set, Tuple
 
-logger = logging.getLogger(__name__)
+from app.services.spacy_pipelines import get_pipeline
 
-# ---------------------------------------------------------------------------
-# spaCy model registry (same languages as PR #10 / existing code)
-# ---------------------------------------------------------------------------
-
-_SPACY_MODEL_MAP: dict[str, str] = {
-    "en": "en_core_web_sm",
-    "de": "de_core_news_sm",
-    "fr": "fr_core_news_sm",
-    "es": "es_core_news_sm",
-    "it": "it_core_news_sm",
-    "pt": "pt_core_news_sm",
-    "nl": "nl_core_news_sm",
-    "pl": "pl_core_news_sm",
-    "ru": "ru_core_news_sm",
-    "zh": "zh_core_web_sm",
-    "ja": "ja_core_news_sm",
-    "ca": "ca_core_news_sm",
-    "da": "da_core_news_sm",
-    "el": "el_core_news_sm",
-    "nb": "nb_core_news_sm",
-    "lt": "lt_core_news_sm",
-    "mk": "mk_core_news_sm",
-    "ro": "ro_core_news_sm",
-    "sl": "sl_core_news_sm",
-    "uk": "uk_core_news_sm",
-    "ko": "ko_core_news_sm",
-    "fi": "fi_core_news_sm",
-    "sv": "sv_core_news_sm",
-    "hr": "hr_core_news_sm",
-    "sk": "sk_core_news_sm",
-}
+logger = logging.getLogger(__name__)
 
 # Minimum character length for a keyword to be considered
 _MIN_KEYWORD_LENGTH = 3
@@ -64,39 +34,10 @@ _MIN_KEYWORD_LENGTH = 3
 # similarity exceeds this value (0 = completely different, 1 = identical).
 _CROSS_LANG_MATCH_THRESHOLD = 0.75
 
-# spaCy NLP model cache
-_nlp_cache: dict = {}
-
 
 def _load_nlp(language: str):
-    """Load (and cache) a spaCy language model.  Returns None on failure."""
-    if language in _nlp_cache:
-        return _nlp_cache[language]
-
-    model_name = _SPACY_MODEL_MAP.get(language)
-    if not model_name:
-        logger.debug("No spaCy model registered for language '%s'", language)
-        _nlp_cache[language] = None
-        return None
-
-    try:
-        import spacy  # noqa: PLC0415
-
-        nlp = spacy.load(model_name)
-        _nlp_cache[language] = nlp
-        return nlp
-    except OSError:
-        logger.warning(
-            "spaCy model '%s' not installed. Run: python -m spacy download %s",
-            model_name,
-            model_name,
-        )
-        _nlp_cache[language] = None
-        return None
-    except Exception as exc:
-        logger.error("Failed to load spaCy model '%s': %s", model_name, exc)
-        _nlp_cache[language] = None
-        return None
+    """Shared keyword-extraction pipeline for *language*.  None if unavailable."""
+    return get_pipeline(language, "keywords")
 
 
 def _normalise(text: str) -> str:
@@ -104,6 +45,12 @@ def _normalise(text: str) -> str:
     return re.sub(r"[^\w]", "", text.lower().strip())
 
 
+def _fallback_concepts(text: str) -> Set[str]:
+    """Capitalised words of >= 4 chars, for languages without a spaCy model."""
+    tokens = {_normalise(t) for t in text.split() if len(t) >= 4 and t[0].isupper()}
+    return {t for t in tokens if len(t) >= _MIN_KEYWORD_LENGTH}
+
+
 def _extract_concepts(text: str, language: str) -> Set[str]:
     """
     Extract a set of meaningful concepts from *text* written in *language*.
@@ -115,14 +62,18 @@ def _extract_concepts(text: str, language: str) -> Set[str]:
 
     Returns normalised (lowercased, stripped) concepts with length >= 3.
     """
+    return _extract_concepts_many([text], language)[0]
+
+
+def _extract_concepts_many(texts: Sequence[str], language: str) -> List[Set[str]]:
+    """``_extract_concepts`` for several texts, run through ``nlp.pipe``."""
     nlp = _load_nlp(language)
     if nlp is None:
-        # Fallback: split on spaces, keep tokens >= 4 chars that start uppercase
-        tokens = {_normalise(t) for t in text.split() if len(t) >= 4 and t[0].isupper()}
-        return {t for t in tokens if len(t) >= _MIN_KEYWORD_LENGTH}
+        return [_fallback_concepts(text) for text in texts]
+    return [_concepts_from_doc(doc) for doc in nlp.pipe(texts)]
 
-    doc = nlp(text)
 
+def _concepts_from_doc(doc) -> Set[str]:
     concepts: Set[str] = set()
 
     # Named entities (highest priority)
@@ -238,21 +189,50 @@ def extract_exclusive_keywords(
     target_exclusive : List[str]
         Concepts present in *target_text* but absent from *source_text*.
     """
-    if not source_text or not target_text:
-        return [], []
+    return extract_exclusive_keywords_batch(
+        [(source_text, target_text)], source_lang, target_lang
+    )[0]
+
+
+def extract_exclusive_keywords_batch(
+    pairs: Sequence[Tuple[str, str]],
+    source_lang: str,
+    target_lang: str,
+) -> List[Tuple[List[str], List[str]]]:
+    """
+    ``extract_exclusive_keywords`` for many matched pairs at once.
+
+    Each side is run through its language's pipeline with a single
+    ``nlp.pipe`` call instead of one ``nlp()`` call per paragraph.
+    """
+    results: List[Tuple[List[str], List[str]]] = [([], []) for _ in pairs]
+    todo = [i for i, (src, tgt) in enumerate(pairs) if src and tgt]
+    if not todo:
+        return results
 
     try:
-        source_concepts = _extract_concepts(source_text, source_lang)
-        target_concepts = _extract_concepts(target_text, target_lang)
+        source_concepts = _extract_concepts_many(
+            [pairs[i][0] for i in todo], source_lang
+        )
+        target_concepts = _extract_concepts_many(
+            [pairs[i][1] for i in todo], target_lang
+        )
     except Exception as exc:
         logger.error("Keyword extraction failed: %s", exc)
-        return [], []
+        return results
+
+    same_language = source_lang == target_lang
+    for i, src, tgt in zip(todo, source_concepts, target_concepts):
+        results[i] = _exclusive_keywords(src, tgt, same_language)
+    return results
 
+
+def _exclusive_keywords(
+    source_concepts: Set[str], target_concepts: Set[str], same_language: bool
+) -> Tuple[List[str], List[str]]:
     source_exclusive: List[str] = []
     target_exclusive: List[str] = []
 
-    same_language = source_lang == target_lang
-
     for kw in sorted(source_concepts):
         if same_language:
             if kw not in target_concepts:
@@ -0,0 +1,128 @@
+"""
+Dynamic micro-batching of blocking inference calls.
+
+Request handlers run on worker threads and each used to call the model on
+its own few sentences, so concurrent requests competed for the same cores
+with half-empty batches.  A ``MicroBatcher`` puts every submitted job on a
+queue; one worker thread takes the first job, keeps collecting further jobs
+until the batch holds ``max_items`` items or ``max_wait`` seconds have
+passed, runs the model once on all of them and hands each caller its slice
+of the output through a future.
+
+An idle worker exits after ``idle_timeout`` seconds and is restarted by the
+next submission, so batchers for models that are no longer used do not keep
+threads around.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_Job = Tuple[Sequence, Future]
+
+
+class MicroBatcher(Generic[T]):
+    """Merge concurrent ``run(items)`` calls into batched calls.
+
+    ``run`` receives the concatenated items of every merged job and must
+    return a sequence of the same length that supports slicing (a list or an
+    array); job ``k`` gets back ``output[start_k:end_k]``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        run: Callable[[List], Sequence[T]],
+        max_items: int = 256,
+        max_wait: float = 0.005,
+        idle_timeout: float = 30.0,
+    ):
+        self.name = name
+        self.max_items = max_items
+        self.max_wait = max_wait
+        self.idle_timeout = idle_timeout
+        self.batches = 0
+        self.jobs = 0
+        self._run = run
+        self._queue: "queue.Queue[_Job]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
+    def submit(self, items: Sequence) -> "Future[Sequence[T]]":
+        future: Future = Future()
+        with self._lock:
+            self._queue.put((items, future))
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._work, name=f"batcher-{self.name}", daemon=True
+                )
+                self._worker.start()
+        return future
+
+    def __call__(self, items: Sequence) -> Sequence[T]:
+        """Submit *items* and block until their share of the batch is ready."""
+        return self.submit(items).result()
+
+    def _work(self) -> None:
+        while True:
+            try:
+                first = self._queue.get(timeout=self.idle_timeout)
+            except queue.Empty:
+                with self._lock:
+                    if self._queue.empty():
+                        self._worker = None
+                        return
+                continue
+            self._run_batch(self._collect(first))
+
+    def _collect(self, first: _Job) -> List[_Job]:
+        jobs = [first]
+        size = len(first[0])
+        deadline = time.monotonic() + self.max_wait
+        while size < self.max_items:
+            remaining = deadline - time.monotonic()
+            try:
+                job = (
+                    self._queue.get(timeout=remaining)
+                    if remaining > 0
+                    else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            jobs.append(job)
+            size += len(job[0])
+        return jobs
+
+    def _run_batch(self, jobs: List[_Job]) -> None:
+        jobs = [job for job in jobs if job[1].set_running_or_notify_cancel()]
+        if not jobs:
+            return
+        items = [item for job_items, _ in jobs for item in job_items]
+        try:
+            output = self._run(items)
+        except BaseException as exc:
+            for _, future in jobs:
+                future.set_exception(exc)
+            return
+
+        self.batches += 1
+        self.jobs += len(jobs)
+        if len(jobs) > 1:
+            logger.debug(
+                "%s: merged %d jobs into one batch of %d",
+                self.name,
+                len(jobs),
+                len(items),
+            )
+        start = 0
+        for job_items, future in jobs:
+            end = start + len(job_items)
+            future.set_result(output[start:end])
+            start = end
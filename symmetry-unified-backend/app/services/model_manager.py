@@ -0,0 +1,305 @@
+"""
+Process-wide registry of loaded models under one memory budget.
+
+Sentence transformers, MarianMT translation models, fact-extraction models
+and spaCy pipelines are each loaded through a ``ModelFamily`` of the shared
+``ModelManager``.  The manager measures every model once when it is loaded
+(``model_sizeof``), keeps a single least-recently-used order across all
+families and unloads the models used longest ago once the total exceeds
+``MODEL_MEMORY_BUDGET_BYTES``.  A family can additionally cap how many of
+its own models stay loaded.
+
+Concurrent first requests for the same model share one load.  Unloading only
+drops the manager's reference: a request still holding the model finishes
+with it and the memory is released afterwards.
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from app.core.settings import MODEL_MEMORY_BUDGET_BYTES, TORCH_NUM_THREADS
+from app.services.cache import deep_sizeof
+from app.services.single_flight import ThreadSingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+def _session_file_bytes(obj: Any) -> int:
+    # ONNX Runtime sessions keep their weights in native memory; the model
+    # file they were created from is a good estimate of its size.
+    path = getattr(obj, "_model_path", None)
+    if type(obj).__name__ == "InferenceSession" and isinstance(path, str):
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+    return 0
+
+
+def model_sizeof(model: Any) -> int:
+    """Approximate memory held by *model*: weights plus Python-side state."""
+    return deep_sizeof(model, native=_session_file_bytes)
+
+
+@dataclass
+class ModelStats:
+    family: str
+    name: str
+    bytes: int
+    load_seconds: float
+    hits: int
+    idle_seconds: float
+
+
+@dataclass
+class _Entry:
+    value: Any
+    bytes: int
+    load_seconds: float
+    hits: int
+    last_used: float
+
+
+_Key = Tuple[str, Hashable]
+
+# Failed loads may be cached as None, so misses need their own marker.
+_MISSING = object()
+
+
+class ModelFamily:
+    """The models of one kind, e.g. every loaded MarianMT pair.
+
+    Reading a family (``in``, ``[]``, ``keys()``) does not count as a use;
+    only ``get`` moves a model to the most recently used end.
+    """
+
+    def __init__(
+        self,
+        manager: "ModelManager",
+        name: str,
+        max_entries: Optional[int] = None,
+        on_evict: Optional[Callable[[Hashable, Any], None]] = None,
+    ):
+        self.manager = manager
+        self.name = name
+        self.max_entries = max_entries
+        self.on_evict = on_evict
+
+    def get(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """The model loaded under *key*, calling ``load()`` on first use."""
+        return self.manager._get(self, key, load)
+
+    def keys(self) -> List[Hashable]:
+        """Loaded keys, least recently used first."""
+        return self.manager._keys(self.name)
+
+    def pop(self, key: Hashable) -> Any:
+        return self.manager._pop((self.name, key))
+
+    def clear(self) -> None:
+        for key in self.keys():
+            self.manager._pop((self.name, key))
+
+    def __getitem__(self, key: Hashable) -> Any:
+        return self.manager._peek((self.name, key))
+
+    def __contains__(self, key: Hashable) -> bool:
+        return (self.name, key) in self.manager._entries
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+
+class ModelManager:
+    """Loaded models of every family, bounded by ``max_bytes`` (0 = no bound)."""
+
+    def __init__(self, max_bytes: int, sizeof: Callable[[Any], int] = model_sizeof):
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._sizeof = sizeof
+        self._entries: "OrderedDict[_Key, _Entry]" = OrderedDict()
+        self._families: Dict[str, ModelFamily] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._loads = ThreadSingleFlight("model-load")
+
+    def family(
+        self,
+        name: str,
+        max_entries: Optional[int] = None,
+        on_evict: Optional[Callable[[Hashable, Any], None]] = None,
+    ) -> ModelFamily:
+        """The family called *name*, created on first request."""
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = ModelFamily(self, name, max_entries, on_evict)
+                self._families[name] = family
+            return family
+
+    @property
+    def current_bytes(self) -> int:
+        return self._bytes
+
+    def stats(self) -> List[ModelStats]:
+        """Loaded models, least recently used first."""
+        now = monotonic()
+        with self._lock:
+            return [
+                ModelStats(
+                    family=family,
+                    name=str(key),
+                    bytes=entry.bytes,
+                    load_seconds=round(entry.load_seconds, 3),
+                    hits=entry.hits,
+                    idle_seconds=round(now - entry.last_used, 3),
+                )
+                for (family, key), entry in self._entries.items()
+            ]
+
+    def _get(self, family: ModelFamily, key: Hashable, load: Callable[[], Any]):
+        full_key = (family.name, key)
+        value = self._use(full_key)
+        if value is not _MISSING:
+            return value
+        return self._loads.do(full_key, lambda: self._load(family, key, load))
+
+    def _use(self, full_key: _Key) -> Any:
+        with self._lock:
+            entry = self._entries.get(full_key)
+            if entry is None:
+                return _MISSING
+            self._entries.move_to_end(full_key)
+            entry.hits += 1
+            entry.last_used = monotonic()
+            return entry.value
+
+    def _load(self, family: ModelFamily, key: Hashable, load: Callable[[], Any]):
+        full_key = (family.name, key)
+        # A load that finished between the lookup and joining the flight.
+        cached = self._use(full_key)
+        if cached is not _MISSING:
+            return cached
+
+        start = monotonic()
+        value = load()
+        load_seconds = monotonic() - start
+        size = self._sizeof(value)
+
+        with self._lock:
+            self._entries[full_key] = _Entry(value, size, load_seconds, 0, monotonic())
+            self._bytes += size
+            evicted = self._over_limits(family, full_key)
+            for evicted_key, _ in evicted:
+                self._remove(evicted_key)
+            self.evictions += len(evicted)
+
+        logger.info(
+            "Loaded %s model %s (%.0f MB, %.1fs)",
+            family.name,
+            key,
+            size / 1e6,
+            load_seconds,
+        )
+        if self.max_bytes and size > self.max_bytes:
+            logger.warning(
+                "%s model %s alone exceeds the model memory budget", family.name, key
+            )
+        for (family_name, evicted_name), entry in evicted:
+            logger.info(
+                "Unloaded least recently used %s model %s (%.0f MB)",
+                family_name,
+                evicted_name,
+                entry.bytes / 1e6,
+            )
+            evicted_family = self._families.get(family_name)
+            if evicted_family is not None and evicted_family.on_evict is not None:
+                try:
+                    evicted_family.on_evict(evicted_name, entry.value)
+                except Exception as exc:
+                    logger.warning("Cleanup of %s failed: %s", evicted_name, exc)
+        return value
+
+    def _over_limits(
+        self, family: ModelFamily, keep: _Key
+    ) -> List[Tuple[_Key, _Entry]]:
+        """Least recently used entries to drop so every limit holds again."""
+        evict: List[Tuple[_Key, _Entry]] = []
+        if family.max_entries is not None:
+            own = [k for k in self._entries if k[0] == family.name]
+            for full_key in own[: max(0, len(own) - family.max_entries)]:
+                evict.append((full_key, self._entries[full_key]))
+
+        if self.max_bytes:
+            remaining = self._bytes - sum(entry.bytes for _, entry in evict)
+            dropped = {k for k, _ in evict}
+            for full_key, entry in self._entries.items():
+                if remaining <= self.max_bytes:
+                    break
+                if full_key == keep or full_key in dropped:
+                    continue
+                evict.append((full_key, entry))
+                remaining -= entry.bytes
+        return evict
+
+    def _keys(self, family_name: str) -> List[Hashable]:
+        with self._lock:
+            return [key for name, key in self._entries if name == family_name]
+
+    def _peek(self, full_key: _Key) -> Any:
+        with self._lock:
+            return self._entries[full_key].value
+
+    def _pop(self, full_key: _Key) -> Any:
+        with self._lock:
+            if full_key not in self._entries:
+                return None
+            return self._remove(full_key).value
+
+    def _remove(self, full_key: _Key) -> _Entry:
+        entry = self._entries.pop(full_key)
+        self._bytes -= entry.bytes
+        return entry
+
+
+_manager = ModelManager(MODEL_MEMORY_BUDGET_BYTES)
+
+
+def get_model_manager() -> ModelManager:
+    return _manager
+
+
+def model_family(
+    name: str,
+    max_entries: Optional[int] = None,
+    on_evict: Optional[Callable[[Hashable, Any], None]] = None,
+) -> ModelFamily:
+    """Family *name* of the process-wide model manager."""
+    return _manager.family(name, max_entries, on_evict)
+
+
+_torch_threads_lock = threading.Lock()
+_torch_threads_configured = False
+
+
+def configure_torch_threads() -> None:
+    """Apply ``TORCH_NUM_THREADS`` once, before the first torch model loads.
+
+    The intra-op thread count is process-wide; 0 keeps torch's default of
+    one thread per core.
+    """
+    global _torch_threads_configured
+    with _torch_threads_lock:
+        if _torch_threads_configured:
+            return
+        _torch_threads_configured = True
+        if TORCH_NUM_THREADS > 0:
+            import torch
+
+            torch.set_num_threads(TORCH_NUM_THREADS)
+            logger.info("torch intra-op threads set to %d", TORCH_NUM_THREADS)
@@ -10,16 +10,18 @@ from __future__ import annotations
 import difflib
 import logging
 import re
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
 
+from app.ai.embeddings import cosine_similarity, encode
+from app.core.settings import ALIGNMENT_BAND, ALIGNMENT_STRATEGY
 from app.models.wiki.paragraph_diff import (
     AlignedSentencePair,
     ParagraphDiffSection,
     WordToken,
 )
+from app.services.alignment import align
 
 logger = logging.getLogger(__name__)
 
@@ -111,11 +113,15 @@ def align_paragraphs(
     target_sentences: List[str],
     model,  # SentenceTransformer instance
     threshold: float = 0.5,
+    alignment: str = ALIGNMENT_STRATEGY,
+    band: Optional[int] = ALIGNMENT_BAND or None,
 ) -> List[AlignedSentencePair]:
     """Align source sentences to the best-matching target sentence.
 
-    Uses greedy one-to-one matching: each target sentence is consumed at most
-    once. Pairs below ``threshold`` are not included.
+    One-to-one matching with the ``alignment`` strategy (see
+    :mod:`app.services.alignment`): each target sentence is consumed at most
+    once. Pairs below ``threshold`` are not included. Pairs are returned in
+    source order.
 
     Returns a list of :class:`AlignedSentencePair` with word-level diffs.
     """
@@ -123,31 +129,20 @@ def align_paragraphs(
         return []
 
     try:
-        src_emb = model.encode(source_sentences, show_progress_bar=False)
-        tgt_emb = model.encode(target_sentences, show_progress_bar=False)
+        src_emb = encode(model, source_sentences, show_progress_bar=False)
+        tgt_emb = encode(model, target_sentences, show_progress_bar=False)
     except Exception as exc:
         logger.error("Embedding failed in align_paragraphs: %s", exc)
         return []
 
     sim_matrix: np.ndarray = cosine_similarity(src_emb, tgt_emb)
+    matches = align(sim_matrix, threshold, strategy=alignment, band=band)
 
-    used_target: set = set()
     pairs: List[AlignedSentencePair] = []
 
-    for src_idx, src_sent in enumerate(source_sentences):
-        row = sim_matrix[src_idx].copy()
-        # Mask already-used targets
-        for ti in used_target:
-            row[ti] = -1.0
-
-        best_tgt_idx = int(np.argmax(row))
-        best_score = float(row[best_tgt_idx])
-
-        if best_score < threshold:
-            continue
-
+    for src_idx, best_tgt_idx, best_score in sorted(matches):
+        src_sent = source_sentences[src_idx]
         tgt_sent = target_sentences[best_tgt_idx]
-        used_target.add(best_tgt_idx)
 
         diff = word_diff(src_sent, tgt_sent)
         pairs.append(
@@ -172,18 +167,22 @@ def diff_sections(
     target_sections: List[Tuple[str, str]],
     model,
     threshold: float = 0.5,
+    alignment: str = ALIGNMENT_STRATEGY,
+    band: Optional[int] = ALIGNMENT_BAND or None,
 ) -> List[ParagraphDiffSection]:
     """Match source sections to target sections and produce per-section diffs.
 
-    Section matching is done semantically (greedy on section title + intro
-    sentence cosine similarity). For matched sections the sentences are aligned
-    and word-diffed.
+    Section matching is done semantically (``alignment`` strategy on section
+    title + intro sentence cosine similarity). For matched sections the
+    sentences are aligned the same way and word-diffed.
 
     Args:
         source_sections: list of (title, clean_content) tuples from the source article.
         target_sections: list of (title, clean_content) tuples from the target article.
         model: loaded SentenceTransformer instance.
         threshold: minimum cosine similarity to consider sections a match.
+        alignment: "greedy", "optimal" or "monotonic".
+        band: for "monotonic", maximum distance from the diagonal.
 
     Returns:
         List of :class:`ParagraphDiffSection` for each matched pair.
@@ -196,36 +195,31 @@ def diff_sections(
     tgt_texts = [_section_match_text(t, c) for t, c in target_sections]
 
     try:
-        src_title_emb = model.encode(src_texts, show_progress_bar=False)
-        tgt_title_emb = model.encode(tgt_texts, show_progress_bar=False)
+        src_title_emb = encode(model, src_texts, show_progress_bar=False)
+        tgt_title_emb = encode(model, tgt_texts, show_progress_bar=False)
     except Exception as exc:
         logger.error("Section matching embedding failed: %s", exc)
         return []
 
     title_sim: np.ndarray = cosine_similarity(src_title_emb, tgt_title_emb)
+    matches = align(title_sim, threshold, strategy=alignment, band=band)
 
-    used_target: set = set()
     result: List[ParagraphDiffSection] = []
 
-    for src_idx, (src_title, src_content) in enumerate(source_sections):
-        row = title_sim[src_idx].copy()
-        for ti in used_target:
-            row[ti] = -1.0
-
-        best_tgt_idx = int(np.argmax(row))
-        best_score = float(row[best_tgt_idx])
-
-        if best_score < threshold:
-            continue
-
+    for src_idx, best_tgt_idx, best_score in sorted(matches):
+        src_title, src_content = source_sections[src_idx]
         tgt_title, tgt_content = target_sections[best_tgt_idx]
-        used_target.add(best_tgt_idx)
 
         src_sentences = _split_sentences(src_content)
         tgt_sentences = _split_sentences(tgt_content)
 
         aligned = align_paragraphs(
-            src_sentences, tgt_sentences, model, threshold=threshold
+            src_sentences,
+            tgt_sentences,
+            model,
+            threshold=threshold,
+            alignment=alignment,
+            band=band,
         )
 
         # Overall section similarity = average of aligned pair similarities
@@ -11,30 +11,34 @@ which are missing, and which are added.
 """
 
 import logging
-import os
 import re
-import sys
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
 import numpy as np
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 
-from app.core.settings import LEVENSHTEIN_DISAMBIGUATION_MARGIN, SIMILARITY_THRESHOLD
+from app.ai.comparison import prototype_comparator_class
+from app.ai.embeddings import cosine_similarity, encode
+from app.ai.model_backends import get_sentence_transformer
+from app.core.settings import (
+    ALIGNMENT_BAND,
+    ALIGNMENT_STRATEGY,
+    LEVENSHTEIN_DISAMBIGUATION_MARGIN,
+    SIMILARITY_THRESHOLD,
+)
 from app.models.wiki.structure import Article, Section
 from app.models.comparison.models import (
     ParagraphDiff,
     SectionDiff,
     SectionCompareResponse,
 )
+from app.services.alignment import align
 from app.services.similarity_scoring import normalized_levenshtein_distance
-from app.services.keyword_proximity import extract_exclusive_keywords
+from app.services.keyword_proximity import extract_exclusive_keywords_batch
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
 
-# Reusable model cache (shared with semantic_comparison.py pattern)
-_model_cache: dict = {}
+logger = logging.getLogger(__name__)
 
 # When the prototype is selected, section *structure* matching still uses a
 # multilingual transformer (LaBSE) because the prototype's NLP tools are
@@ -42,37 +46,23 @@ _model_cache: dict = {}
 # translating both sides to English.
 _PROTOTYPE_SECTION_MODEL = "sentence-transformers/LaBSE"
 
-try:
-    _sp_path = os.path.abspath(
-        os.path.join(os.path.dirname(__file__), "similarity_prototype")
-    )
-    if os.path.isdir(_sp_path) and _sp_path not in sys.path:
-        sys.path.insert(0, _sp_path)
-    from app.services.similarity_prototype.article_comparator import (
-        ArticleComparator as _ArticleComparator,
-    )
-except Exception:
-    _ArticleComparator = None  # type: ignore[assignment,misc]
-
 _comparator_instance: Optional[Any] = None
 
 
 def _get_comparator() -> Optional[Any]:
     """Get or create a cached ArticleComparator instance."""
     global _comparator_instance
-    if _ArticleComparator is None:
+    comparator_class = prototype_comparator_class()
+    if comparator_class is None:
         return None
     if _comparator_instance is None:
-        _comparator_instance = _ArticleComparator()
+        _comparator_instance = comparator_class()
     return _comparator_instance
 
 
-def _get_model(model_name: str) -> SentenceTransformer:
-    """Load a SentenceTransformer model with caching."""
-    if model_name not in _model_cache:
-        logger.info("Loading sentence-transformer model: %s", model_name)
-        _model_cache[model_name] = SentenceTransformer(model_name)
-    return _model_cache[model_name]
+def _get_model(model_name: str) -> "SentenceTransformer":
+    """The shared SentenceTransformer instance for *model_name*."""
+    return get_sentence_transformer(model_name)
 
 
 def _split_into_paragraphs(section: Section) -> List[str]:
@@ -116,8 +106,9 @@ def _split_into_paragraphs(section: Section) -> List[str]:
 def _match_sections(
     source_sections: List[Section],
     target_sections: List[Section],
-    model: SentenceTransformer,
+    model: "SentenceTransformer",
     threshold: float,
+    alignment: str = ALIGNMENT_STRATEGY,
 ) -> Tuple[
     List[Tuple[int, int, float]],  # matched pairs (source_idx, target_idx, score)
     List[int],  # unmatched source indices
@@ -126,9 +117,9 @@ def _match_sections(
     """
     Match sections between source and target articles using title + content embeddings.
 
-    Uses a greedy best-match approach: encode section titles concatenated with a
-    content preview (first 200 chars), compute the full cosine similarity matrix,
-    then greedily assign the best remaining match above threshold.
+    Encodes section titles concatenated with a content preview (first 200
+    chars), computes the full cosine similarity matrix, then pairs sections
+    above threshold with the chosen alignment strategy (see alignment.py).
     """
     if not source_sections or not target_sections:
         return (
@@ -144,30 +135,17 @@ def _match_sections(
     source_texts = [section_text(s) for s in source_sections]
     target_texts = [section_text(s) for s in target_sections]
 
-    source_embeddings = model.encode(source_texts)
-    target_embeddings = model.encode(target_texts)
+    source_embeddings, target_embeddings = _embed_text_groups(
+        model, [source_texts, target_texts]
+    )
 
     sim_matrix = cosine_similarity(source_embeddings, target_embeddings)
 
-    matched_pairs: List[Tuple[int, int, float]] = []
-    used_source: set = set()
-    used_target: set = set()
-
-    # Greedy assignment: pick best pair, mark used, repeat
-    flat_indices = np.argsort(sim_matrix, axis=None)[::-1]
-    for flat_idx in flat_indices:
-        src_idx = int(flat_idx // sim_matrix.shape[1])
-        tgt_idx = int(flat_idx % sim_matrix.shape[1])
-        score = float(sim_matrix[src_idx, tgt_idx])
-
-        if score < threshold:
-            break
-        if src_idx in used_source or tgt_idx in used_target:
-            continue
-
-        matched_pairs.append((src_idx, tgt_idx, score))
-        used_source.add(src_idx)
-        used_target.add(tgt_idx)
+    matched_pairs = align(
+        sim_matrix, threshold, strategy=alignment, band=ALIGNMENT_BAND or None
+    )
+    used_source = {src_idx for src_idx, _, _ in matched_pairs}
+    used_target = {tgt_idx for _, tgt_idx, _ in matched_pairs}
 
     unmatched_source = [i for i in range(len(source_sections)) if i not in used_source]
     unmatched_target = [i for i in range(len(target_sections)) if i not in used_target]
@@ -175,19 +153,41 @@ def _match_sections(
     return matched_pairs, unmatched_source, unmatched_target
 
 
+def _embed_text_groups(
+    model: "SentenceTransformer", groups: List[List[str]]
+) -> List[np.ndarray]:
+    """
+    Embed several text lists with a single ``encode`` call.
+
+    Texts of every group are de-duplicated and sorted longest first so
+    the model's batches are full and evenly padded, then the vectors are
+    sliced back into one ``(len(group), dim)`` matrix per group.
+    """
+    unique = sorted({p for group in groups for p in group}, key=len, reverse=True)
+    if not unique:
+        return [np.empty((0, 0), dtype=np.float32) for _ in groups]
+
+    embeddings = np.asarray(encode(model, unique))
+    row = {text: i for i, text in enumerate(unique)}
+    return [embeddings[[row[p] for p in group]] for group in groups]
+
+
 def _compare_paragraphs(
     source_paragraphs: List[str],
     target_paragraphs: List[str],
-    model: SentenceTransformer,
+    model: "SentenceTransformer",
     threshold: float,
     source_lang: str = "en",
     target_lang: str = "en",
+    source_embeddings: Optional[np.ndarray] = None,
+    target_embeddings: Optional[np.ndarray] = None,
 ) -> List[ParagraphDiff]:
     """
     Compare paragraphs within a matched section pair.
 
     Uses cosine similarity for primary matching and Levenshtein distance for
     disambiguation when two candidates are within LEVENSHTEIN_DISAMBIGUATION_MARGIN.
+    Precomputed embeddings (see _embed_text_groups) skip the encode step.
     """
     if not source_paragraphs and not target_paragraphs:
         return []
@@ -212,13 +212,16 @@ def _compare_paragraphs(
             for p in source_paragraphs
         ]
 
-    source_embeddings = model.encode(source_paragraphs)
-    target_embeddings = model.encode(target_paragraphs)
+    if source_embeddings is None or target_embeddings is None:
+        source_embeddings, target_embeddings = _embed_text_groups(
+            model, [source_paragraphs, target_paragraphs]
+        )
 
     sim_matrix = cosine_similarity(source_embeddings, target_embeddings)
 
     diffs: List[ParagraphDiff] = []
     used_target: set = set()
+    matched_diffs: List[int] = []
 
     # For each source paragraph, find best matching target paragraph
     for src_idx in range(len(source_paragraphs)):
@@ -267,14 +270,7 @@ def _compare_paragraphs(
 
         if best_score >= threshold:
             used_target.add(best_idx)
-
-            # Second-pass: extract distinctive keywords for matched paragraphs
-            src_kws, tgt_kws = extract_exclusive_keywords(
-                source_paragraphs[src_idx],
-                target_paragraphs[best_idx],
-                source_lang,
-                target_lang,
-            )
+            matched_diffs.append(len(diffs))
 
             diffs.append(
                 ParagraphDiff(
@@ -285,8 +281,6 @@ def _compare_paragraphs(
                     if levenshtein is not None
                     else None,
                     status="matched",
-                    source_exclusive_keywords=src_kws,
-                    target_exclusive_keywords=tgt_kws,
                 )
             )
         else:
@@ -312,6 +306,17 @@ def _compare_paragraphs(
                 )
             )
 
+    # Second pass: distinctive keywords for every matched pair, one
+    # nlp.pipe batch per side.
+    keywords = extract_exclusive_keywords_batch(
+        [(diffs[i].source_text, diffs[i].target_text) for i in matched_diffs],
+        source_lang,
+        target_lang,
+    )
+    for i, (src_kws, tgt_kws) in zip(matched_diffs, keywords):
+        diffs[i].source_exclusive_keywords = src_kws
+        diffs[i].target_exclusive_keywords = tgt_kws
+
     return diffs
 
 
@@ -334,7 +339,7 @@ def _compare_paragraphs_prototype(
     Matching follows the same greedy best-match strategy as _compare_paragraphs(),
     using the prototype's MIN_MATCH_THRESHOLD instead of the LaBSE threshold.
     """
-    from app.ai.translation import translate
+    from app.ai.translation import translate_many
 
     if not source_paragraphs and not target_paragraphs:
         return []
@@ -352,19 +357,11 @@ def _compare_paragraphs_prototype(
             for p in source_paragraphs
         ]
 
-    # Translate to English for prototype's English-only NLP tools.
-    # Run both sides concurrently to avoid serialising two slow MarianMT passes.
-    def _translate_batch(paragraphs: List[str], src: str) -> List[str]:
-        if src == "en":
-            return list(paragraphs)
-        with ThreadPoolExecutor() as executor:
-            return list(executor.map(lambda p: translate(p, src, "en"), paragraphs))
-
-    with ThreadPoolExecutor(max_workers=2) as pool:
-        src_future = pool.submit(_translate_batch, source_paragraphs, source_lang)
-        tgt_future = pool.submit(_translate_batch, target_paragraphs, target_lang)
-        source_en = src_future.result()
-        target_en = tgt_future.result()
+    # Translate to English for prototype's English-only NLP tools.  Each
+    # side is one plan on its language pair's translation worker, which
+    # batches the paragraphs and bounds concurrent generate calls.
+    source_en = translate_many(source_paragraphs, source_lang, "en")
+    target_en = translate_many(target_paragraphs, target_lang, "en")
 
     # Clean but keep index mapping to originals for display
     left_clean = [comparator.clean_sentence(p) for p in source_en]
@@ -469,6 +466,7 @@ def compare_article_sections(
     target_article: Article,
     similarity_threshold: float = SIMILARITY_THRESHOLD,
     model_name: str = "sentence-transformers/LaBSE",
+    alignment: Optional[str] = None,
 ) -> SectionCompareResponse:
     """
     Compare two structured Wikipedia articles at the section and paragraph level.
@@ -480,6 +478,8 @@ def compare_article_sections(
         model_name: Sentence-transformer model name.  Pass "similarity_prototype"
             to use the Phase 1/2/3 prototype for paragraph scoring; section
             structure matching will still use LaBSE (multilingual).
+        alignment: Section alignment strategy ("greedy", "optimal" or
+            "monotonic"); defaults to ALIGNMENT_STRATEGY.
 
     Returns:
         SectionCompareResponse with full structured diff.
@@ -518,19 +518,37 @@ def compare_article_sections(
         target_article.sections,
         model,
         similarity_threshold,
+        alignment=alignment or ALIGNMENT_STRATEGY,
     )
 
     section_diffs: List[SectionDiff] = []
     similarity_sum = 0.0
 
+    paragraph_pairs = [
+        (
+            _split_into_paragraphs(source_article.sections[src_idx]),
+            _split_into_paragraphs(target_article.sections[tgt_idx]),
+        )
+        for src_idx, tgt_idx, _ in matched_pairs
+    ]
+
+    # Embed the paragraphs of every matched pair in one batch rather than
+    # two small encode calls per pair.
+    pair_embeddings: List[Tuple[Optional[np.ndarray], Optional[np.ndarray]]]
+    if use_prototype and comparator is not None:
+        pair_embeddings = [(None, None)] * len(paragraph_pairs)
+    else:
+        groups = [group for pair in paragraph_pairs for group in pair]
+        embedded = _embed_text_groups(model, groups)
+        pair_embeddings = list(zip(embedded[0::2], embedded[1::2]))
+
     # 2. For matched section pairs, compare paragraphs
-    for src_idx, tgt_idx, section_score in matched_pairs:
+    for i, (src_idx, tgt_idx, section_score) in enumerate(matched_pairs):
+        source_paragraphs, target_paragraphs = paragraph_pairs[i]
+        source_embeddings, target_embeddings = pair_embeddings[i]
         source_section = source_article.sections[src_idx]
         target_section = target_article.sections[tgt_idx]
 
-        source_paragraphs = _split_into_paragraphs(source_section)
-        target_paragraphs = _split_into_paragraphs(target_section)
-
         if use_prototype and comparator is not None:
             paragraph_diffs = _compare_paragraphs_prototype(
                 source_paragraphs,
@@ -548,6 +566,8 @@ def compare_article_sections(
                 similarity_threshold,
                 source_lang=source_article.lang,
                 target_lang=target_article.lang,
+                source_embeddings=source_embeddings,
+                target_embeddings=target_embeddings,
             )
 
         section_diffs.append(
@@ -8,7 +8,16 @@ _nlp = None
 def _get_nlp():
     global _nlp
     if _nlp is None:
-        _nlp = spacy.load("en_core_web_sm")
+        try:
+            # Inside the backend, share the process-wide pipeline registry
+            from app.services.spacy_pipelines import get_pipeline
+        except ImportError:
+            # Running the prototype standalone; NER is not used here
+            _nlp = spacy.load("en_core_web_sm", exclude=["ner"])
+        else:
+            _nlp = get_pipeline("en", "syntax")
+            if _nlp is None:
+                raise OSError("spaCy model 'en_core_web_sm' is not installed")
     return _nlp
 
 class SyntaxParser:
@@ -0,0 +1,97 @@
+"""
+Single-flight request coalescing.
+
+When several callers ask for the same expensive result at the same time —
+the frontend firing ``/structured-article``, ``/citation-analysis`` and
+``/reference-analysis`` for one title, or two comparisons translating the
+same paragraph — only the first caller does the work; the others wait for
+and share its result (or its exception).  Nothing is remembered once the
+call finishes: caching is the job of the article store and LRU caches.
+
+``SingleFlight`` coalesces coroutines on an event loop; ``ThreadSingleFlight``
+coalesces blocking calls made from worker threads (model inference).
+"""
+
+import asyncio
+import hashlib
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def content_key(*parts: Any) -> str:
+    """Stable hash of job inputs (texts, language codes, options)."""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, (list, tuple)):
+            digest.update(content_key(*part).encode("ascii"))
+        else:
+            digest.update(repr(part).encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+class SingleFlight:
+    """Share one in-flight coroutine among concurrent awaiters of a key."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started = 0
+        self.shared = 0
+        self._inflight: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], Any] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+
+        task = self._inflight.get(flight_key)
+        if task is None:
+            # A task, not a bare coroutine, so that one waiter being cancelled
+            # (client disconnect) does not cancel the work for the others.
+            task = loop.create_task(fn())
+            self._inflight[flight_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(flight_key, None))
+            self.started += 1
+        else:
+            self.shared += 1
+
+        return await asyncio.shield(task)
+
+
+class ThreadSingleFlight:
+    """Share one in-flight blocking call among concurrent threads of a key."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started = 0
+        self.shared = 0
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+                self.started += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
@@ -0,0 +1,125 @@
+"""
+Process-wide registry of spaCy pipelines.
+
+Sentence splitting, keyword extraction and the prototype's syntax parser all
+need spaCy, but each only uses part of a trained pipeline.  Pipelines are
+loaded lazily, once per ``(language, profile)``, with the components the
+profile does not use excluded so they are neither loaded nor run:
+
+``sentences``
+    ``spacy.blank(language)`` plus the rule-based sentencizer.  Needs no
+    trained model, so it is cheap to load and works for every language spaCy
+    ships tokenizer rules for.
+``keywords``
+    Trained model without the dependency parser: tagging, lemmas and NER.
+``syntax``
+    Trained model without NER: tagging, lemmas and dependency parse.
+
+A pipeline that cannot be loaded is cached as ``None`` so callers fall back
+without retrying the load on every request.  Loaded pipelines count against
+the shared model memory budget (``services/model_manager.py``).
+"""
+
+import logging
+from typing import Dict, Optional, Tuple
+
+from app.services.model_manager import model_family
+
+logger = logging.getLogger(__name__)
+
+SPACY_MODEL_MAP: Dict[str, str] = {
+    "en": "en_core_web_sm",
+    "de": "de_core_news_sm",
+    "fr": "fr_core_news_sm",
+    "es": "es_core_news_sm",
+    "it": "it_core_news_sm",
+    "pt": "pt_core_news_sm",
+    "nl": "nl_core_news_sm",
+    "pl": "pl_core_news_sm",
+    "ru": "ru_core_news_sm",
+    "zh": "zh_core_web_sm",
+    "ja": "ja_core_news_sm",
+    "ca": "ca_core_news_sm",
+    "da": "da_core_news_sm",
+    "el": "el_core_news_sm",
+    "nb": "nb_core_news_sm",
+    "lt": "lt_core_news_sm",
+    "mk": "mk_core_news_sm",
+    "ro": "ro_core_news_sm",
+    "sl": "sl_core_news_sm",
+    "uk": "uk_core_news_sm",
+    "ko": "ko_core_news_sm",
+    "fi": "fi_core_news_sm",
+    "sv": "sv_core_news_sm",
+    "hr": "hr_core_news_sm",
+    "sk": "sk_core_news_sm",
+}
+
+# Trained components each profile leaves out.  Names a model does not have
+# are ignored by spacy.load.
+_PROFILE_EXCLUDES: Dict[str, Tuple[str, ...]] = {
+    "keywords": ("parser", "senter"),
+    "syntax": ("ner", "senter"),
+}
+PROFILES = ("sentences", *_PROFILE_EXCLUDES)
+
+_pipelines = model_family("spacy")
+
+
+def get_pipeline(language: str, profile: str = "keywords"):
+    """Return the cached *profile* pipeline for *language*, or None."""
+    if profile not in PROFILES:
+        raise ValueError(
+            f"Unknown spaCy profile {profile!r}; expected one of {', '.join(PROFILES)}"
+        )
+
+    return _pipelines.get(f"{language}/{profile}", lambda: _load(language, profile))
+
+
+def _load(language: str, profile: str):
+    import spacy  # noqa: PLC0415
+
+    if profile == "sentences":
+        try:
+            nlp = spacy.blank(language)
+        except Exception as exc:
+            logger.debug("No spaCy tokenizer for language '%s': %s", language, exc)
+            return None
+        nlp.add_pipe("sentencizer")
+        return nlp
+
+    model_name = SPACY_MODEL_MAP.get(language)
+    if not model_name:
+        logger.debug("No spaCy model registered for language '%s'", language)
+        return None
+
+    try:
+        nlp = spacy.load(model_name, exclude=list(_PROFILE_EXCLUDES[profile]))
+    except OSError:
+        logger.warning(
+            "spaCy model '%s' not installed. Run: python -m spacy download %s",
+            model_name,
+            model_name,
+        )
+        return None
+    except Exception as exc:
+        logger.error("Failed to load spaCy model '%s': %s", model_name, exc)
+        return None
+
+    logger.info(
+        "Loaded spaCy model %s (%s): %s", model_name, profile, ", ".join(nlp.pipe_names)
+    )
+    return nlp
+
+
+def split_sentences(text: str, language: str) -> Optional[list]:
+    """Sentences of *text* via the sentencizer, or None if unavailable."""
+    nlp = get_pipeline(language, "sentences")
+    if nlp is None:
+        return None
+    return [s.text.strip() for s in nlp(text).sents if s.text.strip()]
+
+
+def clear() -> None:
+    """Drop every loaded pipeline (tests)."""
+    _pipelines.clear()
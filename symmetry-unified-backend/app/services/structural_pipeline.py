@@ -0,0 +1,123 @@
+"""
+Shared source fetch for the structural-analysis analyzers.
+
+``/operations/{source_language}/{title}`` used to download the same
+``action=parse`` HTML once per analyzer (plus an existence check each) with
+blocking ``requests`` calls.  ``fetch_article_sources`` instead gathers every
+input the analyzers need for one (lang, title) in two concurrent API calls:
+
+- ``action=parse`` -> rendered HTML
+- ``action=query&prop=revisions|extlinks|images`` -> wikitext, links, images
+
+The HTML is parsed into a single BeautifulSoup tree that the table, header,
+infobox and citation analyzers all read from.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Dict, List
+
+import httpx
+from bs4 import BeautifulSoup
+from fastapi import HTTPException
+from starlette import status
+
+from app.services.wiki_http import wiki_api_url, wiki_get_json
+
+
+@dataclass
+class ArticleSources:
+    """Everything the structural analyzers need for one article."""
+
+    title: str
+    language: str
+    html: str
+    wikitext: str
+    extlinks: List[Dict[str, Any]] = field(default_factory=list)
+    images: List[Dict[str, Any]] = field(default_factory=list)
+
+    @cached_property
+    def soup(self) -> BeautifulSoup:
+        return BeautifulSoup(self.html, "html.parser")
+
+
+def _parse_params(title: str) -> dict:
+    return {
+        "action": "parse",
+        "page": title,
+        "format": "json",
+        "prop": "text",
+    }
+
+
+def _query_params(title: str) -> dict:
+    return {
+        "action": "query",
+        "titles": title,
+        "prop": "revisions|extlinks|images",
+        "rvprop": "content",
+        "rvslots": "main",
+        "ellimit": "max",
+        "imlimit": "max",
+        "format": "json",
+    }
+
+
+def _raise_for_api_error(data: dict) -> None:
+    error = data.get("error")
+    if not error:
+        return
+    if error.get("code") == "missingtitle":
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Page not found in language"
+        )
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=error.get("info", "Unknown API error"),
+    )
+
+
+async def fetch_article_sources(title: str, language: str) -> ArticleSources:
+    """Fetch parse HTML, wikitext, extlinks and images for one article."""
+    api_url = wiki_api_url(language)
+
+    try:
+        parse_data, query_data = await asyncio.gather(
+            wiki_get_json(api_url, _parse_params(title)),
+            wiki_get_json(api_url, _query_params(title)),
+        )
+    except httpx.HTTPError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)
+        )
+
+    _raise_for_api_error(query_data)
+    _raise_for_api_error(parse_data)
+
+    pages = query_data.get("query", {}).get("pages", {})
+    page_id = next(iter(pages.keys()), "-1")
+    page = pages.get(page_id, {})
+    if page_id == "-1" or "missing" in page:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Error: Page {title} not found in {language}",
+        )
+
+    try:
+        html = parse_data["parse"]["text"]["*"]
+        wikitext = page["revisions"][0]["slots"]["main"]["*"]
+    except (KeyError, IndexError, TypeError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Unexpected API response: missing {e}",
+        )
+
+    return ArticleSources(
+        title=title,
+        language=language,
+        html=html,
+        wikitext=wikitext,
+        extlinks=page.get("extlinks", []),
+        images=page.get("images", []),
+    )
@@ -2,7 +2,7 @@ from typing import List
 
 from app.models.wiki.structure import Article, Section
 from app.models.wiki.responses import StructuredArticleResponse
-from app.ai.translation import translate
+from app.ai.translation import translate_many
 
 
 def translate_article(
@@ -10,29 +10,35 @@ def translate_article(
 ) -> StructuredArticleResponse:
     """
     Translates an Article object and builds a StructuredArticleResponse.
-    """
 
-    translated_sections: List[Section] = []
+    The article title and every section's title, raw and clean content are
+    translated with one plan, so repeated strings run through the model once
+    and all segments share batched ``generate`` calls.
+    """
 
+    texts = [article.title]
     for section in article.sections:
-        translated_sections.append(
-            Section(
-                title=translate(section.title, source_lang, target_lang),
-                raw_content=translate(section.raw_content, source_lang, target_lang),
-                clean_content=translate(
-                    section.clean_content, source_lang, target_lang
-                ),
-                citations=section.citations,
-                citation_position=section.citation_position,
-            )
+        texts.extend((section.title, section.raw_content, section.clean_content))
+    translated = iter(translate_many(texts, source_lang, target_lang))
+
+    translated_title = next(translated)
+    translated_sections: List[Section] = [
+        Section(
+            title=next(translated),
+            raw_content=next(translated),
+            clean_content=next(translated),
+            citations=section.citations,
+            citation_position=section.citation_position,
         )
+        for section in article.sections
+    ]
 
     total_citations = sum(
         len(section.citations or []) for section in translated_sections
     )
 
     return StructuredArticleResponse(
-        title=translate(article.title, source_lang, target_lang),
+        title=translated_title,
         lang=target_lang,
         source=f"wikipedia+model({source_lang}->{target_lang})",
         sections=translated_sections,
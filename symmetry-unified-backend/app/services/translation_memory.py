@@ -0,0 +1,217 @@
+"""
+Persistent translation memory.
+
+Rows are keyed by ``(model, segment_key)`` where ``model`` names the model,
+backend and decoding settings and ``segment_key`` is the SHA-256 of one
+source sentence.  Translation looks up every sentence of a text separately,
+so section titles ("History", "References") and boilerplate sentences that
+recur across articles, even inside otherwise new paragraphs, are translated
+by MarianMT once and read back afterwards.
+
+Like the embedding cache this is one SQLite file in WAL mode shared by every
+worker process; the least recently read rows are evicted once the stored text
+exceeds ``max_bytes``.  Hits and misses are counted per process.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from time import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.core.settings import TRANSLATION_MEMORY_MAX_BYTES, TRANSLATION_MEMORY_PATH
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    model       TEXT    NOT NULL,
+    segment_key TEXT    NOT NULL,
+    translation TEXT    NOT NULL,
+    size_bytes  INTEGER NOT NULL,
+    accessed_at REAL    NOT NULL,
+    PRIMARY KEY (model, segment_key)
+);
+CREATE INDEX IF NOT EXISTS translations_accessed ON translations (accessed_at);
+"""
+
+# Keys per SELECT; stays well below SQLite's bound-parameter limit.
+_LOOKUP_BATCH = 500
+
+# After an eviction pass the memory is trimmed to this fraction of max_bytes.
+_EVICTION_LOW_WATERMARK = 0.9
+
+
+def segment_key(text: str) -> str:
+    """Content address of the source segment *text* (exact, not normalized)."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class TranslationMemoryStats:
+    segments: int
+    bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    hit_rate: float
+
+
+class TranslationMemory:
+    """SQLite-backed ``(model, segment) -> translation`` store with LRU eviction."""
+
+    def __init__(
+        self,
+        path: str = TRANSLATION_MEMORY_PATH,
+        max_bytes: int = TRANSLATION_MEMORY_MAX_BYTES,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+            logger.info("Opened translation memory at %s", self.path)
+        return self._conn
+
+    def get_many(self, model: str, keys: Iterable[str]) -> Dict[str, str]:
+        """Stored translations for *keys*; missing keys are omitted."""
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, str] = {}
+        if not keys:
+            return found
+
+        with self._lock:
+            conn = self._connection()
+            for start in range(0, len(keys), _LOOKUP_BATCH):
+                batch = keys[start : start + _LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = conn.execute(
+                    "SELECT segment_key, translation FROM translations "
+                    f"WHERE model = ? AND segment_key IN ({placeholders})",
+                    (model, *batch),
+                ).fetchall()
+                found.update(rows)
+            if found:
+                now = time()
+                conn.executemany(
+                    "UPDATE translations SET accessed_at = ? "
+                    "WHERE model = ? AND segment_key = ?",
+                    [(now, model, key) for key in found],
+                )
+                conn.commit()
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, model: str, items: List[Tuple[str, str]]) -> None:
+        """Store ``(key, translation)`` pairs for *model*."""
+        if not items:
+            return
+        now = time()
+        rows = [
+            (model, key, translation, len(translation.encode("utf-8")), now)
+            for key, translation in items
+        ]
+
+        with self._lock:
+            conn = self._connection()
+            conn.executemany(
+                "INSERT OR REPLACE INTO translations "
+                "(model, segment_key, translation, size_bytes, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._evict_locked(conn)
+            conn.commit()
+
+    def _evict_locked(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute(
+            "SELECT IFNULL(SUM(size_bytes), 0) FROM translations"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        target = int(self.max_bytes * _EVICTION_LOW_WATERMARK)
+        evicted = 0
+        for model, key, size in conn.execute(
+            "SELECT model, segment_key, size_bytes FROM translations "
+            "ORDER BY accessed_at"
+        ).fetchall():
+            if total <= target:
+                break
+            conn.execute(
+                "DELETE FROM translations WHERE model = ? AND segment_key = ?",
+                (model, key),
+            )
+            total -= size
+            evicted += 1
+
+        logger.info(
+            "Translation memory evicted %d segments (%d bytes kept)", evicted, total
+        )
+
+    def stats(self) -> TranslationMemoryStats:
+        with self._lock:
+            count, size = (
+                self._connection()
+                .execute(
+                    "SELECT COUNT(*), IFNULL(SUM(size_bytes), 0) FROM translations"
+                )
+                .fetchone()
+            )
+            lookups = self.hits + self.misses
+            return TranslationMemoryStats(
+                segments=count,
+                bytes=size,
+                max_bytes=self.max_bytes,
+                hits=self.hits,
+                misses=self.misses,
+                hit_rate=round(self.hits / lookups, 4) if lookups else 0.0,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM translations")
+            conn.commit()
+            self.hits = self.misses = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_memory: Optional[TranslationMemory] = None
+
+
+def get_translation_memory() -> TranslationMemory:
+    """Return the process-wide translation memory, opening it on first use."""
+    global _memory
+    if _memory is None:
+        _memory = TranslationMemory()
+    return _memory
+
+
+def set_translation_memory(memory: Optional[TranslationMemory]) -> None:
+    """Replace the process-wide translation memory (tests, alternative paths)."""
+    global _memory
+    if _memory is not None and _memory is not memory:
+        _memory.close()
+    _memory = memory
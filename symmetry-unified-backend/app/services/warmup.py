@@ -0,0 +1,139 @@
+"""
+Startup warm-up of the models the first requests need.
+
+Loading LaBSE, the MarianMT pairs and spaCy pipelines takes tens of seconds,
+and the first inference of each model sets up its graph lazily.  With
+``WARMUP_ENABLED`` the lifespan hook runs every step below in the background
+(one worker thread, one step at a time) while the API already answers:
+
+* the selected comparison model (``saved_models.selected`` in config.toml),
+* each pair in ``WARMUP_TRANSLATION_PAIRS``,
+* the sentence and keyword spaCy pipelines of ``WARMUP_SPACY_LANGUAGES``,
+
+each followed by one dummy inference.  ``/health/ready`` reports the
+progress and only succeeds once every step has finished.  A failed step is
+reported but does not block readiness: the model is then loaded on first use
+as before.
+"""
+
+import asyncio
+import logging
+from dataclasses import asdict, dataclass
+from time import monotonic
+from typing import Callable, List, Optional, Tuple
+
+from app.ai.model_backends import get_sentence_transformer
+from app.ai.translation import warm_up_translation
+from app.core.settings import WARMUP_SPACY_LANGUAGES, WARMUP_TRANSLATION_PAIRS
+from app.models.server import load_last_selected
+from app.services.section_comparison import _PROTOTYPE_SECTION_MODEL
+from app.services.spacy_pipelines import get_pipeline
+
+logger = logging.getLogger(__name__)
+
+_WARMUP_TEXT = "Warm-up sentence."
+
+
+@dataclass
+class WarmupStep:
+    name: str
+    status: str = "pending"  # pending | running | done | failed
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+class Warmup:
+    """Runs the warm-up steps once and reports their progress."""
+
+    def __init__(self, steps: List[Tuple[str, Callable[[], object]]]):
+        self._actions = [action for _, action in steps]
+        self.steps = [WarmupStep(name) for name, _ in steps]
+
+    @property
+    def ready(self) -> bool:
+        return all(step.status in ("done", "failed") for step in self.steps)
+
+    async def run(self) -> None:
+        for step, action in zip(self.steps, self._actions):
+            step.status = "running"
+            start = monotonic()
+            try:
+                await asyncio.to_thread(action)
+            except Exception as exc:
+                step.status = "failed"
+                step.error = str(exc)
+                logger.warning("Warm-up step %s failed: %s", step.name, exc)
+            else:
+                step.status = "done"
+            step.seconds = round(monotonic() - start, 3)
+            logger.info(
+                "Warm-up step %s: %s in %.1fs", step.name, step.status, step.seconds
+            )
+
+    def report(self) -> dict:
+        if not self.ready:
+            status = "warming_up"
+        elif any(step.status == "failed" for step in self.steps):
+            status = "degraded"
+        else:
+            status = "ready"
+        return {"status": status, "steps": [asdict(step) for step in self.steps]}
+
+
+def _split(setting: str) -> List[str]:
+    return [item.strip() for item in setting.split(",") if item.strip()]
+
+
+def _warm_comparison(model_name: str) -> None:
+    get_sentence_transformer(model_name).encode([_WARMUP_TEXT])
+
+
+def _warm_spacy(language: str) -> None:
+    for profile in ("sentences", "keywords"):
+        nlp = get_pipeline(language, profile)
+        if nlp is None and profile == "sentences":
+            raise RuntimeError(f"no spaCy tokenizer for {language!r}")
+        if nlp is not None:
+            nlp(_WARMUP_TEXT)
+
+
+def warmup_steps(
+    comparison_model: Optional[str],
+    translation_pairs: List[str],
+    spacy_languages: List[str],
+) -> List[Tuple[str, Callable[[], object]]]:
+    """``(name, action)`` for every model to preload."""
+    steps: List[Tuple[str, Callable[[], object]]] = []
+    if comparison_model:
+        if comparison_model == "similarity_prototype":
+            # The prototype scores paragraphs itself but matches sections
+            # with a sentence transformer.
+            comparison_model = _PROTOTYPE_SECTION_MODEL
+        steps.append(
+            (
+                f"comparison:{comparison_model}",
+                lambda: _warm_comparison(comparison_model),
+            )
+        )
+    for pair in translation_pairs:
+        source, _, target = pair.partition("-")
+        steps.append(
+            (
+                f"translation:{pair}",
+                lambda s=source, t=target: warm_up_translation(s, t),
+            )
+        )
+    for language in spacy_languages:
+        steps.append((f"spacy:{language}", lambda lang=language: _warm_spacy(lang)))
+    return steps
+
+
+def configured_warmup() -> Warmup:
+    """Warm-up of the selected comparison model and the configured models."""
+    return Warmup(
+        warmup_steps(
+            load_last_selected("comparison"),
+            _split(WARMUP_TRANSLATION_PAIRS),
+            _split(WARMUP_SPACY_LANGUAGES),
+        )
+    )
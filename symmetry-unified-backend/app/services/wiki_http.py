@@ -0,0 +1,164 @@
+"""
+Shared, application-lifetime HTTP clients for MediaWiki API traffic.
+
+Every fetcher used to open its own ``httpx.AsyncClient`` and therefore paid a
+fresh TCP + TLS handshake to ``*.wikipedia.org`` on each call.  This module
+keeps one pooled client per language host (HTTP/2 + keep-alive) and a
+per-host semaphore that caps concurrent requests to that host.
+
+The pool is opened and closed by the FastAPI lifespan hook in ``app.main``.
+When used outside the app (scripts, tests calling fetchers directly) clients
+are created lazily on first use.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from app.core.settings import (
+    WIKI_HTTP2,
+    WIKI_HTTP_KEEPALIVE_EXPIRY,
+    WIKI_HTTP_MAX_CONNECTIONS,
+    WIKI_HTTP_MAX_KEEPALIVE,
+    WIKI_HTTP_PER_HOST_CONCURRENCY,
+    WIKI_HTTP_TIMEOUT,
+)
+
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "SymmetryUnified/1.0"
+
+
+def wiki_api_url(lang: str) -> str:
+    """Return the MediaWiki Action API endpoint for a language edition."""
+    return f"https://{lang}.wikipedia.org/w/api.php"
+
+
+class WikiHttpPool:
+    """One pooled ``httpx.AsyncClient`` and concurrency cap per host."""
+
+    def __init__(
+        self,
+        max_connections: int = WIKI_HTTP_MAX_CONNECTIONS,
+        max_keepalive: int = WIKI_HTTP_MAX_KEEPALIVE,
+        keepalive_expiry: float = WIKI_HTTP_KEEPALIVE_EXPIRY,
+        per_host_concurrency: int = WIKI_HTTP_PER_HOST_CONCURRENCY,
+        timeout: float = WIKI_HTTP_TIMEOUT,
+        http2: bool = WIKI_HTTP2,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.per_host_concurrency = max(1, per_host_concurrency)
+        self.timeout = timeout
+        self.http2 = http2 and _HTTP2_AVAILABLE
+        self._transport = transport
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        if http2 and not _HTTP2_AVAILABLE:
+            logger.info("h2 not installed; MediaWiki client falls back to HTTP/1.1")
+
+    def _bind_loop(self) -> None:
+        # httpx clients and asyncio primitives belong to the loop that created
+        # them.  If we are now running on a different loop (e.g. a script that
+        # calls asyncio.run() twice) start from a clean slate.
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._clients:
+                logger.debug(
+                    "Event loop changed; discarding %d clients", len(self._clients)
+                )
+            self._clients = {}
+            self._semaphores = {}
+            self._loop = loop
+
+    def client_for(self, host: str) -> httpx.AsyncClient:
+        self._bind_loop()
+        client = self._clients.get(host)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                base_url=f"https://{host}",
+                http2=self.http2,
+                limits=self.limits,
+                timeout=self.timeout,
+                headers={"User-Agent": USER_AGENT},
+                transport=self._transport,
+            )
+            self._clients[host] = client
+            logger.info("Opened pooled MediaWiki client for %s", host)
+        return client
+
+    def semaphore_for(self, host: str) -> asyncio.Semaphore:
+        self._bind_loop()
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.per_host_concurrency)
+            self._semaphores[host] = semaphore
+        return semaphore
+
+    async def get_json(self, url: str, params: dict) -> dict:
+        """GET *url* through the pooled client for its host and decode JSON."""
+        host = urlparse(url).netloc
+        client = self.client_for(host)
+        async with self.semaphore_for(host):
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+            return response.json()
+
+    async def aclose(self) -> None:
+        clients, self._clients = self._clients, {}
+        owner_loop, self._loop = self._loop, None
+        self._semaphores = {}
+        if owner_loop is not asyncio.get_running_loop():
+            # Clients bound to a loop that is gone cannot be closed from here.
+            return
+        for client in clients.values():
+            await client.aclose()
+
+
+_pool: Optional[WikiHttpPool] = None
+
+
+def get_wiki_http_pool() -> WikiHttpPool:
+    """Return the process-wide pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        _pool = WikiHttpPool()
+    return _pool
+
+
+async def open_wiki_http_pool() -> WikiHttpPool:
+    """Create a fresh pool for the application lifetime (lifespan startup)."""
+    global _pool
+    if _pool is not None:
+        await _pool.aclose()
+    _pool = WikiHttpPool()
+    return _pool
+
+
+async def close_wiki_http_pool() -> None:
+    """Close every pooled client (lifespan shutdown)."""
+    global _pool
+    if _pool is not None:
+        await _pool.aclose()
+        _pool = None
+
+
+async def wiki_get_json(url: str, params: dict) -> dict:
+    """Fetch a MediaWiki API URL through the shared pool."""
+    return await get_wiki_http_pool().get_json(url, params)
@@ -1,9 +1,9 @@
+import asyncio
 from datetime import datetime
 from typing import Dict, List, Optional
 from urllib.parse import urlparse, unquote
 from app.models.revision import LagReport
-
-import httpx
+from app.services.wiki_http import wiki_api_url, wiki_get_json
 
 try:
     import pycountry
@@ -83,13 +83,8 @@ def validate_language_code(language_code: str) -> bool:
 
 
 async def page_exists(title: str, source_language: str = "en") -> bool:
-    api_url = f"https://{source_language}.wikipedia.org/w/api.php"
     params = {"action": "query", "page": title, "format": "json"}
-    headers = {"User-Agent": "SymmetryUnified/1.0"}
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(api_url, params=params, headers=headers)
-        response.raise_for_status()
-        data = response.json()
+    data = await wiki_get_json(wiki_api_url(source_language), params)
     pages = data.get("query", {}).get("pages", {})
     return "-1" not in pages
 
@@ -97,7 +92,6 @@ async def page_exists(title: str, source_language: str = "en") -> bool:
 async def get_translation(
     source_title: str, source_language: str, target_language: str
 ) -> Optional[str]:
-    url = f"https://{source_language}.wikipedia.org/w/api.php"
     params = {
         "action": "query",
         "titles": source_title,
@@ -105,12 +99,7 @@ async def get_translation(
         "lllimit": "500",
         "format": "json",
     }
-    headers = {"User-Agent": "SymmetryUnified/1.0"}
-
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(url, params=params, headers=headers)
-        response.raise_for_status()
-        data = response.json()
+    data = await wiki_get_json(wiki_api_url(source_language), params)
     pages = data.get("query", {}).get("pages", {})
 
     for page in pages.values():
@@ -122,7 +111,6 @@ async def get_translation(
 
 
 async def get_latest_revision_timestamp(title: str, lang: str) -> Optional[datetime]:
-    url = f"https://{lang}.wikipedia.org/w/api.php"
     params = {
         "action": "query",
         "titles": title,
@@ -131,12 +119,7 @@ async def get_latest_revision_timestamp(title: str, lang: str) -> Optional[datet
         "rvprop": "timestamp",
         "format": "json",
     }
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(
-            url, params=params, headers={"User-Agent": "SymmetryUnified/1.0"}
-        )
-        response.raise_for_status()
-        data = response.json()
+    data = await wiki_get_json(wiki_api_url(lang), params)
     pages = data.get("query", {}).get("pages", {})
     if not pages or "-1" in pages:
         return None
@@ -148,54 +131,185 @@ async def get_latest_revision_timestamp(title: str, lang: str) -> Optional[datet
     return datetime.fromisoformat(ts.replace("Z", "+00:00"))
 
 
-async def detect_language_lag(
-    title: str, source_lang: str, target_langs: List[str]
-) -> "List[LagReport]":
+# ---------------------------------------------------------------------------
+# Batched lag engine
+# ---------------------------------------------------------------------------
 
-    source_ts = await get_latest_revision_timestamp(title, source_lang)
-    reports: List[LagReport] = []
-
-    for lang in target_langs:
-        translated_title = await get_translation(title, source_lang, lang)
-
-        if translated_title is None:
-            reports.append(
-                LagReport(
-                    lang=lang,
-                    title=None,
-                    source_last_updated=source_ts,
-                    target_last_updated=None,
-                    days_behind=None,
-                    is_lagging=True,
-                )
-            )
-            continue
-
-        target_ts = await get_latest_revision_timestamp(translated_title, lang)
-
-        if source_ts is None or target_ts is None:
-            reports.append(
-                LagReport(
-                    lang=lang,
-                    title=translated_title,
-                    source_last_updated=source_ts,
-                    target_last_updated=target_ts,
-                    days_behind=None,
-                    is_lagging=True,
-                )
-            )
-            continue
-
-        days_behind = (source_ts - target_ts).total_seconds() / 86400
-        reports.append(
-            LagReport(
-                lang=lang,
-                title=translated_title,
-                source_last_updated=source_ts,
-                target_last_updated=target_ts,
-                days_behind=round(days_behind, 2),
-                is_lagging=days_behind > 0,
-            )
+# MediaWiki caps ``titles=`` at 50 values per request for non-bot clients.
+_MAX_TITLES_PER_QUERY = 50
+
+
+def _chunked(items: List[str], size: int = _MAX_TITLES_PER_QUERY) -> List[List[str]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _latest_timestamp(page: dict) -> Optional[datetime]:
+    stamps = [r["timestamp"] for r in page.get("revisions", []) if r.get("timestamp")]
+    if not stamps:
+        return None
+    return datetime.fromisoformat(max(stamps).replace("Z", "+00:00"))
+
+
+async def _query_pages(lang: str, titles: List[str], params: dict) -> Dict[str, dict]:
+    """Run one multi-title ``prop=`` query and return page data keyed by input title.
+
+    Follows ``continue`` until the batch is complete (``langlinks`` for 50
+    pages easily exceeds one response) and merges list-valued props across
+    continuations.  Titles the API normalizes (underscores, first-letter case)
+    are mapped back to the caller's spelling; unknown titles map to a page
+    carrying the ``missing`` key.
+    """
+    base = {"action": "query", "titles": "|".join(titles), "format": "json", **params}
+    normalized: Dict[str, str] = {}
+    pages_by_title: Dict[str, dict] = {}
+    continuation: dict = {}
+
+    while True:
+        data = await wiki_get_json(wiki_api_url(lang), {**base, **continuation})
+        query = data.get("query", {})
+        for entry in query.get("normalized", []):
+            normalized[entry["from"]] = entry["to"]
+        for page in query.get("pages", {}).values():
+            merged = pages_by_title.setdefault(page.get("title", ""), {})
+            for key, value in page.items():
+                if isinstance(value, list):
+                    merged.setdefault(key, []).extend(value)
+                else:
+                    merged[key] = value
+        continuation = data.get("continue")
+        if not continuation:
+            break
+
+    return {
+        title: pages_by_title.get(normalized.get(title, title), {"missing": ""})
+        for title in titles
+    }
+
+
+async def _query_pages_chunked(
+    lang: str, titles: List[str], params: dict
+) -> Dict[str, dict]:
+    """``_query_pages`` over any number of titles, one request per 50 in parallel."""
+    chunks = await asyncio.gather(
+        *(_query_pages(lang, chunk, params) for chunk in _chunked(titles))
+    )
+    merged: Dict[str, dict] = {}
+    for chunk in chunks:
+        merged.update(chunk)
+    return merged
+
+
+async def get_latest_revision_timestamps(
+    titles: List[str], lang: str
+) -> Dict[str, Optional[datetime]]:
+    """Latest revision timestamp for many titles on one wiki."""
+    if not titles:
+        return {}
+    pages = await _query_pages_chunked(
+        lang, titles, {"prop": "revisions", "rvprop": "timestamp"}
+    )
+    return {title: _latest_timestamp(page) for title, page in pages.items()}
+
+
+async def get_latest_revids(titles: List[str], lang: str) -> Dict[str, Optional[int]]:
+    """Current ``lastrevid`` for many titles on one wiki (``None`` if missing).
+
+    A ``prop=info`` probe is a few hundred bytes per title, against the
+    hundreds of kilobytes of a full ``action=parse``.
+    """
+    if not titles:
+        return {}
+    pages = await _query_pages_chunked(lang, titles, {"prop": "info"})
+    return {title: page.get("lastrevid") for title, page in pages.items()}
+
+
+def _lag_report(
+    lang: str,
+    translated_title: Optional[str],
+    source_ts: Optional[datetime],
+    target_ts: Optional[datetime],
+) -> LagReport:
+    if translated_title is None or source_ts is None or target_ts is None:
+        return LagReport(
+            lang=lang,
+            title=translated_title,
+            source_last_updated=source_ts,
+            target_last_updated=target_ts,
+            days_behind=None,
+            is_lagging=True,
         )
 
+    days_behind = (source_ts - target_ts).total_seconds() / 86400
+    return LagReport(
+        lang=lang,
+        title=translated_title,
+        source_last_updated=source_ts,
+        target_last_updated=target_ts,
+        days_behind=round(days_behind, 2),
+        is_lagging=days_behind > 0,
+    )
+
+
+async def detect_language_lag_batch(
+    titles: List[str], source_lang: str, target_langs: List[str]
+) -> "Dict[str, List[LagReport]]":
+    """Lag reports for many source titles against many target languages.
+
+    Round trips: one ``langlinks|revisions`` query per 50 source titles (which
+    also yields the source timestamps), then one ``revisions`` query per 50
+    translated titles per target wiki — all wikis queried concurrently.
+    """
+    titles = list(dict.fromkeys(titles))
+    if not titles:
+        return {}
+
+    source_pages = await _query_pages_chunked(
+        source_lang,
+        titles,
+        {"prop": "langlinks|revisions", "rvprop": "timestamp", "lllimit": "max"},
+    )
+
+    source_ts: Dict[str, Optional[datetime]] = {}
+    translations: Dict[str, Dict[str, str]] = {}
+    for title, page in source_pages.items():
+        source_ts[title] = _latest_timestamp(page)
+        translations[title] = {
+            link["lang"]: link["*"]
+            for link in page.get("langlinks", [])
+            if link.get("lang") in target_langs
+        }
+
+    targets = list(dict.fromkeys(target_langs))
+    titles_by_lang = {
+        lang: list(dict.fromkeys(t[lang] for t in translations.values() if lang in t))
+        for lang in targets
+    }
+    target_results = await asyncio.gather(
+        *(
+            get_latest_revision_timestamps(titles_by_lang[lang], lang)
+            for lang in targets
+        )
+    )
+    target_ts = dict(zip(targets, target_results))
+
+    reports: Dict[str, List[LagReport]] = {}
+    for title in titles:
+        reports[title] = []
+        for lang in target_langs:
+            translated_title = translations[title].get(lang)
+            reports[title].append(
+                _lag_report(
+                    lang,
+                    translated_title,
+                    source_ts[title],
+                    target_ts[lang].get(translated_title) if translated_title else None,
+                )
+            )
     return reports
+
+
+async def detect_language_lag(
+    title: str, source_lang: str, target_langs: List[str]
+) -> "List[LagReport]":
+    reports = await detect_language_lag_batch([title], source_lang, target_langs)
+    return reports[title]
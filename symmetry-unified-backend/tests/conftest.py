@@ -11,6 +11,42 @@ def client():
         yield test_client
 
 
+@pytest.fixture(autouse=True)
+def article_store(tmp_path):
+    """Give every test its own empty on-disk article store"""
+    from app.services.article_store import ArticleStore, set_article_store
+
+    store = ArticleStore(path=str(tmp_path / "article_store.sqlite3"))
+    set_article_store(store)
+    yield store
+    set_article_store(None)
+
+
+@pytest.fixture(autouse=True)
+def embedding_store(tmp_path):
+    """Give every test its own empty on-disk embedding cache"""
+    from app.services.embedding_store import EmbeddingStore, set_embedding_store
+
+    store = EmbeddingStore(path=str(tmp_path / "embeddings.sqlite3"))
+    set_embedding_store(store)
+    yield store
+    set_embedding_store(None)
+
+
+@pytest.fixture(autouse=True)
+def translation_memory(tmp_path):
+    """Give every test its own empty on-disk translation memory"""
+    from app.services.translation_memory import (
+        TranslationMemory,
+        set_translation_memory,
+    )
+
+    memory = TranslationMemory(path=str(tmp_path / "translation_memory.sqlite3"))
+    set_translation_memory(memory)
+    yield memory
+    set_translation_memory(None)
+
+
 @pytest.fixture
 def mock_wikipedia_page():
     """Mock Wikipedia page object"""
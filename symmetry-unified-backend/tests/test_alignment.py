@@ -0,0 +1,164 @@
+"""Unit tests for the section/sentence alignment strategies."""
+
+import itertools
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.services.alignment import ALIGNMENT_STRATEGIES, align
+
+pytestmark = pytest.mark.unit
+
+
+def _loop_greedy(sim, threshold):
+    """The previous pure-Python best-pair-first matcher."""
+    pairs, used_rows, used_cols = [], set(), set()
+    for flat_idx in np.argsort(-sim, axis=None, kind="stable"):
+        r, c = divmod(int(flat_idx), sim.shape[1])
+        if sim[r, c] < threshold:
+            break
+        if r in used_rows or c in used_cols:
+            continue
+        pairs.append((r, c, float(sim[r, c])))
+        used_rows.add(r)
+        used_cols.add(c)
+    return pairs
+
+
+def _all_matchings(n, m):
+    """Every partial one-to-one matching of an n x m matrix."""
+    for k in range(min(n, m) + 1):
+        for rows in itertools.combinations(range(n), k):
+            for cols in itertools.permutations(range(m), k):
+                yield list(zip(rows, cols))
+
+
+def _total(pairs):
+    return sum(score for _, _, score in pairs)
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(7)
+
+
+class TestGreedy:
+    def test_matches_loop_implementation(self, rng):
+        for shape in [(1, 1), (4, 9), (30, 20)]:
+            sim = np.round(rng.random(shape), 2)
+
+            assert align(sim, 0.4) == _loop_greedy(sim, 0.4)
+
+    def test_best_pair_first(self):
+        sim = np.array([[0.8, 0.9], [0.1, 0.85]])
+
+        assert align(sim, 0.5) == [(0, 1, 0.9)]
+
+
+class TestOptimal:
+    def test_beats_greedy_on_conflicts(self):
+        sim = np.array([[0.8, 0.9], [0.1, 0.85]])
+
+        assert align(sim, 0.5, "optimal") == [(0, 0, 0.8), (1, 1, 0.85)]
+
+    def test_is_maximal(self, rng):
+        for shape in [(3, 3), (2, 4), (4, 3)]:
+            sim = rng.random(shape)
+            threshold = 0.3
+            best = max(
+                _all_matchings(*shape),
+                key=lambda m: (
+                    sum(sim[r, c] >= threshold for r, c in m),
+                    sum(sim[r, c] for r, c in m if sim[r, c] >= threshold),
+                ),
+            )
+            pairs = align(sim, threshold, "optimal")
+
+            assert len(pairs) == sum(sim[r, c] >= threshold for r, c in best)
+            assert _total(pairs) == pytest.approx(
+                sum(sim[r, c] for r, c in best if sim[r, c] >= threshold)
+            )
+
+
+class TestMonotonic:
+    def test_pairs_never_cross(self):
+        # The swapped pair (0, 2)/(2, 0) scores highest but would cross.
+        sim = np.array(
+            [
+                [0.7, 0.0, 0.95],
+                [0.0, 0.9, 0.0],
+                [0.95, 0.0, 0.7],
+            ]
+        )
+
+        pairs = align(sim, 0.5, "monotonic")
+
+        assert pairs == [(0, 0, 0.7), (1, 1, 0.9), (2, 2, 0.7)]
+
+    def test_is_best_order_preserving_alignment(self, rng):
+        for shape in [(3, 4), (4, 4), (5, 3)]:
+            sim = rng.random(shape)
+            best = max(
+                _total([(r, c, sim[r, c]) for r, c in m if sim[r, c] >= 0.3])
+                for m in _all_matchings(*shape)
+                if all(r1 < r2 and c1 < c2 for (r1, c1), (r2, c2) in zip(m, m[1:]))
+                and all(sim[r, c] >= 0.3 for r, c in m)
+            )
+
+            assert _total(align(sim, 0.3, "monotonic")) == pytest.approx(best)
+
+    def test_band_limits_distance_from_diagonal(self):
+        sim = np.full((4, 4), 0.1)
+        sim[0, 3] = 0.99
+        sim[1, 1] = 0.55
+
+        assert align(sim, 0.5, "monotonic") == [(0, 3, 0.99)]
+        assert align(sim, 0.5, "monotonic", band=1) == [(1, 1, 0.55)]
+
+
+@pytest.mark.parametrize("strategy", ALIGNMENT_STRATEGIES)
+def test_threshold_and_empty_inputs(strategy):
+    assert align(np.zeros((0, 3)), 0.5, strategy) == []
+    assert align(np.full((2, 2), 0.2), 0.5, strategy) == []
+
+
+def test_unknown_strategy_is_rejected():
+    with pytest.raises(ValueError):
+        align(np.eye(2), 0.5, "random")
+
+
+def test_unknown_configured_strategy_fails_at_startup():
+    result = subprocess.run(
+        [sys.executable, "-c", "import app.core.settings"],
+        cwd=Path(__file__).resolve().parents[1],
+        env={**os.environ, "ALIGNMENT_STRATEGY": "random"},
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode != 0
+    assert "Unknown ALIGNMENT_STRATEGY 'random'" in result.stderr
+
+
+@pytest.mark.slow
+def test_greedy_is_faster_than_python_loop():
+    """Article-like matrix: low background similarity, strong true pairs."""
+    rng = np.random.default_rng(0)
+    sim = np.clip(rng.normal(0.3, 0.1, (400, 400)) + np.eye(400) * 0.5, 0, 1)
+    sim = sim[:, rng.permutation(400)]
+
+    start = time.perf_counter()
+    _loop_greedy(sim, 0.5)
+    loop_time = time.perf_counter() - start
+    start = time.perf_counter()
+    align(sim, 0.5)
+    numpy_time = time.perf_counter() - start
+
+    assert (
+        numpy_time * 3 < loop_time
+    ), f"loop {loop_time * 1000:.1f} ms, numpy {numpy_time * 1000:.1f} ms"
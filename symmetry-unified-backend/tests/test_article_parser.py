@@ -0,0 +1,133 @@
+"""Unit tests for the article HTML parser engines.
+
+Parses ``tests/data/article_sample.html``, a trimmed copy of MediaWiki parser
+output that keeps the markup quirks the engines have to agree on (inline
+TemplateStyles, ruby text, comments, empty links, reference backlinks).
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from app.models.wiki.structure import Reference, Section
+from app.services import article_parser
+from app.services.article_parser import _parse_article_html, iter_article_html
+
+pytestmark = pytest.mark.unit
+
+SAMPLE_HTML = (Path(__file__).parent / "data" / "article_sample.html").read_text(
+    encoding="utf-8"
+)
+
+ENGINES = ["lxml", "html.parser"]
+
+
+def _parse(html, engine):
+    return _parse_article_html(html, "MissingNo.", "en", "action_api", engine=engine)
+
+
+class TestParserEngines:
+    def test_engines_produce_identical_articles(self):
+        lxml_article = _parse(SAMPLE_HTML, "lxml")
+        bs4_article = _parse(SAMPLE_HTML, "html.parser")
+
+        assert lxml_article == bs4_article
+
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_sections(self, engine):
+        article = _parse(SAMPLE_HTML, engine)
+
+        assert [s.title for s in article.sections] == [
+            "Lead section",
+            "History",
+            "Development(1996)",
+            "Reception",
+        ]
+        lead = article.sections[0]
+        assert lead.clean_content.startswith("MissingNo. ( けつばん , Ketsuban )")
+        assert "[1]" in lead.raw_content and "[1]" not in lead.clean_content
+        assert "see talk page" not in lead.clean_content
+
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_citations_and_positions(self, engine):
+        history = _parse(SAMPLE_HTML, engine).sections[1]
+
+        assert [c.label for c in history.citations] == ["Game Freak", "Satoshi Tajiri"]
+        assert history.citations[0].url == "https://en.wikipedia.org/wiki/Game_Freak"
+        assert history.citation_position == ["Game Freak:1", "Satoshi Tajiri:63"]
+        assert "kan" not in history.clean_content
+
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_references(self, engine):
+        references = _parse(SAMPLE_HTML, engine).references
+
+        assert [r.id for r in references] == [
+            "cite_note-1",
+            "cite_note-IGNguide-2",
+            "cite_note-3",
+            None,
+            "cite_note-note-a",
+        ]
+        assert references[0].label == '" MissingNo. explained ". IGN . 2008.'
+        assert references[0].url == "https://www.ign.com/articles/missingno"
+        assert references[1].url is None
+        assert references[3].url == "http://archive.example.org/x"
+        assert all("^" not in r.label for r in references)
+
+    @pytest.mark.parametrize("engine", ENGINES)
+    @pytest.mark.parametrize("html", ["", "   ", "<!-- nothing -->"])
+    def test_empty_documents(self, engine, html):
+        article = _parse(html, engine)
+
+        assert article.sections == []
+        assert article.references == []
+
+    def test_unknown_engine_is_rejected(self):
+        with pytest.raises(ValueError):
+            _parse(SAMPLE_HTML, "regex")
+
+
+class TestIncrementalParsing:
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_sections_then_references(self, engine):
+        items = list(iter_article_html(SAMPLE_HTML, "en", engine))
+        article = _parse(SAMPLE_HTML, engine)
+
+        assert items == article.sections + article.references
+        assert all(isinstance(i, Section) for i in items[:4])
+        assert all(isinstance(i, Reference) for i in items[4:])
+
+    @pytest.mark.parametrize("chunk_chars", [1, 13, 4096])
+    def test_chunk_boundaries_do_not_change_output(self, chunk_chars, monkeypatch):
+        monkeypatch.setattr(article_parser, "_PARSE_CHUNK_CHARS", chunk_chars)
+
+        assert _parse(SAMPLE_HTML, "lxml") == _parse(SAMPLE_HTML, "html.parser")
+
+    def test_sections_are_yielded_one_at_a_time(self):
+        items = iter_article_html(SAMPLE_HTML, "en", "lxml")
+
+        assert next(items).title == "Lead section"
+        assert next(items).title == "History"
+
+
+@pytest.mark.slow
+class TestParserBenchmark:
+    def test_lxml_engine_is_faster_on_long_articles(self):
+        """Parse a long article (the fixture repeated) with both engines."""
+        html = SAMPLE_HTML * 40
+
+        def best_of(engine, runs=3):
+            timings = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                _parse(html, engine)
+                timings.append(time.perf_counter() - start)
+            return min(timings)
+
+        bs4_time = best_of("html.parser")
+        lxml_time = best_of("lxml")
+
+        assert (
+            lxml_time * 3 < bs4_time
+        ), f"html.parser {bs4_time * 1000:.1f} ms, lxml {lxml_time * 1000:.1f} ms"
@@ -0,0 +1,210 @@
+"""Unit tests for the persistent article store and the fetchers reading it.
+
+All tests are offline — the MediaWiki API is patched.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.models.wiki.structure import Article, Section
+from app.services import article_parser, wiki_utils
+from app.services.article_parser import (
+    article_fetcher,
+    revalidate_titles,
+    revision_fetcher,
+)
+from app.services.article_store import ArticleStore
+
+pytestmark = pytest.mark.unit
+
+HTML = "<h2>History</h2><p>Some history text.</p>"
+
+
+def _article(title="Python", text="Some text.") -> Article:
+    return Article(
+        title=title,
+        lang="en",
+        source="action_api",
+        sections=[Section(title="Lead section", raw_content=text, clean_content=text)],
+        references=[],
+    )
+
+
+def _parse_response(revid=100, title="Python", html=HTML):
+    return {"parse": {"title": title, "revid": revid, "text": {"*": html}}}
+
+
+class TestArticleStore:
+    def test_revision_round_trip(self, article_store):
+        article_store.put_revision("en", 100, "Python", HTML, _article())
+
+        stored = article_store.get_revision("en", 100)
+        assert stored.title == "Python"
+        assert stored.html == HTML
+        assert stored.article == _article()
+        assert article_store.get_revision("fr", 100) is None
+
+    def test_title_pointer_follows_new_revision(self, article_store):
+        article_store.put_revision("en", 100, "Python", HTML, _article(text="old"))
+        article_store.set_latest("en", "Python", 100)
+        article_store.put_revision("en", 101, "Python", HTML, _article(text="new"))
+        article_store.set_latest("en", "Python", 101)
+
+        latest = article_store.get_latest("en", "Python")
+        assert latest.revid == 101
+        assert latest.article.sections[0].clean_content == "new"
+        # the superseded revision is still addressable by revid
+        assert article_store.get_revision("en", 100) is not None
+
+    def test_title_lookup_normalizes_underscores(self, article_store):
+        article_store.put_revision("en", 5, "Ada Lovelace", HTML, _article())
+        article_store.set_latest("en", "Ada_Lovelace", 5)
+        assert article_store.get_latest("en", "Ada Lovelace").revid == 5
+
+    def test_title_pointer_expires(self, article_store):
+        article_store.put_revision("en", 100, "Python", HTML, _article())
+        article_store.set_latest("en", "Python", 100)
+        assert article_store.get_latest("en", "Python", max_age=-1) is None
+
+    def test_partial_writes_merge(self, article_store):
+        article_store.put_revision("en", 7, "Python", extract="Text", languages=["fr"])
+        article_store.put_revision("en", 7, "Python", HTML, _article())
+
+        stored = article_store.get_revision("en", 7)
+        assert stored.extract == "Text"
+        assert stored.languages == ["fr"]
+        assert stored.article is not None
+
+    def test_evicts_least_recently_read(self, tmp_path):
+        # ~3.3 KB compressed each: two fit, the third forces an eviction
+        store = ArticleStore(path=str(tmp_path / "small.sqlite3"), max_bytes=8_000)
+        payload = "".join(chr(0x4E00 + (i * 7919) % 20000) for i in range(1500))
+
+        store.put_revision("en", 1, "A", payload)
+        store.set_latest("en", "A", 1)
+        store.put_revision("en", 2, "B", payload)
+        store.get_revision("en", 1)  # A is now more recent than B
+        store.put_revision("en", 3, "C", payload)
+
+        assert store.stats()["bytes"] <= 8_000
+        assert store.get_revision("en", 2) is None
+        assert store.get_revision("en", 3) is not None
+        store.close()
+
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "shared.sqlite3")
+        first = ArticleStore(path=path)
+        first.put_revision("en", 100, "Python", HTML, _article())
+        first.set_latest("en", "Python", 100)
+        first.close()
+
+        second = ArticleStore(path=path)
+        assert second.get_latest("en", "Python").revid == 100
+        second.close()
+
+
+class TestFetchersUseStore:
+    def test_article_fetcher_reads_through_store(self, article_store):
+        fetch = AsyncMock(return_value=_parse_response())
+        with patch.object(article_parser, "_fetch_wikipedia_json", new=fetch):
+            first = asyncio.run(article_fetcher("Python", "en"))
+            second = asyncio.run(article_fetcher("Python", "en"))
+
+        assert fetch.await_count == 1
+        assert first == second
+        assert article_store.get_latest("en", "Python").revid == 100
+
+    def test_revision_fetcher_shares_rows_with_article_fetcher(self):
+        fetch = AsyncMock(return_value=_parse_response(revid=100))
+        with patch.object(article_parser, "_fetch_wikipedia_json", new=fetch):
+            latest = asyncio.run(article_fetcher("Python", "en"))
+            revision = asyncio.run(revision_fetcher(100, "en"))
+
+        assert fetch.await_count == 1
+        assert revision.source == "revision:100"
+        assert revision.sections == latest.sections
+
+    def test_missing_page_is_not_stored(self, article_store):
+        fetch = AsyncMock(return_value={"error": {"code": "missingtitle"}})
+        with patch.object(article_parser, "_fetch_wikipedia_json", new=fetch):
+            article = asyncio.run(article_fetcher("Nope", "en"))
+
+        assert article.sections == []
+        assert article_store.stats()["revisions"] == 0
+
+
+def _info_probe(lastrevids):
+    """Fake ``prop=info`` responses: title -> current lastrevid."""
+    calls = []
+
+    async def fake_get_json(url, params):
+        assert params["prop"] == "info"
+        titles = params["titles"].split("|")
+        calls.append(titles)
+        pages = {
+            str(i): {"title": t, "lastrevid": lastrevids[t]}
+            for i, t in enumerate(titles)
+        }
+        return {"query": {"pages": pages}}
+
+    return fake_get_json, calls
+
+
+class TestRevalidation:
+    def _seed(self, store, title, revid):
+        store.put_revision("en", revid, title, HTML, _article(title=title))
+        store.set_latest("en", title, revid)
+
+    def test_unchanged_revision_skips_parse(self, article_store):
+        self._seed(article_store, "Python", 100)
+        article_store.title_ttl = -1  # every stored title needs revalidation
+        probe, calls = _info_probe({"Python": 100})
+        parse = AsyncMock(return_value=_parse_response(revid=100))
+
+        with patch.object(wiki_utils, "wiki_get_json", new=probe), patch.object(
+            article_parser, "_fetch_wikipedia_json", new=parse
+        ):
+            article = asyncio.run(article_fetcher("Python", "en"))
+
+        assert calls == [["Python"]]
+        parse.assert_not_awaited()
+        assert article.title == "Python"
+
+    def test_changed_revision_triggers_parse(self, article_store):
+        self._seed(article_store, "Python", 100)
+        article_store.title_ttl = -1
+        probe, _ = _info_probe({"Python": 101})
+        parse = AsyncMock(return_value=_parse_response(revid=101))
+
+        with patch.object(wiki_utils, "wiki_get_json", new=probe), patch.object(
+            article_parser, "_fetch_wikipedia_json", new=parse
+        ):
+            asyncio.run(article_fetcher("Python", "en"))
+
+        parse.assert_awaited_once()
+        assert article_store.latest_revid("en", "Python")[0] == 101
+
+    def test_fresh_title_is_not_probed(self, article_store):
+        self._seed(article_store, "Python", 100)
+        probe, calls = _info_probe({"Python": 100})
+
+        with patch.object(wiki_utils, "wiki_get_json", new=probe):
+            asyncio.run(article_fetcher("Python", "en"))
+
+        assert calls == []
+
+    def test_batch_probe_for_many_titles(self, article_store):
+        for i, title in enumerate(["A", "B", "C"]):
+            self._seed(article_store, title, 10 + i)
+        before = article_store.latest_revid("en", "A")[1]
+        probe, calls = _info_probe({"A": 10, "B": 99, "C": 12})
+
+        with patch.object(wiki_utils, "wiki_get_json", new=probe):
+            result = asyncio.run(revalidate_titles(["A", "B", "C", "Unknown"], "en"))
+
+        assert len(calls) == 1
+        assert sorted(calls[0]) == ["A", "B", "C"]
+        assert result == {"A": True, "B": False, "C": True, "Unknown": False}
+        assert article_store.latest_revid("en", "A")[1] >= before
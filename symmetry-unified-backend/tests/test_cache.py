@@ -0,0 +1,100 @@
+"""Unit tests for the byte-accounted LRU cache."""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.models import Section
+from app.services import cache as cache_module
+from app.services.cache import LRUCache, cache_stats, deep_sizeof
+
+pytestmark = pytest.mark.unit
+
+
+def _cache(**kwargs) -> LRUCache:
+    options = {"max_entries": 100, "max_bytes": 10_000_000}
+    options.update(kwargs)
+    return LRUCache("test", **options)
+
+
+class TestDeepSizeof:
+    def test_measures_nested_content(self):
+        small = {"content": "x", "languages": []}
+        big = {"content": "x" * 100_000, "languages": ["fr"] * 100}
+        assert deep_sizeof(big) - deep_sizeof(small) > 100_000
+
+    def test_measures_model_fields(self):
+        short = Section(title="t", raw_content="a", clean_content="a")
+        long = Section(title="t", raw_content="a" * 50_000, clean_content="b" * 50_000)
+        assert deep_sizeof(long) - deep_sizeof(short) > 100_000
+
+
+class TestLRUCache:
+    def test_hit_and_miss_counters(self):
+        cache = _cache()
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+    def test_evicts_least_recently_used_by_count(self):
+        cache = _cache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "b" not in cache
+        assert "a" in cache and "c" in cache
+        assert cache.stats().evictions == 1
+
+    def test_evicts_by_bytes(self):
+        cache = _cache(max_bytes=250_000)
+        for key in "abc":
+            cache.set(key, "x" * 100_000)
+
+        assert len(cache) == 2
+        assert "a" not in cache
+        assert cache.current_bytes <= 250_000
+
+    def test_replacing_a_key_updates_byte_total(self):
+        cache = _cache()
+        cache.set("a", "x" * 100_000)
+        cache.set("a", "x")
+        assert cache.current_bytes == deep_sizeof("x")
+
+    def test_oversized_value_is_not_cached(self):
+        cache = _cache(max_bytes=1_000)
+        cache.set("a", "x" * 10_000)
+        assert "a" not in cache
+        assert cache.current_bytes == 0
+
+    def test_ttl_expiry(self):
+        cache = _cache(ttl=10)
+        with patch.object(cache_module, "monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch.object(cache_module, "monotonic", return_value=105.0):
+            assert cache.get("a") == 1
+        with patch.object(cache_module, "monotonic", return_value=111.0):
+            assert cache.get("a") is None
+
+        stats = cache.stats()
+        assert stats.expirations == 1
+        assert stats.entries == 0
+
+    def test_registered_for_stats(self):
+        _cache()
+        assert "test" in {stats.name for stats in cache_stats()}
+
+
+class TestCacheStatsEndpoint:
+    def test_reports_caches_and_store(self, client):
+        response = client.get("/symmetry/v1/wiki/cache-stats")
+
+        assert response.status_code == 200
+        data = response.json()
+        names = {c["name"] for c in data["caches"]}
+        assert {"articles", "structured_articles"} <= names
+        assert data["article_store"]["revisions"] == 0
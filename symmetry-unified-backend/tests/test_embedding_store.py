@@ -0,0 +1,130 @@
+"""Unit tests for the persistent embedding cache and ``encode`` reading it."""
+
+import numpy as np
+import pytest
+
+from app.ai.embeddings import encode, register_model
+from app.services.embedding_store import EmbeddingStore, text_key
+
+pytestmark = pytest.mark.unit
+
+
+class FakeModel:
+    """Deterministic stand-in for a SentenceTransformer."""
+
+    def __init__(self, dim=4):
+        self.dim = dim
+        self.calls = []
+
+    def encode(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        return np.array(
+            [[len(t) + i for i in range(self.dim)] for t in texts], dtype=np.float32
+        )
+
+
+def _vec(*values):
+    return np.array(values, dtype=np.float32)
+
+
+class TestEmbeddingStore:
+    def test_round_trip(self, embedding_store):
+        embedding_store.put_many("m", [("a", _vec(1, 2, 3)), ("b", _vec(4, 5, 6))])
+
+        found = embedding_store.get_many("m", ["a", "b", "c"])
+
+        assert set(found) == {"a", "b"}
+        np.testing.assert_array_equal(found["a"], _vec(1, 2, 3))
+        assert found["b"].dtype == np.float32
+
+    def test_models_do_not_share_vectors(self, embedding_store):
+        embedding_store.put_many("m1", [("a", _vec(1, 2))])
+
+        assert embedding_store.get_many("m2", ["a"]) == {}
+
+    def test_float16_storage(self, tmp_path):
+        store = EmbeddingStore(path=str(tmp_path / "e.sqlite3"), dtype="float16")
+        store.put_many("m", [("a", _vec(0.1, 0.2, 0.3))])
+
+        vector = store.get_many("m", ["a"])["a"]
+
+        assert vector.dtype == np.float32
+        np.testing.assert_allclose(vector, _vec(0.1, 0.2, 0.3), atol=1e-3)
+        assert store.stats()["bytes"] == 6
+
+    def test_unknown_dtype_is_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            EmbeddingStore(path=str(tmp_path / "e.sqlite3"), dtype="int8")
+
+    def test_evicts_least_recently_read(self, tmp_path):
+        # Each vector is 16 bytes; room for three (eviction trims to 90%).
+        store = EmbeddingStore(path=str(tmp_path / "e.sqlite3"), max_bytes=56)
+        store.put_many("m", [("a", _vec(1, 1, 1, 1)), ("b", _vec(2, 2, 2, 2))])
+        store.put_many("m", [("c", _vec(3, 3, 3, 3))])
+        store.get_many("m", ["a"])
+
+        store.put_many("m", [("d", _vec(4, 4, 4, 4))])
+
+        assert set(store.get_many("m", ["a", "b", "c", "d"])) == {"a", "c", "d"}
+
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "e.sqlite3")
+        first = EmbeddingStore(path=path)
+        first.put_many("m", [("a", _vec(1, 2))])
+        first.close()
+
+        assert "a" in EmbeddingStore(path=path).get_many("m", ["a"])
+
+    def test_text_key_normalizes_whitespace(self):
+        assert text_key("Hello  world\n") == text_key("Hello world")
+        assert text_key("Hello world") != text_key("hello world")
+
+
+class TestCachedEncode:
+    def test_second_run_reuses_vectors(self, embedding_store):
+        model = FakeModel()
+        register_model(model, "fake")
+
+        first = encode(model, ["one", "three"])
+        second = encode(model, ["three", "four", "one"])
+
+        assert model.calls == [["one", "three"], ["four"]]
+        np.testing.assert_array_equal(second[0], first[1])
+        np.testing.assert_array_equal(second[2], first[0])
+        assert second.shape == (3, 4)
+
+    def test_duplicates_are_encoded_once(self, embedding_store):
+        model = FakeModel()
+        register_model(model, "fake")
+
+        result = encode(model, ["same", "same  ", "other"], show_progress_bar=False)
+
+        assert model.calls == [["same", "other"]]
+        np.testing.assert_array_equal(result[0], result[1])
+
+    def test_cache_survives_model_reload(self, embedding_store):
+        first, second = FakeModel(), FakeModel()
+        register_model(first, "fake")
+        register_model(second, "fake")
+
+        encode(first, ["cached"])
+        encode(second, ["cached"])
+
+        assert second.calls == []
+
+    def test_unregistered_model_bypasses_cache(self, embedding_store):
+        model = FakeModel()
+
+        encode(model, ["a"])
+        encode(model, ["a"])
+
+        assert model.calls == [["a"], ["a"]]
+        assert embedding_store.stats()["vectors"] == 0
+
+    def test_output_changing_options_bypass_cache(self, embedding_store):
+        model = FakeModel()
+        register_model(model, "fake")
+
+        encode(model, ["a"], normalize_embeddings=True)
+
+        assert embedding_store.stats()["vectors"] == 0
@@ -0,0 +1,69 @@
+"""Import-time benchmark of the API entry point.
+
+Runs ``python -X importtime -c "import app.main"`` in a fresh interpreter and
+checks that the heavy ML stack stays out of application start-up: it is
+imported on first use by the code paths that need it.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+
+HEAVY_MODULES = (
+    "torch",
+    "transformers",
+    "sentence_transformers",
+    "spacy",
+    "sklearn",
+    "scipy",
+    "nltk",
+    "huggingface_hub",
+    "onnxruntime",
+    "optimum",
+)
+
+# Generous bound: the ML stack alone takes several seconds to import.
+MAX_IMPORT_SECONDS = 3.0
+
+
+def import_times(module: str) -> Dict[str, int]:
+    """Cumulative import time in microseconds of every module *module* loads."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_ROOT,
+        env={**os.environ, "HF_HUB_OFFLINE": "1"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.fixture(scope="module")
+def app_import_times() -> Dict[str, int]:
+    return import_times("app.main")
+
+
+def test_app_main_does_not_import_ml_stack(app_import_times):
+    loaded = {name.split(".")[0] for name in app_import_times}
+
+    assert sorted(loaded.intersection(HEAVY_MODULES)) == []
+
+
+@pytest.mark.slow
+def test_app_main_imports_quickly(app_import_times):
+    assert app_import_times["app.main"] / 1e6 < MAX_IMPORT_SECONDS
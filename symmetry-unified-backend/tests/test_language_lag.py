@@ -0,0 +1,148 @@
+"""Unit tests for the batched language-lag engine in wiki_utils.
+
+All tests are offline — ``wiki_get_json`` is replaced by an in-memory wiki.
+"""
+
+import asyncio
+from unittest.mock import patch
+from urllib.parse import urlparse
+
+import pytest
+
+from app.services import wiki_utils
+from app.services.wiki_utils import detect_language_lag, detect_language_lag_batch
+
+pytestmark = pytest.mark.unit
+
+
+# lang -> title -> (latest timestamp, {target_lang: translated title})
+WIKIS = {
+    "en": {
+        "Python": ("2024-03-10T00:00:00Z", {"fr": "Python (langage)", "de": "Python"}),
+        "Rust": ("2024-03-01T00:00:00Z", {"fr": "Rust (langage)"}),
+    },
+    "fr": {
+        "Python (langage)": ("2024-03-05T00:00:00Z", {}),
+        "Rust (langage)": ("2024-03-02T00:00:00Z", {}),
+    },
+    "de": {
+        "Python": ("2024-03-10T00:00:00Z", {}),
+    },
+}
+
+
+class FakeWiki:
+    """Answers multi-title ``prop=`` queries from ``WIKIS``.
+
+    Each ``langlinks`` response carries at most one link so that
+    continuation handling is exercised.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, url, params):
+        lang = urlparse(url).netloc.split(".")[0]
+        self.calls.append((lang, params["prop"], params["titles"]))
+        wiki = WIKIS.get(lang, {})
+        offset = int(params.get("llcontinue", 0))
+
+        normalized, pages, links_sent = [], {}, 0
+        for i, requested in enumerate(params["titles"].split("|")):
+            title = requested.replace("_", " ")
+            if title != requested:
+                normalized.append({"from": requested, "to": title})
+            if title not in wiki:
+                pages[str(-1 - i)] = {"title": title, "missing": ""}
+                continue
+            ts, links = wiki[title]
+            page = {"title": title, "revisions": [{"timestamp": ts}]}
+            if "langlinks" in params["prop"]:
+                all_links = [{"lang": k, "*": v} for k, v in links.items()]
+                page["langlinks"] = all_links[offset : offset + 1]
+                links_sent = max(links_sent, len(all_links))
+            pages[str(100 + i)] = page
+
+        data = {"query": {"normalized": normalized, "pages": pages}}
+        if offset + 1 < links_sent:
+            data["continue"] = {"llcontinue": str(offset + 1), "continue": "||"}
+        return data
+
+
+def _run(coro, fake):
+    with patch.object(wiki_utils, "wiki_get_json", new=fake):
+        return asyncio.run(coro)
+
+
+class TestDetectLanguageLagBatch:
+    def test_batches_round_trips_per_wiki(self):
+        fake = FakeWiki()
+        reports = _run(
+            detect_language_lag_batch(["Python", "Rust"], "en", ["fr", "de"]), fake
+        )
+
+        # one langlinks query (+1 continuation) on en, one timestamp query per target
+        by_lang = {}
+        for lang, prop, _ in fake.calls:
+            by_lang.setdefault(lang, []).append(prop)
+        assert by_lang["en"] == ["langlinks|revisions", "langlinks|revisions"]
+        assert by_lang["fr"] == ["revisions"]
+        assert by_lang["de"] == ["revisions"]
+        fr_titles = next(t for lang, _, t in fake.calls if lang == "fr")
+        assert set(fr_titles.split("|")) == {"Python (langage)", "Rust (langage)"}
+
+        python_fr, python_de = reports["Python"]
+        assert python_fr.title == "Python (langage)"
+        assert python_fr.days_behind == 5.0
+        assert python_fr.is_lagging is True
+        assert python_de.days_behind == 0.0
+        assert python_de.is_lagging is False
+
+        rust_fr, rust_de = reports["Rust"]
+        assert rust_fr.days_behind == -1.0
+        assert rust_de.title is None
+        assert rust_de.is_lagging is True
+
+    def test_maps_normalized_and_missing_titles(self):
+        reports = _run(
+            detect_language_lag_batch(["Rust", "Rust", "No_such_page"], "en", ["fr"]),
+            FakeWiki(),
+        )
+        assert list(reports) == ["Rust", "No_such_page"]
+        missing = reports["No_such_page"][0]
+        assert missing.title is None
+        assert missing.source_last_updated is None
+
+    def test_chunks_more_than_fifty_titles(self):
+        fake = FakeWiki()
+        titles = [f"Page {i}" for i in range(120)]
+        reports = _run(detect_language_lag_batch(titles, "en", ["fr"]), fake)
+
+        assert len(reports) == 120
+        assert [len(t.split("|")) for _, _, t in fake.calls] == [50, 50, 20]
+
+    def test_single_title_wrapper(self):
+        reports = _run(detect_language_lag("Python", "en", ["de"]), FakeWiki())
+        assert len(reports) == 1
+        assert reports[0].lang == "de"
+        assert reports[0].title == "Python"
+
+
+class TestLagBatchEndpoint:
+    def test_lag_batch(self, client):
+        with patch.object(wiki_utils, "wiki_get_json", new=FakeWiki()):
+            response = client.post(
+                "/symmetry/v1/wiki/lag/batch",
+                json={"titles": ["Python", "Rust"], "target_langs": ["fr"]},
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [d["title"] for d in data] == ["Python", "Rust"]
+        assert data[0]["reports"][0]["days_behind"] == 5.0
+
+    def test_lag_batch_requires_titles(self, client):
+        response = client.post(
+            "/symmetry/v1/wiki/lag/batch", json={"titles": [], "target_langs": ["fr"]}
+        )
+        assert response.status_code == 422
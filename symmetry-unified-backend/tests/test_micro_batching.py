@@ -0,0 +1,145 @@
+"""Unit tests for micro-batched model calls."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from app.ai import embeddings
+from app.ai.embeddings import encode, register_model
+from app.services.micro_batching import MicroBatcher
+
+pytestmark = pytest.mark.unit
+
+
+class BlockingRun:
+    """``run`` callable whose first call waits until released."""
+
+    def __init__(self):
+        self.batches = []
+        self.release = threading.Event()
+
+    def __call__(self, items):
+        self.batches.append(list(items))
+        if len(self.batches) == 1:
+            self.release.wait(5)
+        return [item * 10 for item in items]
+
+
+class TestMicroBatcher:
+    def test_queued_jobs_share_one_batch(self):
+        run = BlockingRun()
+        batcher = MicroBatcher("test", run, max_wait=0)
+
+        first = batcher.submit([1])
+        while not run.batches:
+            time.sleep(0.001)
+        queued = [batcher.submit([2, 3]), batcher.submit([4]), batcher.submit([5])]
+        run.release.set()
+
+        assert first.result(5) == [10]
+        assert [f.result(5) for f in queued] == [[20, 30], [40], [50]]
+        assert run.batches == [[1], [2, 3, 4, 5]]
+
+    def test_batch_size_is_bounded(self):
+        run = BlockingRun()
+        batcher = MicroBatcher("test", run, max_items=3, max_wait=0)
+
+        first = batcher.submit([0])
+        while not run.batches:
+            time.sleep(0.001)
+        queued = [batcher.submit([i, i]) for i in range(1, 4)]
+        run.release.set()
+
+        assert [f.result(5) for f in [first, *queued]] == [
+            [0],
+            [10, 10],
+            [20, 20],
+            [30, 30],
+        ]
+        assert [len(b) for b in run.batches] == [1, 4, 2]
+
+    def test_errors_reach_every_job_in_the_batch(self):
+        def run(items):
+            raise RuntimeError("model failed")
+
+        batcher = MicroBatcher("test", run)
+
+        with pytest.raises(RuntimeError):
+            batcher([1, 2])
+
+    def test_idle_worker_exits_and_restarts(self):
+        batcher = MicroBatcher("test", lambda items: items, idle_timeout=0.01)
+
+        assert batcher([1]) == [1]
+        deadline = time.monotonic() + 5
+        while batcher._worker is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert batcher._worker is None
+        assert batcher([2]) == [2]
+
+
+class SlowModel:
+    """Fixed per-call overhead, like a transformer forward pass on CPU."""
+
+    def __init__(self, overhead=0.02):
+        self.overhead = overhead
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def encode(self, texts, **kwargs):
+        with self._lock:  # one forward pass at a time, as on a busy CPU
+            self.calls.append(list(texts))
+            time.sleep(self.overhead + 0.0002 * len(texts))
+            return np.array([[len(t), 1.0] for t in texts], dtype=np.float32)
+
+
+def _concurrent_encode(model, requests):
+    with ThreadPoolExecutor(len(requests)) as pool:
+        return list(pool.map(lambda texts: encode(model, texts), requests))
+
+
+class TestBatchedEncode:
+    def test_concurrent_requests_are_merged(self, embedding_store):
+        model = SlowModel()
+        register_model(model, "slow")
+        requests = [[f"sentence {i}", "x" * i] for i in range(1, 9)]
+
+        results = _concurrent_encode(model, requests)
+
+        assert len(model.calls) < len(requests)
+        for texts, result in zip(requests, results):
+            np.testing.assert_array_equal(result[:, 0], [len(t) for t in texts])
+
+    def test_unregistered_models_are_called_directly(self, embedding_store):
+        model = SlowModel(overhead=0)
+
+        encode(model, ["a", "b"])
+
+        assert model not in embeddings._batchers
+        assert model.calls == [["a", "b"]]
+
+
+@pytest.mark.slow
+def test_batching_raises_concurrent_throughput(embedding_store, monkeypatch):
+    requests = [[f"request {i} sentence {j}" for j in range(5)] for i in range(32)]
+
+    def timed(enabled):
+        monkeypatch.setattr(embeddings, "EMBEDDING_BATCHING_ENABLED", enabled)
+        embedding_store.clear()
+        model = SlowModel()
+        register_model(model, f"slow-{enabled}")
+        start = time.perf_counter()
+        _concurrent_encode(model, requests)
+        return time.perf_counter() - start, len(model.calls)
+
+    direct_time, direct_calls = timed(False)
+    batched_time, batched_calls = timed(True)
+
+    assert batched_calls < direct_calls
+    assert (
+        batched_time * 3 < direct_time
+    ), f"direct {direct_time * 1000:.0f} ms, batched {batched_time * 1000:.0f} ms"
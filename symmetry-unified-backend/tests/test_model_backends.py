@@ -0,0 +1,151 @@
+"""Unit tests for the comparison model inference backends."""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.ai import embeddings, model_backends
+from app.ai.model_backends import load_sentence_transformer
+
+pytestmark = pytest.mark.unit
+
+SENTENCES = [
+    "the cat sat on the mat",
+    "a dog ran in the park",
+    "the park is green",
+    "cats and dogs",
+]
+
+
+@pytest.fixture(scope="module")
+def tiny_model(tmp_path_factory):
+    """A small randomly initialised BERT sentence encoder saved on disk."""
+    from sentence_transformers import SentenceTransformer, models
+    from transformers import BertConfig, BertModel, BertTokenizerFast
+
+    root = tmp_path_factory.mktemp("tiny-bert")
+    words = sorted({word for sentence in SENTENCES for word in sentence.split()})
+    vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", *words]
+    (root / "vocab.txt").write_text("\n".join(vocab), encoding="utf-8")
+
+    bert_dir = root / "bert"
+    config = BertConfig(
+        vocab_size=len(vocab),
+        hidden_size=64,
+        num_hidden_layers=2,
+        num_attention_heads=4,
+        intermediate_size=128,
+    )
+    BertModel(config).save_pretrained(bert_dir)
+    BertTokenizerFast(vocab_file=str(root / "vocab.txt")).save_pretrained(bert_dir)
+
+    model_dir = root / "encoder"
+    transformer = models.Transformer(str(bert_dir))
+    pooling = models.Pooling(transformer.get_word_embedding_dimension())
+    SentenceTransformer(modules=[transformer, pooling]).save(str(model_dir))
+    return str(model_dir)
+
+
+class FakeExporter:
+    """Stand-in for sentence-transformers' ONNX export and quantization."""
+
+    def __init__(self):
+        self.loads = []
+        self.quantized = 0
+
+    def sentence_transformer(self, path, backend=None, model_kwargs=None):
+        self.loads.append((path, dict(model_kwargs or {})))
+        return self
+
+    def save(self, path):
+        (Path(path) / "onnx").mkdir(parents=True)
+        (Path(path) / "onnx" / "model.onnx").write_bytes(b"fp32")
+
+    def quantize(self, model, config, path, file_suffix):
+        self.quantized += 1
+        (Path(path) / "onnx" / f"model_{file_suffix}.onnx").write_bytes(b"int8")
+
+
+@pytest.fixture
+def fake_onnx(tmp_path, monkeypatch):
+    exporter = FakeExporter()
+    monkeypatch.setattr(model_backends, "_onnx_available", lambda: True)
+    monkeypatch.setattr(model_backends, "ONNX_MODEL_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(model_backends, "_session_kwargs", lambda: {})
+    monkeypatch.setattr(
+        model_backends,
+        "_sentence_transformers",
+        lambda: SimpleNamespace(
+            SentenceTransformer=exporter.sentence_transformer,
+            export_dynamic_quantized_onnx_model=exporter.quantize,
+        ),
+    )
+    monkeypatch.setattr(model_backends, "register_model", lambda model, name: None)
+    return exporter
+
+
+class TestBackendSelection:
+    def test_torch_caches_vectors_under_model_name(self, tiny_model):
+        model = load_sentence_transformer(tiny_model, "torch")
+
+        assert embeddings._model_names[model] == tiny_model
+
+    def test_onnx_falls_back_to_torch_without_onnxruntime(
+        self, tiny_model, monkeypatch
+    ):
+        monkeypatch.setattr(model_backends, "_onnx_available", lambda: False)
+
+        model = load_sentence_transformer(tiny_model, "onnx-int8")
+
+        assert embeddings._model_names[model] == tiny_model
+
+    def test_unknown_backend_is_rejected(self):
+        with pytest.raises(ValueError):
+            load_sentence_transformer("any-model", "tensorrt")
+
+
+class TestExportCache:
+    def test_quantized_export_runs_once(self, fake_onnx, tmp_path):
+        load_sentence_transformer("org/model", "onnx-int8")
+        load_sentence_transformer("org/model", "onnx-int8")
+
+        export_dir = tmp_path / "org--model--onnx-int8_avx2"
+        assert fake_onnx.quantized == 1
+        assert sorted(p.name for p in (export_dir / "onnx").iterdir()) == [
+            "model_int8_avx2.onnx"
+        ]
+        assert [path for path, _ in fake_onnx.loads] == [
+            "org/model",
+            str(export_dir),
+            str(export_dir),
+        ]
+        assert fake_onnx.loads[-1][1]["file_name"] == "onnx/model_int8_avx2.onnx"
+        assert [p.name for p in tmp_path.iterdir()] == [export_dir.name]
+
+    def test_fp32_and_int8_exports_are_kept_apart(self, fake_onnx, tmp_path):
+        load_sentence_transformer("org/model", "onnx")
+        load_sentence_transformer("org/model", "onnx-int8")
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "org--model--onnx",
+            "org--model--onnx-int8_avx2",
+        ]
+        assert fake_onnx.quantized == 1
+
+
+@pytest.mark.slow
+def test_int8_onnx_stays_close_to_fp32(tiny_model, tmp_path, monkeypatch):
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("optimum.onnxruntime")
+    monkeypatch.setattr(model_backends, "ONNX_MODEL_CACHE_DIR", str(tmp_path))
+
+    reference = load_sentence_transformer(tiny_model, "torch")
+    quantized = load_sentence_transformer(tiny_model, "onnx-int8")
+    expected = reference.encode(SENTENCES, normalize_embeddings=True)
+    actual = quantized.encode(SENTENCES, normalize_embeddings=True)
+
+    assert embeddings._model_names[quantized] != embeddings._model_names[reference]
+    assert np.min(np.sum(expected * actual, axis=1)) > 0.99
+    np.testing.assert_allclose(actual @ actual.T, expected @ expected.T, atol=0.02)
@@ -0,0 +1,149 @@
+"""Unit tests for the process-wide model manager."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import torch
+
+from app.ai import comparison, model_backends
+from app.services import section_comparison
+from app.services.model_manager import ModelManager, get_model_manager, model_sizeof
+
+pytestmark = pytest.mark.unit
+
+
+def _manager(max_bytes=1000) -> ModelManager:
+    # Models in these tests are bytes objects sized by their length.
+    return ModelManager(max_bytes, sizeof=lambda model: len(model or b""))
+
+
+class TestFamilies:
+    def test_models_are_loaded_once(self):
+        family = _manager().family("translation")
+        loads = []
+
+        def load():
+            loads.append(1)
+            return b"model"
+
+        assert family.get("en-fr", load) is family.get("en-fr", load)
+        assert len(loads) == 1
+
+    def test_max_entries_evicts_least_recently_used(self):
+        family = _manager().family("fact-extraction", max_entries=2)
+        family.get("a", lambda: b"a")
+        family.get("b", lambda: b"b")
+        family.get("a", lambda: b"a")
+        family.get("c", lambda: b"c")
+
+        assert family.keys() == ["a", "c"]
+
+    def test_failed_loads_are_not_cached(self):
+        family = _manager().family("spacy")
+
+        with pytest.raises(OSError):
+            family.get("de", lambda: (_ for _ in ()).throw(OSError("missing")))
+
+        assert "de" not in family
+        assert family.get("de", lambda: None) is None
+        assert "de" in family
+
+
+class TestMemoryBudget:
+    def test_evicts_across_families(self):
+        manager = _manager(max_bytes=250)
+        embeddings = manager.family("sentence-transformers")
+        translation = manager.family("translation")
+        embeddings.get("labse", lambda: b"x" * 100)
+        translation.get("en-fr", lambda: b"x" * 100)
+        embeddings.get("labse", lambda: b"x" * 100)
+
+        translation.get("en-de", lambda: b"x" * 100)
+
+        assert embeddings.keys() == ["labse"]
+        assert translation.keys() == ["en-de"]
+        assert manager.current_bytes == 200
+        assert manager.evictions == 1
+
+    def test_model_larger_than_budget_is_still_served(self):
+        manager = _manager(max_bytes=50)
+        family = manager.family("sentence-transformers")
+        family.get("small", lambda: b"x" * 10)
+
+        assert family.get("huge", lambda: b"x" * 100) == b"x" * 100
+        assert family.keys() == ["huge"]
+
+    def test_evicted_models_are_released(self):
+        released = []
+        manager = _manager(max_bytes=100)
+        family = manager.family(
+            "fact-extraction", on_evict=lambda key, model: released.append(key)
+        )
+        family.get("a", lambda: b"x" * 60)
+        family.get("b", lambda: b"x" * 60)
+
+        assert released == ["a"]
+
+    def test_stats_report_sizes_in_lru_order(self):
+        manager = _manager()
+        manager.family("translation").get("en-fr", lambda: b"x" * 30)
+        manager.family("spacy").get("en/sentences", lambda: b"x" * 5)
+
+        stats = manager.stats()
+
+        assert [(s.family, s.name, s.bytes) for s in stats] == [
+            ("translation", "en-fr", 30),
+            ("spacy", "en/sentences", 5),
+        ]
+
+
+def test_concurrent_first_requests_share_one_load():
+    family = _manager().family("sentence-transformers")
+    loads = []
+
+    def load():
+        loads.append(1)
+        time.sleep(0.05)
+        return b"model"
+
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(lambda _: family.get("labse", load), range(4)))
+
+    assert len(loads) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_model_sizeof_counts_weights():
+    model = torch.nn.Linear(500, 200)
+
+    assert model_sizeof(model) >= (500 * 200 + 200) * 4
+
+
+def test_comparison_paths_share_one_sentence_transformer(monkeypatch):
+    loads = []
+    monkeypatch.setattr(
+        model_backends,
+        "load_sentence_transformer",
+        lambda name: loads.append(name) or object(),
+    )
+    try:
+        model = comparison._get_model("shared-test-model")
+
+        assert section_comparison._get_model("shared-test-model") is model
+        assert loads == ["shared-test-model"]
+    finally:
+        model_backends._models.pop("shared-test-model")
+
+
+def test_loaded_models_endpoint(client):
+    get_model_manager().family("spacy").get("test/endpoint", lambda: None)
+    try:
+        response = client.get("/models/loaded")
+    finally:
+        get_model_manager().family("spacy").pop("test/endpoint")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["budget_bytes"] == get_model_manager().max_bytes
+    assert any(m["name"] == "test/endpoint" for m in body["models"])
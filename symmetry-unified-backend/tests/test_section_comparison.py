@@ -0,0 +1,107 @@
+"""Unit tests for section-level comparison with a stand-in embedding model."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from app.models.wiki.structure import Article, Section
+from app.services import section_comparison
+from app.services.section_comparison import (
+    _compare_paragraphs,
+    _embed_text_groups,
+    compare_article_sections,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class FakeModel:
+    """Bag-of-letters embeddings: similar texts get similar vectors."""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        vectors = np.zeros((len(texts), 26), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for ch in text.lower():
+                if "a" <= ch <= "z":
+                    vectors[row, ord(ch) - ord("a")] += 1
+        return vectors + 1e-3
+
+
+def _section(title, *paragraphs):
+    content = "\n\n".join(paragraphs)
+    return Section(title=title, raw_content=content, clean_content=content)
+
+
+def _article(lang, *sections):
+    return Article(
+        title="Sample", lang=lang, source="test", sections=list(sections), references=[]
+    )
+
+
+SOURCE = _article(
+    "en",
+    _section("History", "The castle was built in stone.", "It burned down twice."),
+    _section("Economy", "Farming dominates the valley.", "Tourism grows each year."),
+    _section("Climate", "Winters are cold and snowy."),
+)
+TARGET = _article(
+    "en",
+    _section("History", "The castle was built in stone.", "A museum opened later."),
+    _section("Economy", "Tourism grows each year.", "Farming dominates the valley."),
+    _section("Climate", "Winters are cold and snowy.", "Summers are mild."),
+)
+
+
+@pytest.fixture
+def model():
+    fake = FakeModel()
+    with patch.object(
+        section_comparison, "_get_model", return_value=fake
+    ), patch.object(
+        section_comparison,
+        "extract_exclusive_keywords_batch",
+        side_effect=lambda pairs, *_: [([], [])] * len(pairs),
+    ):
+        yield fake
+
+
+class TestBatchedParagraphEmbedding:
+    def test_groups_are_sliced_in_order(self, model):
+        groups = [["bb", "a"], [], ["a", "ccc"]]
+
+        embedded = _embed_text_groups(model, groups)
+
+        assert model.calls == [["ccc", "bb", "a"]]
+        assert [m.shape[0] for m in embedded] == [2, 0, 2]
+        np.testing.assert_array_equal(embedded[0][1], embedded[2][0])
+        np.testing.assert_array_equal(embedded[2][1], model.encode(["ccc"])[0])
+
+    def test_one_paragraph_encode_per_comparison(self, model):
+        compare_article_sections(SOURCE, TARGET, similarity_threshold=0.5)
+
+        # One call for section matching, one for every paragraph.
+        assert len(model.calls) == 2
+        paragraphs = model.calls[1]
+        assert len(paragraphs) == len(set(paragraphs)) == 7
+        assert [len(p) for p in paragraphs] == sorted(
+            (len(p) for p in paragraphs), reverse=True
+        )
+
+    def test_matches_per_pair_encoding(self, model):
+        batched = compare_article_sections(SOURCE, TARGET, similarity_threshold=0.5)
+
+        for diff in batched.section_diffs:
+            source = next(s for s in SOURCE.sections if s.title == diff.source_title)
+            target = next(s for s in TARGET.sections if s.title == diff.target_title)
+            unbatched = _compare_paragraphs(
+                section_comparison._split_into_paragraphs(source),
+                section_comparison._split_into_paragraphs(target),
+                model,
+                0.5,
+            )
+            assert diff.paragraph_diffs == unbatched
@@ -1,4 +1,11 @@
-from app.ai.comparison import semantic_compare, preprocess_input
+import numpy as np
+
+from app.ai.comparison import (
+    _best_matches,
+    _top_matches,
+    preprocess_input,
+    semantic_compare,
+)
 
 
 class TestSemanticComparison:
@@ -103,3 +110,46 @@ def test_preprocess_input_uses_chunking_for_large_text(monkeypatch):
 
     assert observed["called"] is True
     assert result == ["chunk one", "chunk two"]
+
+
+def _reference_top_matches(matrix, left, right):
+    return sorted(
+        [
+            {"score": matrix[i][j], "sentence_a": left[i], "sentence_b": right[j]}
+            for i in range(len(left))
+            for j in range(len(right))
+        ],
+        key=lambda x: x["score"],
+        reverse=True,
+    )
+
+
+def test_top_matches_agree_with_full_sort():
+    """Top-k via argpartition matches sorting every pair, ties included."""
+    rng = np.random.default_rng(0)
+    for shape in [(1, 1), (3, 7), (25, 40)]:
+        # Coarse values so many pairs tie at the top-k boundary.
+        matrix = np.round(rng.random(shape), 1)
+        left = [f"a{i}" for i in range(shape[0])]
+        right = [f"b{j}" for j in range(shape[1])]
+        expected = _reference_top_matches(matrix.tolist(), left, right)
+
+        for k in [1, 5, 20, shape[0] * shape[1] + 3]:
+            assert _top_matches(matrix, left, right, k) == expected[:k]
+
+
+def test_best_matches_pick_first_maximum():
+    """Row-wise best matches keep the first candidate on ties."""
+    matrix = np.array([[0.2, 0.9, 0.9], [0.5, 0.1, 0.3]])
+
+    assert _best_matches(matrix, ["x", "y"], ["p", "q", "r"]) == [
+        {"sentence": "x", "best_match": "q", "score": 0.9},
+        {"sentence": "y", "best_match": "p", "score": 0.5},
+    ]
+    # The true maximum wins over an earlier candidate that rounds equal to it.
+    close = np.array([[0.90001, 0.90004]])
+    assert _best_matches(close, ["x"], ["p", "q"]) == [
+        {"sentence": "x", "best_match": "q", "score": 0.9}
+    ]
+    by_column = _best_matches(matrix.T, ["p", "q", "r"], ["x", "y"])
+    assert [m["best_match"] for m in by_column] == ["y", "x", "x"]
@@ -0,0 +1,155 @@
+"""Unit tests for single-flight request coalescing."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.ai.embeddings import encode
+from app.services import article_parser
+from app.services.article_parser import article_fetcher
+from app.services.single_flight import SingleFlight, ThreadSingleFlight, content_key
+
+pytestmark = pytest.mark.unit
+
+
+class TestSingleFlight:
+    def test_concurrent_callers_share_one_call(self):
+        flights = SingleFlight("test")
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"value": 42}
+
+        async def run():
+            return await asyncio.gather(*(flights.do("k", work) for _ in range(5)))
+
+        results = asyncio.run(run())
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+        assert (flights.started, flights.shared) == (1, 4)
+
+    def test_different_keys_run_separately(self):
+        flights = SingleFlight("test")
+
+        async def run():
+            return await asyncio.gather(
+                flights.do("a", lambda: asyncio.sleep(0, result="a")),
+                flights.do("b", lambda: asyncio.sleep(0, result="b")),
+            )
+
+        assert asyncio.run(run()) == ["a", "b"]
+        assert flights.started == 2
+
+    def test_exception_reaches_every_waiter(self):
+        flights = SingleFlight("test")
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        async def run():
+            return await asyncio.gather(
+                *(flights.do("k", fail) for _ in range(3)), return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+        assert all(isinstance(r, ValueError) for r in results)
+
+    def test_cancelled_waiter_does_not_cancel_others(self):
+        flights = SingleFlight("test")
+
+        async def work():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        async def run():
+            first = asyncio.create_task(flights.do("k", work))
+            second = asyncio.create_task(flights.do("k", work))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(run()) == "done"
+
+    def test_nothing_is_remembered_after_completion(self):
+        flights = SingleFlight("test")
+        calls = []
+
+        async def work():
+            calls.append(1)
+            return len(calls)
+
+        async def run():
+            return [await flights.do("k", work), await flights.do("k", work)]
+
+        assert asyncio.run(run()) == [1, 2]
+
+
+class TestThreadSingleFlight:
+    def test_concurrent_threads_share_one_call(self):
+        flights = ThreadSingleFlight("test")
+        calls = []
+        barrier = threading.Barrier(4)
+        results = []
+
+        def work():
+            calls.append(1)
+            time.sleep(0.05)
+            return "shared"
+
+        def worker():
+            barrier.wait()
+            results.append(flights.do("k", work))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert results == ["shared"] * 4
+
+    def test_content_key_distinguishes_inputs(self):
+        assert content_key("en", "fr", "text") == content_key("en", "fr", "text")
+        assert content_key("en", "fr", "text") != content_key("fr", "en", "text")
+        assert content_key(["a", "b"]) != content_key(["ab"])
+
+
+class TestCoalescedCallSites:
+    def test_article_fetcher_coalesces_identical_fetches(self):
+        calls = []
+
+        async def slow_fetch(url, params):
+            calls.append(params["page"])
+            await asyncio.sleep(0.01)
+            return {"parse": {"title": "Python", "revid": 1, "text": {"*": "<p>x</p>"}}}
+
+        async def run():
+            return await asyncio.gather(
+                article_fetcher("Python", "en"),
+                article_fetcher("Python", "en"),
+                article_fetcher("Python", "fr"),
+            )
+
+        with patch.object(article_parser, "_fetch_wikipedia_json", new=slow_fetch):
+            en_a, en_b, fr = asyncio.run(run())
+
+        assert sorted(calls) == ["Python", "Python"]  # one per language
+        assert en_a is en_b
+        assert fr.lang == "fr"
+
+    def test_encode_forwards_to_model(self):
+        class Model:
+            def encode(self, texts, **kwargs):
+                return [len(t) for t in texts], kwargs
+
+        assert encode(Model(), ["ab", "c"], show_progress_bar=False) == (
+            [2, 1],
+            {"show_progress_bar": False},
+        )
@@ -0,0 +1,81 @@
+"""Unit tests for the shared spaCy pipeline registry and its callers."""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.ai.comparison import preprocess_input
+from app.services import keyword_proximity, spacy_pipelines
+from app.services.keyword_proximity import (
+    extract_exclusive_keywords,
+    extract_exclusive_keywords_batch,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    spacy_pipelines.clear()
+    yield
+    spacy_pipelines.clear()
+
+
+class TestRegistry:
+    def test_pipelines_are_loaded_once(self):
+        first = spacy_pipelines.get_pipeline("en", "sentences")
+
+        assert spacy_pipelines.get_pipeline("en", "sentences") is first
+        assert first.pipe_names == ["sentencizer"]
+
+    def test_failed_loads_are_cached(self):
+        with patch("spacy.load", side_effect=OSError("missing")) as load:
+            assert spacy_pipelines.get_pipeline("de", "keywords") is None
+            assert spacy_pipelines.get_pipeline("de", "keywords") is None
+
+        assert load.call_count == 1
+
+    def test_profiles_exclude_unused_components(self):
+        with patch("spacy.load") as load:
+            spacy_pipelines.get_pipeline("en", "keywords")
+            spacy_pipelines.get_pipeline("en", "syntax")
+
+        assert "parser" in load.call_args_list[0].kwargs["exclude"]
+        assert "ner" in load.call_args_list[1].kwargs["exclude"]
+
+    def test_unregistered_language_has_no_model(self):
+        assert spacy_pipelines.get_pipeline("xx-unknown", "keywords") is None
+
+    def test_unknown_profile_is_rejected(self):
+        with pytest.raises(ValueError):
+            spacy_pipelines.get_pipeline("en", "everything")
+
+    def test_split_sentences(self):
+        assert spacy_pipelines.split_sentences("One here. Two there!", "en") == [
+            "One here.",
+            "Two there!",
+        ]
+
+
+class TestCallers:
+    def test_preprocess_input_uses_sentencizer(self):
+        assert preprocess_input("Dr. Who arrived. He left.", "en") == [
+            "Dr. Who arrived.",
+            "He left.",
+        ]
+
+    def test_keyword_batch_matches_single_pairs(self, monkeypatch):
+        monkeypatch.setattr(keyword_proximity, "_load_nlp", lambda language: None)
+        pairs = [
+            ("Paris hosted Einstein in Berlin", "Paris hosted Curie"),
+            ("", "Ignored Text"),
+            ("Nothing Capitalised here", "Nothing Capitalised there"),
+        ]
+
+        batched = extract_exclusive_keywords_batch(pairs, "en", "en")
+
+        assert batched == [
+            extract_exclusive_keywords(s, t, "en", "en") for s, t in pairs
+        ]
+        assert batched[0] == (["berlin", "einstein"], ["curie"])
+        assert batched[1] == ([], [])
@@ -1,11 +1,30 @@
-from unittest.mock import patch
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
 from fastapi import HTTPException
 import pytest
 
+from app.routers.structural_analysis import _score_language
+from app.services.structural_pipeline import ArticleSources
+
+
+def _empty_sources(title, language):
+    return ArticleSources(title=title, language=language, html="", wikitext="")
+
 
 class TestStructuralAnalysisRouter:
     """Tests for the structural_analysis router"""
 
+    @pytest.fixture(autouse=True)
+    def _stub_article_sources(self):
+        """Never hit Wikipedia: every analyzer receives empty shared sources."""
+        with patch(
+            "app.routers.structural_analysis.structural_pipeline.fetch_article_sources",
+            new=AsyncMock(side_effect=_empty_sources),
+        ) as mock_fetch:
+            yield mock_fetch
+
     @patch("app.routers.structural_analysis.table_analysis.analyze_tables")
     @patch("app.routers.structural_analysis.header_analysis.count_html_headers")
     @patch("app.routers.structural_analysis.infobox_analysis.analyze_infobox")
@@ -248,17 +267,17 @@ class TestStructuralAnalysisRouter:
                 data["citations"],
             )
 
-        mock_table_analysis.side_effect = lambda title, lang: side_effect(title, lang)[
-            0
-        ]
-        mock_header_analysis.side_effect = lambda title, lang: side_effect(title, lang)[
-            1
-        ]
-        mock_infobox_analysis.side_effect = lambda title, lang: side_effect(
-            title, lang
+        mock_table_analysis.side_effect = lambda src: side_effect(
+            src.title, src.language
+        )[0]
+        mock_header_analysis.side_effect = lambda src: side_effect(
+            src.title, src.language
+        )[1]
+        mock_infobox_analysis.side_effect = lambda src: side_effect(
+            src.title, src.language
         )[2]
-        mock_citation_analysis.side_effect = lambda title, lang: side_effect(
-            title, lang
+        mock_citation_analysis.side_effect = lambda src: side_effect(
+            src.title, src.language
         )[3]
         mock_image_count.return_value = 5
 
@@ -443,7 +462,7 @@ class TestStructuralAnalysisRouter:
             )
             mock_images.return_value = 5
 
-            result = analyze_single_article("Test_Article", "en")
+            result = asyncio.run(analyze_single_article("Test_Article", "en"))
 
             assert result.title == "Test_Article"
             assert result.total_images == 5
@@ -458,6 +477,81 @@ class TestStructuralAnalysisRouter:
             mock_tables.side_effect = HTTPException(status_code=404, detail="Not found")
 
             with pytest.raises(HTTPException) as exc_info:
-                analyze_single_article("NonExistent", "en")
+                asyncio.run(analyze_single_article("NonExistent", "en"))
 
             assert exc_info.value.status_code == 404
+
+    def test_get_results_runs_languages_concurrently(
+        self, client, mock_structural_analysis_data
+    ):
+        """Languages are analyzed in parallel and one failure does not stop the rest"""
+        from app.models.wiki.analysis import FinalAnalysisResponse
+
+        state = {"active": 0, "peak": 0}
+
+        async def fake_analyze(title, lang):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.05)
+            state["active"] -= 1
+            if lang == "de":
+                raise HTTPException(status_code=503, detail="de unavailable")
+            return FinalAnalysisResponse(
+                title=title,
+                total_images=5,
+                **mock_structural_analysis_data,
+            )
+
+        async def fake_translation(title, source_lang, target_lang):
+            if target_lang == "pt":
+                raise httpx.ReadTimeout("langlinks timeout")
+            return f"{title}_{target_lang}"
+
+        with (
+            patch(
+                "app.routers.structural_analysis.analyze_single_article",
+                side_effect=fake_analyze,
+            ),
+            patch(
+                "app.routers.structural_analysis.wiki_utils.get_translation",
+                side_effect=fake_translation,
+            ),
+        ):
+            response = client.get("/operations/en/Test_Article")
+
+        assert response.status_code == 200
+        by_lang = {d["lang_code"]: d for d in response.json()["scores_by_language"]}
+        assert state["peak"] > 1
+        assert by_lang["de"]["error"] == "de unavailable"
+        assert (
+            by_lang["pt"]["error"] == "Language link lookup failed: langlinks timeout"
+        )
+        assert all(by_lang[c]["score"] >= 0 for c in ("en", "es", "fr", "ar"))
+
+    def test_failed_language_link_lookup_is_logged(self, caplog):
+        async def fake_translation(title, source_lang, target_lang):
+            raise httpx.ConnectError("connection refused")
+
+        with patch(
+            "app.routers.structural_analysis.wiki_utils.get_translation",
+            side_effect=fake_translation,
+        ):
+            entry = asyncio.run(
+                _score_language("de", "Test_Article", "en", asyncio.Semaphore(1))
+            )
+
+        assert entry["error"] == "Language link lookup failed: connection refused"
+        assert "Language link lookup en -> de failed" in caplog.text
+
+    def test_unexpected_language_link_errors_propagate(self):
+        async def fake_translation(title, source_lang, target_lang):
+            raise KeyError("*")
+
+        with patch(
+            "app.routers.structural_analysis.wiki_utils.get_translation",
+            side_effect=fake_translation,
+        ):
+            with pytest.raises(KeyError):
+                asyncio.run(
+                    _score_language("de", "Test_Article", "en", asyncio.Semaphore(1))
+                )
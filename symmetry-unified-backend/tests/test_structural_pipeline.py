@@ -0,0 +1,146 @@
+"""Unit tests for the shared structural-analysis source fetch and analyzers.
+
+All tests are offline — ``wiki_get_json`` is patched.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.services import structural_pipeline
+from app.services.citation_analysis import extract_citation_from_wikitext
+from app.services.header_analysis import count_html_headers
+from app.services.image_analysis import get_image_count
+from app.services.infobox_analysis import analyze_infobox
+from app.services.structural_pipeline import ArticleSources, fetch_article_sources
+from app.services.table_analysis import analyze_tables
+
+pytestmark = pytest.mark.unit
+
+HTML = """
+<div class="mw-parser-output">
+  <table class="infobox">
+    <tr><th>Born</th><td>1 January 1900</td></tr>
+    <tr><th>Died</th><td>2 February 1980</td></tr>
+  </table>
+  <h2>History</h2>
+  <p>Text.</p>
+  <table><tr><td>a</td><td>b</td><td>c</td></tr><tr><td>d</td></tr></table>
+  <h2>See also</h2>
+  <ul><li><a href="/a">A</a></li><li><a href="/b">B</a></li></ul>
+  <h3>Notes</h3>
+</div>
+"""
+
+WIKITEXT = "{{Cite journal|doi=10.1/x}} {{Cite book|isbn=123}} {{Cite web|url=x}}"
+
+
+def _sources() -> ArticleSources:
+    return ArticleSources(
+        title="Test",
+        language="en",
+        html=HTML,
+        wikitext=WIKITEXT,
+        extlinks=[{"*": "https://a"}, {"*": "https://b"}, {"*": "https://c"}],
+        images=[{"title": "File:A.jpg"}],
+    )
+
+
+def _fake_api(parse=None, query=None):
+    parse = parse if parse is not None else {"parse": {"text": {"*": HTML}}}
+    query = (
+        query
+        if query is not None
+        else {
+            "query": {
+                "pages": {
+                    "42": {
+                        "revisions": [{"slots": {"main": {"*": WIKITEXT}}}],
+                        "extlinks": [{"*": "https://a"}],
+                        "images": [{"title": "File:A.jpg"}],
+                    }
+                }
+            }
+        }
+    )
+    calls = []
+
+    async def fake_get_json(url, params):
+        calls.append((url, params["action"]))
+        return parse if params["action"] == "parse" else query
+
+    return fake_get_json, calls
+
+
+class TestFetchArticleSources:
+    def test_two_calls_build_sources(self):
+        fake, calls = _fake_api()
+        with patch.object(structural_pipeline, "wiki_get_json", side_effect=fake):
+            sources = asyncio.run(fetch_article_sources("Test", "fr"))
+
+        assert sorted(action for _, action in calls) == ["parse", "query"]
+        assert all(url.startswith("https://fr.wikipedia.org") for url, _ in calls)
+        assert sources.html == HTML
+        assert sources.wikitext == WIKITEXT
+        assert len(sources.extlinks) == 1
+        assert len(sources.images) == 1
+
+    def test_missing_page_is_404(self):
+        fake, _ = _fake_api(query={"query": {"pages": {"-1": {"missing": ""}}}})
+        with patch.object(structural_pipeline, "wiki_get_json", side_effect=fake):
+            with pytest.raises(HTTPException) as exc_info:
+                asyncio.run(fetch_article_sources("Nope", "en"))
+        assert exc_info.value.status_code == 404
+
+    def test_api_error_is_400(self):
+        fake, _ = _fake_api(parse={"error": {"code": "bad", "info": "broken"}})
+        with patch.object(structural_pipeline, "wiki_get_json", side_effect=fake):
+            with pytest.raises(HTTPException) as exc_info:
+                asyncio.run(fetch_article_sources("Test", "en"))
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == "broken"
+
+
+class TestAnalyzers:
+    def test_analyzers_share_one_soup(self):
+        sources = _sources()
+        soup = sources.soup
+
+        analyze_tables(sources)
+        count_html_headers(sources)
+        analyze_infobox(sources)
+        extract_citation_from_wikitext(sources)
+
+        assert sources.soup is soup
+
+    def test_tables(self):
+        result = analyze_tables(_sources())
+        assert result.number_of_tables == 2
+        data_table = result.individual_table_information[1]
+        assert data_table.table_index == 1
+        assert data_table.number_of_rows == 2
+        assert data_table.number_of_columns == 3
+
+    def test_headers(self):
+        result = count_html_headers(_sources())
+        assert result.h2_count == 2
+        assert result.h3_count == 1
+
+    def test_infobox(self):
+        result = analyze_infobox(_sources())
+        assert result.total_attributes == 2
+        assert result.individual_infobox_data[0].attribute_name == "Born"
+        assert result.individual_infobox_data[0].attribute_value == "1 January 1900"
+
+    def test_citations(self):
+        result = extract_citation_from_wikitext(_sources())
+        assert result.citations_with_doi == 1
+        assert result.citations_with_isbn == 1
+        assert result.total_citations == 3
+        assert result.external_links == 3
+        assert result.see_also_links == 2
+
+    def test_images(self):
+        assert get_image_count(_sources()) == 1
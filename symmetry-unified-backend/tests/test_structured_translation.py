@@ -0,0 +1,142 @@
+"""Unit tests for planned (batched) article translation."""
+
+import pytest
+
+from app.ai import translation as translation_module
+from app.ai.translation import translate_many
+from app.models.wiki.structure import Article, Citation, Reference, Section
+from app.services.structured_translation import translate_article
+
+pytestmark = pytest.mark.unit
+
+
+class FakeTokenizer:
+    """One token per word."""
+
+    def __call__(self, texts, **kwargs):
+        return {"input_ids": [text.split() for text in texts]}
+
+
+class FakeEngine:
+    def __init__(self, calls):
+        self.tokenizer = FakeTokenizer()
+        self.calls = calls
+
+    def translate_batch(self, batch, _decoding):
+        self.calls.append(list(batch))
+        return [f"T({item})" for item in batch]
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        translation_module, "get_translation_engine", lambda _name: FakeEngine(calls)
+    )
+    return calls
+
+
+class TestTranslateMany:
+    def test_identical_texts_are_translated_once(self, batches):
+        result = translate_many(["History", "Early life", "History"], "en", "fr")
+
+        assert result == ["T(History)", "T(Early life)", "T(History)"]
+        assert sorted(sum(batches, [])) == ["Early life", "History"]
+
+    def test_blank_texts_are_kept(self, batches):
+        assert translate_many(["", "  ", "Hello"], "en", "fr") == [
+            "",
+            "  ",
+            "T(Hello)",
+        ]
+
+    def test_same_language_is_a_no_op(self, batches):
+        assert translate_many(["Hello"], "english", "en") == ["Hello"]
+        assert batches == []
+
+    def test_segments_are_batched_by_token_length(self, batches, monkeypatch):
+        monkeypatch.setattr(translation_module, "TRANSLATION_BATCH_MAX_TOKENS", 6)
+
+        translate_many(["a b c d", "a", "a b c", "a b"], "en", "fr")
+
+        assert batches == [["a", "a b"], ["a b c"], ["a b c d"]]
+
+    def test_texts_are_translated_by_sentence(self, batches):
+        (result,) = translate_many(
+            ["One two three. Four five six seven. Eight nine.\n\nTen."], "en", "fr"
+        )
+
+        assert result == (
+            "T(One two three.) T(Four five six seven.) T(Eight nine.)\n\nT(Ten.)"
+        )
+
+    def test_long_sentences_are_cut_into_word_runs(self, batches, monkeypatch):
+        monkeypatch.setattr(translation_module, "TRANSLATION_MAX_SEGMENT_TOKENS", 2)
+
+        assert translate_many(["a b c d e."], "en", "fr") == ["T(a b) T(c d) T(e.)"]
+
+    def test_reference_labels_stay_whole(self, batches):
+        assert translate_many(
+            ["Founded early. [1] Later (see below)."], "en", "fr"
+        ) == ["T(Founded early.) T([1] Later (see below).)"]
+
+    def test_repeated_sentences_are_translated_once(self, batches):
+        (result,) = translate_many(["Same words here. " * 6], "en", "fr")
+
+        assert sum(batches, []) == ["Same words here."]
+        assert result == " ".join(["T(Same words here.)"] * 6)
+
+    def test_unavailable_model_falls_back_to_source_text(self, monkeypatch):
+        def raise_repo_error(_name):
+            raise OSError("Repository Not Found for url: https://huggingface.co/x")
+
+        monkeypatch.setattr(
+            translation_module, "get_translation_engine", raise_repo_error
+        )
+
+        assert translate_many(["Hello", "World"], "en", "pt") == ["Hello", "World"]
+
+    def test_other_failures_raise(self, monkeypatch):
+        def raise_error(_name):
+            raise MemoryError("out of memory")
+
+        monkeypatch.setattr(translation_module, "get_translation_engine", raise_error)
+
+        with pytest.raises(RuntimeError, match="en -> pt"):
+            translate_many(["Hello"], "en", "pt")
+
+
+def test_translate_article_reassembles_sections(batches):
+    article = Article(
+        title="Paris",
+        lang="en",
+        source="wikipedia",
+        sections=[
+            Section(
+                title="History",
+                raw_content="Founded early. [1]",
+                clean_content="Founded early.",
+                citations=[Citation(label="early", url="https://x")],
+                citation_position=["early:8"],
+            ),
+            Section(
+                title="Geography",
+                raw_content="On the Seine.",
+                clean_content="On the Seine.",
+            ),
+        ],
+        references=[Reference(label="[1]")],
+    )
+
+    response = translate_article(article, "en", "fr")
+
+    assert response.title == "T(Paris)"
+    assert response.lang == "fr"
+    assert [s.title for s in response.sections] == ["T(History)", "T(Geography)"]
+    assert response.sections[0].raw_content == "T(Founded early.) T([1])"
+    assert response.sections[0].clean_content == "T(Founded early.)"
+    assert response.sections[1].raw_content == "T(On the Seine.)"
+    assert response.sections[0].citation_position == ["early:8"]
+    assert (response.total_sections, response.total_citations) == (2, 1)
+    # Seven fields, eight sentences, six of them distinct: one batch.
+    assert len(batches) == 1 and len(batches[0]) == 6
@@ -1,9 +1,12 @@
-from unittest.mock import patch, Mock
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, patch, Mock
 from app.models import (
     Citation,
     Reference,
     Section,
 )
+from app.services.cache import LRUCache
 import pytest
 
 
@@ -91,7 +94,10 @@ class TestStructuredWikiRouter:
             ]
             return article
 
-        with patch("app.routers.structured_wiki.structured_cache", {}):
+        with patch(
+            "app.routers.structured_wiki.structured_cache",
+            LRUCache("test_structured", max_entries=8, max_bytes=1_000_000),
+        ):
             with patch(
                 "app.routers.structured_wiki.article_fetcher",
                 side_effect=mock_citations_fetcher,
@@ -354,3 +360,93 @@ class TestLongReferenceId:
         assert response.status_code == 200
         data = response.json()
         assert any(ref.get("id") == long_id for ref in data.get("references", []))
+
+
+class TestStructuredArticleStream:
+    """Tests for the NDJSON /structured-article/stream endpoint"""
+
+    URL = "/symmetry/v1/wiki/structured-article/stream"
+
+    @pytest.fixture
+    def empty_cache(self):
+        with patch(
+            "app.routers.structured_wiki.structured_cache",
+            LRUCache("test_structured", max_entries=8, max_bytes=1_000_000),
+        ) as cache:
+            yield cache
+
+    @staticmethod
+    def _events(response):
+        return [json.loads(line) for line in response.text.splitlines()]
+
+    @staticmethod
+    def _parse_response(html):
+        return {"parse": {"title": "MissingNo.", "revid": 7, "text": {"*": html}}}
+
+    def test_stream_events(self, client, empty_cache):
+        """Sections arrive one per line, followed by references and totals"""
+        html = (Path(__file__).parent / "data" / "article_sample.html").read_text(
+            encoding="utf-8"
+        )
+        with patch(
+            "app.services.article_parser._fetch_wikipedia_json",
+            new=AsyncMock(return_value=self._parse_response(html)),
+        ):
+            response = client.get(f"{self.URL}?query=MissingNo.")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        events = self._events(response)
+        assert [e["event"] for e in events] == [
+            "article",
+            "section",
+            "section",
+            "section",
+            "section",
+            "references",
+            "done",
+        ]
+        assert events[0] == {
+            "event": "article",
+            "title": "MissingNo.",
+            "lang": "en",
+            "source": "action_api",
+        }
+        assert events[1]["index"] == 0
+        assert events[1]["section"]["title"] == "Lead section"
+        assert len(events[5]["references"]) == 5
+        assert events[6]["total_sections"] == 4
+        assert events[6]["total_references"] == 5
+
+    def test_stream_fills_structured_cache(self, client, empty_cache):
+        """A finished stream is served from cache, also by /structured-article"""
+        fetch = AsyncMock(
+            return_value=self._parse_response("<p>Lead text.</p><h2>A</h2><p>Body.</p>")
+        )
+        with patch("app.services.article_parser._fetch_wikipedia_json", new=fetch):
+            first = self._events(client.get(f"{self.URL}?query=Cached&lang=fr"))
+            second = self._events(client.get(f"{self.URL}?query=Cached&lang=fr"))
+            plain = client.get(
+                "/symmetry/v1/wiki/structured-article?query=Cached&lang=fr"
+            )
+
+        assert fetch.await_count == 1
+        assert first == second
+        assert plain.json()["total_sections"] == 2
+
+    def test_stream_missing_query(self, client):
+        """Test stream without query parameter"""
+        response = client.get(self.URL)
+
+        assert response.status_code == 400
+
+    def test_stream_fetch_failure_is_http_error(self, client, empty_cache):
+        """Errors before the first section are reported with a status code"""
+        with patch(
+            "app.services.article_parser._fetch_wikipedia_json",
+            new=AsyncMock(side_effect=RuntimeError("wiki down")),
+        ):
+            response = client.get(f"{self.URL}?query=Unreachable")
+
+        assert response.status_code == 500
+        assert "wiki down" in response.json()["detail"]
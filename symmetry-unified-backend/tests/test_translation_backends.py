@@ -0,0 +1,170 @@
+"""Unit tests for translation backends and per-pair decoding settings."""
+
+from types import SimpleNamespace
+
+import pytest
+import torch
+
+from app.ai import translation as translation_module
+from app.ai import translation_backends
+from app.ai.translation import translate
+from app.ai.translation_backends import (
+    CTranslate2TranslationEngine,
+    Decoding,
+    TorchTranslationEngine,
+    TranslationEngine,
+    translation_decoding,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class TestDecoding:
+    def test_pair_entry_overrides_defaults(self, monkeypatch):
+        monkeypatch.setattr(
+            translation_backends,
+            "get_translation_model",
+            lambda s, t: {"model_name": "m", "beam_size": 1, "max_length_ratio": 1.5},
+        )
+
+        decoding = translation_decoding("en", "fr")
+
+        assert decoding == Decoding(beam_size=1, max_length_ratio=1.5)
+
+    def test_unconfigured_pair_uses_defaults(self, monkeypatch):
+        monkeypatch.setattr(
+            translation_backends, "get_translation_model", lambda s, t: None
+        )
+
+        assert translation_decoding("fr", "en") == Decoding()
+
+    def test_max_new_tokens_is_relative_and_capped(self):
+        decoding = Decoding(max_length_ratio=1.5, max_length_offset=4)
+
+        assert decoding.max_new_tokens(10) == 19
+        assert decoding.max_new_tokens(1000) == 512
+
+    def test_tag_changes_with_settings(self):
+        assert Decoding(beam_size=1).tag != Decoding(beam_size=4).tag
+
+
+class FakeTokenizer:
+    """Token ids are word positions + 1; id 0 is end of sentence."""
+
+    def __call__(self, texts, return_tensors=None, **_kwargs):
+        ids = [list(range(1, len(text.split()) + 1)) + [0] for text in texts]
+        if return_tensors == "pt":
+            width = max(map(len, ids))
+            ids = torch.tensor([row + [0] * (width - len(row)) for row in ids])
+        return {"input_ids": ids}
+
+    def convert_ids_to_tokens(self, ids):
+        return [f"t{i}" for i in ids]
+
+    def convert_tokens_to_ids(self, tokens):
+        return [int(token[1:]) for token in tokens]
+
+    def decode(self, ids, skip_special_tokens=False):
+        return " ".join(str(int(i)) for i in ids if not skip_special_tokens or i)
+
+
+def test_backend_must_implement_translate_batch():
+    class Incomplete(TranslationEngine):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete(FakeTokenizer())
+
+
+def test_torch_engine_passes_decoding_to_generate():
+    seen = {}
+
+    def generate(input_ids, **kwargs):
+        seen.update(kwargs)
+        return input_ids
+
+    engine = TorchTranslationEngine(FakeTokenizer(), SimpleNamespace(generate=generate))
+    decoding = Decoding(beam_size=1, max_length_ratio=2.0, max_length_offset=0)
+
+    assert engine.translate_batch(["a b", "c"], decoding) == ["1 2", "1"]
+    assert seen == {"num_beams": 1, "max_new_tokens": 6, "no_repeat_ngram_size": 0}
+
+
+def test_ctranslate2_engine_translates_tokens(tmp_path):
+    seen = {}
+
+    def translate_batch(tokens, **kwargs):
+        seen.update(kwargs, tokens=tokens)
+        return [SimpleNamespace(hypotheses=[list(reversed(t))]) for t in tokens]
+
+    engine = CTranslate2TranslationEngine(
+        FakeTokenizer(), SimpleNamespace(translate_batch=translate_batch), tmp_path
+    )
+    decoding = Decoding(beam_size=2, max_length_ratio=1.0, max_length_offset=1)
+
+    assert engine.translate_batch(["a b", "c"], decoding) == ["2 1", "1"]
+    assert seen["tokens"] == [["t1", "t2", "t0"], ["t1", "t0"]]
+    assert (seen["beam_size"], seen["max_decoding_length"]) == (2, 4)
+
+
+class TestBackendSelection:
+    def test_missing_ctranslate2_falls_back_to_torch(self, monkeypatch):
+        monkeypatch.setattr(translation_backends, "TRANSLATION_BACKEND", "ctranslate2")
+        monkeypatch.setattr(
+            translation_backends, "_ctranslate2_available", lambda: False
+        )
+
+        assert translation_backends.translation_backend() == "torch"
+        assert translation_backends.translation_variant() == "torch"
+
+    def test_ctranslate2_variant_names_compute_type(self, monkeypatch):
+        monkeypatch.setattr(translation_backends, "TRANSLATION_BACKEND", "ctranslate2")
+        monkeypatch.setattr(
+            translation_backends, "_ctranslate2_available", lambda: True
+        )
+
+        assert translation_backends.translation_variant() == "ctranslate2-int8"
+
+    def test_unknown_backend_is_rejected(self, monkeypatch):
+        monkeypatch.setattr(translation_backends, "TRANSLATION_BACKEND", "tpu")
+
+        with pytest.raises(ValueError, match="Unknown translation backend"):
+            translation_backends.translation_backend()
+
+    def test_converted_model_is_reused(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            translation_backends, "CTRANSLATE2_MODEL_CACHE_DIR", str(tmp_path)
+        )
+        target = tmp_path / "Helsinki-NLP--opus-mt-en-fr--int8"
+        target.mkdir()
+        (target / "model.bin").write_bytes(b"weights")
+
+        # An existing conversion is used without importing ctranslate2.
+        converted = translation_backends._converted_model("Helsinki-NLP/opus-mt-en-fr")
+
+        assert converted == target
+
+
+def test_memory_is_kept_per_decoding(monkeypatch):
+    calls = []
+
+    class FakeEngine:
+        tokenizer = FakeTokenizer()
+
+        def translate_batch(self, batch, decoding):
+            calls.append(decoding.beam_size)
+            return [f"T({item})" for item in batch]
+
+    monkeypatch.setattr(
+        translation_module, "get_translation_engine", lambda _name: FakeEngine()
+    )
+    translate("History", "en", "fr")
+    monkeypatch.setattr(
+        translation_module,
+        "translation_decoding",
+        lambda s, t: Decoding(beam_size=1),
+    )
+    translate("History", "en", "fr")
+    translate("History", "en", "fr")
+
+    assert calls == [Decoding().beam_size, 1]
@@ -1,7 +1,7 @@
 import pytest
 
 from app.ai import translation as translation_module
-from app.ai.translation import TRANSLATION_CHUNK_CHAR_THRESHOLD, translate
+from app.ai.translation import TRANSLATION_MAX_SEGMENT_TOKENS, translate
 
 
 pytestmark = pytest.mark.unit
@@ -13,19 +13,21 @@ def _stub_translation_backend(request, monkeypatch):
     if request.node.get_closest_marker("external"):
         return
 
-    original_loader = translation_module.load_translation_components
-    if hasattr(original_loader, "cache_clear"):
-        original_loader.cache_clear()
+    def _fake_tokenizer(texts: list[str], **_kwargs) -> dict:
+        # One token per word.
+        return {"input_ids": [text.split() for text in texts]}
 
-    def _fake_loader(_model_name: str):
-        return object(), object()
+    class _FakeEngine:
+        tokenizer = staticmethod(_fake_tokenizer)
 
-    def _fake_translate_batch(batch: list[str], _tokenizer, _model) -> list[str]:
-        return [f"translated::{item}" for item in batch]
+        def translate_batch(self, batch: list[str], _decoding) -> list[str]:
+            assert all(
+                len(item.split()) <= TRANSLATION_MAX_SEGMENT_TOKENS for item in batch
+            )
+            return [f"translated::{item}" for item in batch]
 
-    monkeypatch.setattr(translation_module, "load_translation_components", _fake_loader)
     monkeypatch.setattr(
-        translation_module, "_translate_batch_with_model", _fake_translate_batch
+        translation_module, "get_translation_engine", lambda _name: _FakeEngine()
     )
 
 
@@ -67,10 +69,22 @@ class TestTranslationLimits:
 
     def test_chunked_translation_path_for_long_input(self):
         long_text = "word " * 1300
-        assert len(long_text) > TRANSLATION_CHUNK_CHAR_THRESHOLD
+        assert len(long_text.split()) > TRANSLATION_MAX_SEGMENT_TOKENS
         result = translate(long_text, "en", "fr")
-        # Chunked path joins translated chunks with double newlines.
-        assert "\n\n" in result
+        # Chunked path translates every word, in several segments.
+        assert result.count("translated::") > 1
+        assert result.count("word") == 1300
+
+    def test_chunks_keep_sentences_and_paragraphs_whole(self):
+        sentence = "This sentence has exactly eight words in it."
+        paragraph = " ".join([sentence] * 100)
+        result = translate(f"{paragraph}\n\n{paragraph}", "en", "fr")
+
+        paragraphs = result.split("\n\n")
+        assert len(paragraphs) == 2
+        for translated in paragraphs:
+            for segment in translated.split("translated::")[1:]:
+                assert segment.strip().endswith("in it.")
 
     def test_consecutive_calls_are_deterministic(self):
         text = "The quick brown fox jumps over the lazy dog."
@@ -94,7 +108,7 @@ class TestTranslationLimits:
             )
 
         monkeypatch.setattr(
-            translation_module, "load_translation_components", _raise_repo_error
+            translation_module, "get_translation_engine", _raise_repo_error
         )
 
         text = "Fallback expected"
@@ -105,7 +119,7 @@ class TestTranslationLimits:
             raise RuntimeError("Connection timed out while loading tokenizer")
 
         monkeypatch.setattr(
-            translation_module, "load_translation_components", _raise_timeout
+            translation_module, "get_translation_engine", _raise_timeout
         )
 
         text = "Fallback expected on timeout"
@@ -0,0 +1,149 @@
+"""Unit tests for the persistent translation memory and translation reading it."""
+
+import pytest
+
+from app.ai import translation as translation_module
+from app.ai.translation import translate, translate_many
+from app.routers import structured_wiki
+from app.services.translation_memory import TranslationMemory, segment_key
+
+pytestmark = pytest.mark.unit
+
+
+class TestTranslationMemory:
+    def test_round_trip(self, translation_memory):
+        translation_memory.put_many("m", [("a", "Histoire"), ("b", "Références")])
+
+        assert translation_memory.get_many("m", ["a", "b", "c"]) == {
+            "a": "Histoire",
+            "b": "Références",
+        }
+
+    def test_models_do_not_share_translations(self, translation_memory):
+        translation_memory.put_many("en-fr", [("a", "Histoire")])
+
+        assert translation_memory.get_many("en-de", ["a"]) == {}
+
+    def test_counts_hits_and_misses(self, translation_memory):
+        translation_memory.put_many("m", [("a", "x")])
+        translation_memory.get_many("m", ["a", "b"])
+        translation_memory.get_many("m", ["a"])
+
+        stats = translation_memory.stats()
+
+        assert (stats.segments, stats.hits, stats.misses) == (1, 2, 1)
+        assert stats.hit_rate == pytest.approx(2 / 3, abs=1e-4)
+
+    def test_evicts_least_recently_read(self, tmp_path):
+        # Each translation is 4 bytes; room for three (eviction trims to 90%).
+        memory = TranslationMemory(path=str(tmp_path / "t.sqlite3"), max_bytes=12)
+        memory.put_many("m", [("a", "aaaa"), ("b", "bbbb"), ("c", "cccc")])
+        memory.get_many("m", ["a"])
+
+        memory.put_many("m", [("d", "dddd")])
+
+        assert set(memory.get_many("m", ["a", "b", "c", "d"])) == {"a", "d"}
+
+    def test_segment_key_is_exact(self):
+        assert segment_key("History") != segment_key("History ")
+
+
+@pytest.fixture
+def generated(monkeypatch):
+    calls = []
+    loads = []
+
+    class FakeEngine:
+        @staticmethod
+        def tokenizer(texts, **_kwargs):
+            return {"input_ids": [text.split() for text in texts]}
+
+        def translate_batch(self, batch, _decoding):
+            calls.extend(batch)
+            return [f"T({item})" for item in batch]
+
+    def fake_loader(name):
+        loads.append(name)
+        return FakeEngine()
+
+    monkeypatch.setattr(translation_module, "get_translation_engine", fake_loader)
+    return calls, loads
+
+
+class TestTranslationReadsMemory:
+    def test_recurring_texts_skip_the_model(self, generated):
+        calls, loads = generated
+        translate_many(["History", "Early life"], "en", "fr")
+        calls.clear()
+        loads.clear()
+
+        result = translate_many(["History", "Early life"], "en", "fr")
+
+        assert result == ["T(History)", "T(Early life)"]
+        assert calls == [] and loads == []
+
+    def test_only_new_sentences_are_generated(self, generated):
+        calls, _ = generated
+        translate("One two three. Four five.", "en", "fr")
+        calls.clear()
+
+        result = translate("One two three. Six seven.", "en", "fr")
+
+        assert result == "T(One two three.) T(Six seven.)"
+        assert calls == ["Six seven."]
+
+    def test_recurring_sentence_hits_inside_a_new_paragraph(self, generated):
+        calls, loads = generated
+        translate("Retrieved from Wikipedia.", "en", "fr")
+        calls.clear()
+        loads.clear()
+
+        translate("A new opening. Retrieved from Wikipedia. A new ending.", "en", "fr")
+        assert calls == ["A new opening.", "A new ending."]
+
+        calls.clear()
+        loads.clear()
+        translate("A new ending. Retrieved from Wikipedia.", "en", "fr")
+        assert calls == [] and loads == []
+
+    def test_memory_is_per_model(self, generated):
+        calls, _ = generated
+        translate("History", "en", "fr")
+        translate("History", "en", "de")
+
+        assert calls == ["History", "History"]
+
+    def test_disabled_memory_is_not_used(
+        self, generated, translation_memory, monkeypatch
+    ):
+        calls, _ = generated
+        monkeypatch.setattr(translation_module, "TRANSLATION_MEMORY_ENABLED", False)
+        translate("History", "en", "fr")
+        translate("History", "en", "fr")
+
+        assert calls == ["History", "History"]
+        assert translation_memory.stats().segments == 0
+
+
+def test_cache_stats_endpoint_reports_translation_memory(client, translation_memory):
+    translation_memory.put_many("m", [("a", "x")])
+    translation_memory.get_many("m", ["a"])
+
+    response = client.get("/symmetry/v1/wiki/cache-stats")
+
+    assert response.status_code == 200
+    assert response.json()["translation_memory"]["hits"] == 1
+
+
+def test_cache_stats_endpoint_skips_disabled_memory(client, monkeypatch):
+    monkeypatch.setattr(structured_wiki, "TRANSLATION_MEMORY_ENABLED", False)
+    monkeypatch.setattr(
+        structured_wiki,
+        "get_translation_memory",
+        lambda: pytest.fail("disabled translation memory was opened"),
+    )
+
+    response = client.get("/symmetry/v1/wiki/cache-stats")
+
+    assert response.status_code == 200
+    assert response.json()["translation_memory"] is None
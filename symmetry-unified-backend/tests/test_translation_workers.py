@@ -0,0 +1,115 @@
+"""Unit tests for the shared, bounded translation workers."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import torch
+
+from app.ai import translation as translation_module
+from app.ai.translation import translate, translate_many, warm_up_translation
+from app.services import model_manager
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def plans(monkeypatch):
+    """Record every plan the workers run instead of translating."""
+    calls = []
+    lock = threading.Lock()
+    state = {"running": 0, "max_running": 0}
+
+    def fake_translate_texts(texts, source_lang, target_lang):
+        with lock:
+            calls.append((source_lang, target_lang, list(texts)))
+            state["running"] += 1
+            state["max_running"] = max(state["max_running"], state["running"])
+        time.sleep(0.05)
+        with lock:
+            state["running"] -= 1
+        return [f"{target_lang}:{text}" for text in texts]
+
+    monkeypatch.setattr(translation_module, "_translate_texts", fake_translate_texts)
+    monkeypatch.setattr(translation_module, "_workers", {})
+    monkeypatch.setattr(translation_module, "TRANSLATION_BATCH_MAX_WAIT_MS", 200.0)
+    return calls, state
+
+
+def test_concurrent_callers_share_one_plan(plans):
+    calls, _ = plans
+    texts = [f"Paragraph {i}." for i in range(4)]
+
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(lambda text: translate(text, "de", "en"), texts))
+
+    assert results == [f"en:{text}" for text in texts]
+    assert len(calls) < len(texts)
+    assert sorted(sum((plan for _, _, plan in calls), [])) == texts
+
+
+def test_plans_of_all_pairs_share_the_generate_slots(plans, monkeypatch):
+    _, state = plans
+    monkeypatch.setattr(
+        translation_module, "_generate_slots", threading.BoundedSemaphore(1)
+    )
+
+    with ThreadPoolExecutor(3) as pool:
+        list(
+            pool.map(
+                lambda target: translate_many(["Hello.", "World."], "en", target),
+                ["fr", "de", "es"],
+            )
+        )
+
+    assert state["max_running"] == 1
+
+
+def test_merged_duplicates_are_translated_once(plans):
+    calls, _ = plans
+
+    assert translate_many(["A.", "B.", "A."], "en", "fr") == ["fr:A.", "fr:B.", "fr:A."]
+    assert calls == [("en", "fr", ["A.", "B."])]
+
+
+def test_unsupported_pair_fails_without_a_worker(plans):
+    with pytest.raises(ValueError):
+        translate("Hello", "en", "xx")
+
+    assert translation_module._workers == {}
+
+
+def test_warm_up_waits_for_a_generate_slot(monkeypatch):
+    generated = threading.Event()
+
+    class FakeEngine:
+        def translate_batch(self, batch, _decoding):
+            generated.set()
+            return batch
+
+    slots = threading.BoundedSemaphore(1)
+    monkeypatch.setattr(translation_module, "_generate_slots", slots)
+    monkeypatch.setattr(
+        translation_module, "get_translation_engine", lambda _name: FakeEngine()
+    )
+
+    with slots:
+        warm_up = threading.Thread(target=warm_up_translation, args=("en", "fr"))
+        warm_up.start()
+        assert not generated.wait(0.1)
+    warm_up.join(timeout=5)
+
+    assert generated.is_set()
+
+
+def test_torch_threads_are_configured_once(monkeypatch):
+    calls = []
+    monkeypatch.setattr(model_manager, "TORCH_NUM_THREADS", 2)
+    monkeypatch.setattr(model_manager, "_torch_threads_configured", False)
+    monkeypatch.setattr(torch, "set_num_threads", calls.append)
+
+    model_manager.configure_torch_threads()
+    model_manager.configure_torch_threads()
+
+    assert calls == [2]
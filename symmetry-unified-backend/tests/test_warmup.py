@@ -0,0 +1,98 @@
+"""Unit tests for the startup model warm-up and readiness check."""
+
+import asyncio
+
+import pytest
+
+from app.services import warmup
+from app.services.warmup import Warmup, warmup_steps
+
+pytestmark = pytest.mark.unit
+
+
+def _fail():
+    raise OSError("model not found")
+
+
+class TestWarmup:
+    def test_runs_every_step_and_reports_failures(self):
+        calls = []
+        run = Warmup(
+            [
+                ("first", lambda: calls.append("first")),
+                ("broken", _fail),
+                ("last", lambda: calls.append("last")),
+            ]
+        )
+        assert not run.ready
+        assert run.report()["status"] == "warming_up"
+
+        asyncio.run(run.run())
+
+        assert calls == ["first", "last"]
+        assert run.ready
+        report = run.report()
+        assert report["status"] == "degraded"
+        assert [s["status"] for s in report["steps"]] == ["done", "failed", "done"]
+        assert report["steps"][1]["error"] == "model not found"
+
+    def test_without_steps_is_ready_immediately(self):
+        assert Warmup([]).ready
+        assert Warmup([]).report() == {"status": "ready", "steps": []}
+
+
+class TestSteps:
+    def test_steps_cover_every_configured_model(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            warmup, "_warm_comparison", lambda name: calls.append(("st", name))
+        )
+        monkeypatch.setattr(
+            warmup, "warm_up_translation", lambda s, t: calls.append(("mt", s, t))
+        )
+        monkeypatch.setattr(warmup, "_warm_spacy", lambda lang: calls.append(lang))
+
+        steps = warmup_steps("similarity_prototype", ["en-fr", "de-en"], ["en"])
+        for _, action in steps:
+            action()
+
+        assert [name for name, _ in steps] == [
+            "comparison:sentence-transformers/LaBSE",
+            "translation:en-fr",
+            "translation:de-en",
+            "spacy:en",
+        ]
+        assert calls == [
+            ("st", "sentence-transformers/LaBSE"),
+            ("mt", "en", "fr"),
+            ("mt", "de", "en"),
+            "en",
+        ]
+
+    def test_spacy_step_runs_the_sentencizer(self):
+        warmup._warm_spacy("en")
+
+    def test_spacy_step_fails_for_unknown_language(self):
+        with pytest.raises(RuntimeError):
+            warmup._warm_spacy("xx-unknown")
+
+
+class TestReadiness:
+    def test_ready_without_warmup(self, client):
+        response = client.get("/health/ready")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"
+
+    def test_not_ready_while_warming_up(self, client):
+        state = client.app.state
+        previous = state.warmup
+        state.warmup = Warmup([("comparison:labse", lambda: None)])
+        try:
+            response = client.get("/health/ready")
+        finally:
+            state.warmup = previous
+
+        assert response.status_code == 503
+        assert response.json()["status"] == "warming_up"
+        assert client.get("/health").status_code == 200
@@ -0,0 +1,101 @@
+"""Unit tests for the shared MediaWiki HTTP pool.
+
+All tests are offline — requests are served by ``httpx.MockTransport``.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.services import wiki_http
+from app.services.wiki_http import WikiHttpPool, wiki_api_url
+
+pytestmark = pytest.mark.unit
+
+
+def _mock_pool(handler, **kwargs) -> WikiHttpPool:
+    """Build a pool whose clients are routed through *handler*."""
+    return WikiHttpPool(http2=False, transport=httpx.MockTransport(handler), **kwargs)
+
+
+class TestWikiHttpPool:
+    def test_reuses_one_client_per_host(self):
+        async def run():
+            pool = WikiHttpPool(http2=False)
+            en_a = pool.client_for("en.wikipedia.org")
+            en_b = pool.client_for("en.wikipedia.org")
+            fr = pool.client_for("fr.wikipedia.org")
+            await pool.aclose()
+            return en_a, en_b, fr
+
+        en_a, en_b, fr = asyncio.run(run())
+        assert en_a is en_b
+        assert en_a is not fr
+        assert en_a.is_closed and fr.is_closed
+
+    def test_get_json_sends_user_agent_and_params(self):
+        seen = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen["host"] = request.url.host
+            seen["ua"] = request.headers["User-Agent"]
+            seen["action"] = request.url.params["action"]
+            return httpx.Response(200, json={"ok": True})
+
+        async def run():
+            pool = _mock_pool(handler)
+            data = await pool.get_json(wiki_api_url("de"), {"action": "query"})
+            await pool.aclose()
+            return data
+
+        assert asyncio.run(run()) == {"ok": True}
+        assert seen == {
+            "host": "de.wikipedia.org",
+            "ua": wiki_http.USER_AGENT,
+            "action": "query",
+        }
+
+    def test_raises_for_http_errors(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(503)
+
+        async def run():
+            pool = _mock_pool(handler)
+            try:
+                await pool.get_json(wiki_api_url("en"), {})
+            finally:
+                await pool.aclose()
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(run())
+
+    def test_per_host_concurrency_is_capped(self):
+        state = {"active": 0, "peak": 0}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            return httpx.Response(200, json={})
+
+        async def run():
+            pool = _mock_pool(handler, per_host_concurrency=2)
+            await asyncio.gather(
+                *(pool.get_json(wiki_api_url("en"), {}) for _ in range(6))
+            )
+            await pool.aclose()
+
+        asyncio.run(run())
+        assert state["peak"] == 2
+
+    def test_survives_event_loop_change(self):
+        pool = WikiHttpPool(http2=False)
+
+        async def grab():
+            return pool.client_for("en.wikipedia.org")
+
+        first = asyncio.run(grab())
+        second = asyncio.run(grab())
+        assert first is not second